@@ -0,0 +1,57 @@
+"""add stats_hourly_rollups
+
+Revision ID: 20261019_0006
+Revises: 20260228_0005
+Create Date: 2026-10-19 09:00:00
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0006"
+down_revision: Union[str, None] = "20260228_0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stats_hourly_rollups",
+        sa.Column("bucket", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("category", sa.String(length=32), nullable=False),
+        sa.Column("jurisdiction", sa.String(length=128), nullable=False),
+        sa.Column("publisher", sa.String(length=255), nullable=False),
+        sa.Column("source_type", sa.String(length=32), nullable=False),
+        sa.Column("language", sa.String(length=16), nullable=False),
+        sa.Column("item_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("confidence_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("bucket", "category", "jurisdiction", "publisher", "source_type", "language"),
+    )
+    op.create_index("ix_stats_hourly_rollups_bucket", "stats_hourly_rollups", ["bucket"], unique=False)
+
+    op.execute(
+        """
+        INSERT INTO stats_hourly_rollups
+          (bucket, category, jurisdiction, publisher, source_type, language, item_count, confidence_sum)
+        SELECT
+          date_trunc('hour', published_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+          category::text,
+          jurisdiction,
+          publisher,
+          source_type::text,
+          language,
+          COUNT(*)::int,
+          COALESCE(SUM(confidence), 0)
+        FROM ai_developments
+        GROUP BY 1, 2, 3, 4, 5, 6;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_stats_hourly_rollups_bucket", table_name="stats_hourly_rollups")
+    op.drop_table("stats_hourly_rollups")
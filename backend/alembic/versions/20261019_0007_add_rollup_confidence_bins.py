@@ -0,0 +1,74 @@
+"""add confidence_bin to stats_hourly_rollups
+
+Revision ID: 20261019_0007
+Revises: 20261019_0006
+Create Date: 2026-10-19 12:00:00
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0007"
+down_revision: Union[str, None] = "20261019_0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLLUP_KEY = ["bucket", "category", "jurisdiction", "publisher", "source_type", "language"]
+
+
+def upgrade() -> None:
+    op.add_column(
+        "stats_hourly_rollups",
+        sa.Column("confidence_bin", sa.SmallInteger(), nullable=False, server_default="0"),
+    )
+    op.drop_constraint("stats_hourly_rollups_pkey", "stats_hourly_rollups", type_="primary")
+    op.create_primary_key("stats_hourly_rollups_pkey", "stats_hourly_rollups", [*ROLLUP_KEY, "confidence_bin"])
+
+    # 20 equal-width bins over [0, 1]; must match rollups.CONFIDENCE_BINS.
+    op.execute("DELETE FROM stats_hourly_rollups;")
+    op.execute(
+        """
+        INSERT INTO stats_hourly_rollups
+          (bucket, category, jurisdiction, publisher, source_type, language, confidence_bin, item_count, confidence_sum)
+        SELECT
+          date_trunc('hour', published_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+          category::text,
+          jurisdiction,
+          publisher,
+          source_type::text,
+          language,
+          LEAST(GREATEST(width_bucket(confidence, 0, 1, 20), 1), 20) - 1,
+          COUNT(*)::int,
+          COALESCE(SUM(confidence), 0)
+        FROM ai_developments
+        GROUP BY 1, 2, 3, 4, 5, 6, 7;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM stats_hourly_rollups;")
+    op.drop_constraint("stats_hourly_rollups_pkey", "stats_hourly_rollups", type_="primary")
+    op.drop_column("stats_hourly_rollups", "confidence_bin")
+    op.create_primary_key("stats_hourly_rollups_pkey", "stats_hourly_rollups", ROLLUP_KEY)
+    op.execute(
+        """
+        INSERT INTO stats_hourly_rollups
+          (bucket, category, jurisdiction, publisher, source_type, language, item_count, confidence_sum)
+        SELECT
+          date_trunc('hour', published_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+          category::text,
+          jurisdiction,
+          publisher,
+          source_type::text,
+          language,
+          COUNT(*)::int,
+          COALESCE(SUM(confidence), 0)
+        FROM ai_developments
+        GROUP BY 1, 2, 3, 4, 5, 6;
+        """
+    )
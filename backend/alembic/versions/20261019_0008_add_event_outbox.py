@@ -0,0 +1,55 @@
+"""add event_outbox with insert notify trigger
+
+Revision ID: 20261019_0008
+Revises: 20261019_0007
+Create Date: 2026-10-19 13:00:00
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0008"
+down_revision: Union[str, None] = "20261019_0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_outbox",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("channel", sa.String(length=128), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # One NOTIFY per inserting statement wakes the relay; Postgres delivers it on commit only.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_event_outbox() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('event_outbox', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER event_outbox_notify
+        AFTER INSERT ON event_outbox
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_event_outbox();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS event_outbox_notify ON event_outbox;")
+    op.execute("DROP FUNCTION IF EXISTS notify_event_outbox();")
+    op.drop_table("event_outbox")
@@ -0,0 +1,28 @@
+"""add adaptive schedule columns to source_states
+
+Revision ID: 20261019_0009
+Revises: 20261019_0008
+Create Date: 2026-10-19 14:00:00
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0009"
+down_revision: Union[str, None] = "20261019_0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("source_states", sa.Column("interval_minutes", sa.Integer(), nullable=True))
+    op.add_column("source_states", sa.Column("yield_per_hour", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("source_states", "yield_per_hour")
+    op.drop_column("source_states", "interval_minutes")
@@ -0,0 +1,36 @@
+"""widen source_states validators to hold per-URL maps
+
+Revision ID: 20261019_0010
+Revises: 20261019_0009
+Create Date: 2026-10-19 15:00:00
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0010"
+down_revision: Union[str, None] = "20261019_0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column("source_states", "etag", existing_type=sa.String(length=512), type_=sa.Text(), existing_nullable=True)
+    op.alter_column(
+        "source_states",
+        "last_modified",
+        existing_type=sa.String(length=128),
+        type_=sa.Text(),
+        existing_nullable=True,
+    )
+
+
+def downgrade() -> None:
+    # Validator maps do not fit the old widths; dropping them only costs one unconditional fetch.
+    op.execute("UPDATE source_states SET etag = NULL, last_modified = NULL;")
+    op.alter_column("source_states", "last_modified", existing_type=sa.Text(), type_=sa.String(length=128), existing_nullable=True)
+    op.alter_column("source_states", "etag", existing_type=sa.Text(), type_=sa.String(length=512), existing_nullable=True)
@@ -0,0 +1,64 @@
+"""add backfill_jobs and backfill_months checkpoints
+
+Revision ID: 20261019_0011
+Revises: 20261019_0010
+Create Date: 2026-10-19 18:00:00
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0011"
+down_revision: Union[str, None] = "20261019_0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "backfill_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False, server_default="queued"),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=False),
+        sa.Column("per_page", sa.Integer(), nullable=False),
+        sa.Column("max_pages_per_month", sa.Integer(), nullable=True),
+        sa.Column("scanned", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("inserted", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("dedupe_suppressed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error", sa.Text(), nullable=False, server_default=""),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_backfill_jobs_status", "backfill_jobs", ["status"], unique=False)
+    op.create_index("ix_backfill_jobs_created_at", "backfill_jobs", ["created_at"], unique=False)
+
+    op.create_table(
+        "backfill_months",
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("month_end", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False, server_default="pending"),
+        sa.Column("cursor", sa.Text(), nullable=True),
+        sa.Column("pages", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("scanned", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("inserted", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.ForeignKeyConstraint(["job_id"], ["backfill_jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("job_id", "month"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("backfill_months")
+    op.drop_index("ix_backfill_jobs_created_at", table_name="backfill_jobs")
+    op.drop_index("ix_backfill_jobs_status", table_name="backfill_jobs")
+    op.drop_table("backfill_jobs")
@@ -1,44 +1,82 @@
-import json
-from datetime import UTC, datetime
+import uuid
+from datetime import UTC, date, datetime
 
-import redis.asyncio as redis
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.core.config import settings
+from backend.app.db.session import get_db
+from backend.app.models.backfill_job import BackfillJob, BackfillMonth
+from backend.app.services.backfill_jobs import create_job, job_payload, load_job
 from workers.app.celery_app import celery_app
 
 router = APIRouter(prefix="/backfill")
 
 
 class BackfillRunRequest(BaseModel):
-    start_date: str = Field(default="2022-11-01")
-    end_date: str | None = Field(default=None)
-    per_page: int = Field(default=50, ge=10, le=200)
-    max_pages_per_month: int = Field(default=3, ge=1, le=10)
+    start_date: date = Field(default=date(2022, 11, 1))
+    end_date: date | None = Field(default=None)
+    per_page: int = Field(default=200, ge=10, le=200)
+    # Omit to read every page of each month.
+    max_pages_per_month: int | None = Field(default=None, ge=1)
+    # Set to resume an existing job from its month checkpoints; the other fields are ignored.
+    job_id: uuid.UUID | None = Field(default=None)
 
 
 @router.post("/run")
-async def run_backfill(payload: BackfillRunRequest) -> dict[str, str]:
-    task = celery_app.send_task(
-        "workers.app.tasks.backfill_openalex_history",
-        kwargs={
-            "start_date": payload.start_date,
-            "end_date": payload.end_date,
-            "per_page": payload.per_page,
-            "max_pages_per_month": payload.max_pages_per_month,
-        },
-    )
-    return {"status": "queued", "task_id": task.id}
+async def run_backfill(payload: BackfillRunRequest, db: AsyncSession = Depends(get_db)) -> dict[str, str]:
+    if payload.job_id is not None:
+        job = await db.get(BackfillJob, payload.job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Backfill job not found")
+        if job.status == "completed":
+            raise HTTPException(status_code=409, detail="Backfill job already completed")
+    else:
+        end_date = payload.end_date or datetime.now(UTC).date()
+        if end_date < payload.start_date:
+            raise HTTPException(status_code=422, detail="end_date is before start_date")
+        job = await create_job(
+            db,
+            start_date=payload.start_date,
+            end_date=end_date,
+            per_page=payload.per_page,
+            max_pages_per_month=payload.max_pages_per_month,
+        )
+        await db.commit()
+
+    task = celery_app.send_task("workers.app.tasks.backfill_openalex_history", kwargs={"job_id": str(job.id)})
+    return {"status": "queued", "task_id": task.id, "job_id": str(job.id)}
+
+
+@router.get("/jobs")
+async def list_backfill_jobs(
+    limit: int = Query(default=20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, object]:
+    jobs = (await db.execute(select(BackfillJob).order_by(BackfillJob.created_at.desc()).limit(limit))).scalars().all()
+    months_by_job: dict[uuid.UUID, list[BackfillMonth]] = {job.id: [] for job in jobs}
+    if jobs:
+        months = await db.execute(select(BackfillMonth).where(BackfillMonth.job_id.in_(list(months_by_job))))
+        for month in months.scalars():
+            months_by_job[month.job_id].append(month)
+    return {"jobs": [job_payload(job, months_by_job[job.id]) for job in jobs]}
+
+
+@router.get("/jobs/{job_id}")
+async def get_backfill_job(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)) -> dict[str, object]:
+    loaded = await load_job(db, job_id)
+    if loaded is None:
+        raise HTTPException(status_code=404, detail="Backfill job not found")
+    job, months = loaded
+    return job_payload(job, months, include_months=True)
 
 
 @router.get("/status")
-async def backfill_status() -> dict[str, object]:
-    client = redis.from_url(settings.redis_url, decode_responses=True)
-    try:
-        raw = await client.get("backfill:status")
-        if not raw:
-            return {"state": "idle", "checked_at": datetime.now(UTC).isoformat()}
-        return json.loads(raw)
-    finally:
-        await client.close()
+async def backfill_status(db: AsyncSession = Depends(get_db)) -> dict[str, object]:
+    """The most recently created job, in the payload shape of ``/jobs``."""
+    latest = (await db.execute(select(BackfillJob.id).order_by(BackfillJob.created_at.desc()).limit(1))).scalar()
+    loaded = await load_job(db, latest) if latest is not None else None
+    if loaded is None:
+        return {"state": "idle", "checked_at": datetime.now(UTC).isoformat()}
+    return job_payload(*loaded)
@@ -46,26 +46,38 @@ async def get_feed(
     )
 
 
+def _sse_frame(payload: object) -> str:
+    """``new_item`` for plain item payloads; typed envelopes are sent under their own event name."""
+    if isinstance(payload, str):
+        try:
+            decoded = json.loads(payload)
+        except ValueError:
+            return f"event: new_item\ndata: {payload}\n\n"
+    else:
+        decoded = payload
+    if isinstance(decoded, dict) and set(decoded) == {"event", "data"}:
+        return f"event: {decoded['event']}\ndata: {json.dumps(decoded['data'])}\n\n"
+    data = payload if isinstance(payload, str) else json.dumps(payload)
+    return f"event: new_item\ndata: {data}\n\n"
+
+
 async def _stream_events() -> AsyncGenerator[str, None]:
+    # Live items, plus the typed rollups_invalidated events historical inserts send instead.
+    channels = (settings.sse_channel, settings.rollup_channel)
     client = redis.from_url(settings.redis_url, decode_responses=True)
     pubsub = client.pubsub()
-    await pubsub.subscribe(settings.sse_channel)
+    await pubsub.subscribe(*channels)
 
     try:
         while True:
             message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=10.0)
             if message and message.get("type") == "message":
-                payload = message.get("data")
-                if isinstance(payload, dict):
-                    data = json.dumps(payload)
-                else:
-                    data = str(payload)
-                yield f"event: new_item\ndata: {data}\n\n"
+                yield _sse_frame(message.get("data"))
             else:
                 yield "event: ping\ndata: {}\n\n"
             await asyncio.sleep(0.05)
     finally:
-        await pubsub.unsubscribe(settings.sse_channel)
+        await pubsub.unsubscribe(*channels)
         await pubsub.close()
         await client.close()
 
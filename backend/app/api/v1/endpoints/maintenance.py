@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.db.session import get_db
 from backend.app.models.ai_development import AIDevelopment
+from backend.app.services.rollups import apply_rollup_deltas, rebuild_rollups
 
 router = APIRouter(prefix="/maintenance")
 
@@ -20,9 +21,23 @@ async def purge_synthetic(
     before_count = int((await db.execute(select(func.count()).where(synthetic_filter))).scalar_one())
     deleted = 0
     if execute and before_count > 0:
-        result = await db.execute(delete(AIDevelopment).where(synthetic_filter))
+        result = await db.execute(
+            delete(AIDevelopment)
+            .where(synthetic_filter)
+            .returning(
+                AIDevelopment.published_at,
+                AIDevelopment.category,
+                AIDevelopment.jurisdiction,
+                AIDevelopment.publisher,
+                AIDevelopment.source_type,
+                AIDevelopment.language,
+                AIDevelopment.confidence,
+            )
+        )
+        deleted_rows = result.mappings().all()
+        await apply_rollup_deltas(db, deleted_rows, sign=-1)
         await db.commit()
-        deleted = int(result.rowcount or 0)
+        deleted = len(deleted_rows)
 
     after_count = int((await db.execute(select(func.count()).where(synthetic_filter))).scalar_one())
     return {
@@ -32,3 +47,13 @@ async def purge_synthetic(
         "synthetic_after": after_count,
         "checked_at": datetime.now(UTC).isoformat(),
     }
+
+
+@router.post("/rebuild-rollups")
+async def rebuild_stats_rollups(db: AsyncSession = Depends(get_db)) -> dict[str, object]:
+    rows = await rebuild_rollups(db)
+    await db.commit()
+    return {
+        "rollup_rows": rows,
+        "checked_at": datetime.now(UTC).isoformat(),
+    }
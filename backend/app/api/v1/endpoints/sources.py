@@ -27,22 +27,27 @@ def _parse_window(value: str) -> timedelta:
 async def sources_health(db: AsyncSession = Depends(get_db)) -> dict[str, object]:
     now = datetime.now(UTC)
 
-    redis_payload: dict[str, object] = {}
+    redis_meta: dict[str, str] = {}
+    redis_sources: dict[str, dict[str, object]] = {}
     client = redis.from_url(settings.redis_url, decode_responses=True)
     try:
-        raw = await client.get("source_health:latest")
-        if raw:
-            redis_payload = json.loads(raw)
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hgetall("source_health:sources")
+            pipe.hgetall("source_health:meta")
+            raw_sources, redis_meta = await pipe.execute()
+        for source_key, raw in raw_sources.items():
+            try:
+                entry = json.loads(raw)
+            except ValueError:
+                continue
+            if isinstance(entry, dict):
+                redis_sources[source_key] = entry
     except Exception:
-        redis_payload = {}
+        redis_meta = {}
+        redis_sources = {}
     finally:
         await client.close()
 
-    redis_sources: dict[str, dict[str, object]] = {}
-    for entry in redis_payload.get("sources", []):
-        if isinstance(entry, dict) and entry.get("source"):
-            redis_sources[str(entry["source"])] = entry
-
     states = (await db.execute(select(SourceIngestState))).scalars().all()
     states_by_key = {state.source_key: state for state in states}
 
@@ -63,6 +68,8 @@ async def sources_health(db: AsyncSession = Depends(get_db)) -> dict[str, object
             row["last_error_at"] = state.last_error_at.isoformat() if state.last_error_at else None
             row["next_run_at"] = state.next_run_at.isoformat() if state.next_run_at else None
             row["consecutive_failures"] = int(state.consecutive_failures)
+            row["interval_minutes"] = state.interval_minutes or source.cadence_minutes
+            row["yield_per_hour"] = round(state.yield_per_hour, 3) if state.yield_per_hour is not None else None
             if state.last_success_at:
                 row["freshness_lag_minutes"] = max(0, int((now - state.last_success_at).total_seconds() // 60))
             else:
@@ -72,6 +79,8 @@ async def sources_health(db: AsyncSession = Depends(get_db)) -> dict[str, object
             row.setdefault("last_error_at", None)
             row.setdefault("next_run_at", None)
             row.setdefault("consecutive_failures", 0)
+            row["interval_minutes"] = source.cadence_minutes
+            row["yield_per_hour"] = None
             row.setdefault("freshness_lag_minutes", None)
 
         if "status" not in row:
@@ -99,11 +108,11 @@ async def sources_health(db: AsyncSession = Depends(get_db)) -> dict[str, object
 
     return {
         "updated_at": now.isoformat(),
-        "run_status": str(redis_payload.get("run_status", "ok")),
+        "run_status": str(redis_meta.get("run_status", "ok")),
         "sources": health_rows,
         "inserted_total": sum(int(row.get("inserted", 0)) for row in health_rows),
         "candidates_total": sum(int(row.get("accepted", 0)) for row in health_rows),
-        "skipped_lock_count": int(redis_payload.get("skipped_lock_count", 0)),
+        "skipped_lock_count": int(redis_meta.get("skipped_lock_count", 0)),
     }
 
 
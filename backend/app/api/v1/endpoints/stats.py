@@ -1,8 +1,19 @@
-from fastapi import APIRouter, Depends, Query
+from datetime import UTC, datetime
+
+import redis.asyncio as redis
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.core.config import settings
 from backend.app.db.session import get_db
-from backend.app.schemas.ai_development import EChartsTimeseriesResponse, KPIsResponse, StatsAlertsResponse
+from backend.app.schemas.ai_development import (
+    EChartsTimeseriesResponse,
+    KPIsResponse,
+    StatsAlertsResponse,
+    StatsSeriesAlertItem,
+)
+from backend.app.services.alerts_engine import fetch_series_alerts
+from backend.app.services.feed import parse_time_window
 from backend.app.services.stats import (
     fetch_entities_breakdown,
     fetch_alerts,
@@ -23,9 +34,12 @@ from backend.app.services.stats import (
     fetch_tags_breakdown,
     fetch_weekly_timeseries,
 )
+from backend.app.services.stats_query import StatsQuery, run_stats_query
 
 router = APIRouter(prefix="/stats")
 
+DIMENSION_PATTERN = "(category|publisher|jurisdiction|language|source_type)"
+
 
 @router.get("/kpis", response_model=KPIsResponse)
 async def get_kpis(db: AsyncSession = Depends(get_db)) -> KPIsResponse:
@@ -97,26 +111,41 @@ async def get_scope_compare(
 @router.get("/confidence")
 async def get_confidence_profile(
     time_window: str = Query("7d", pattern="^(1h|24h|7d|30d|90d|1y|2y|5y)$"),
+    bins: int = Query(10, ge=1, le=100),
+    split_by: str | None = Query(None, pattern="^(source_type|publisher)$"),
+    source: str = Query("auto", pattern="^(auto|rollup|raw)$"),
     db: AsyncSession = Depends(get_db),
 ) -> dict[str, object]:
-    return await fetch_confidence_profile(db, time_window=time_window)
+    try:
+        return await fetch_confidence_profile(
+            db,
+            time_window=time_window,
+            bins=bins,
+            split_by=split_by,
+            source=source,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
 
 
 @router.get("/concentration")
 async def get_concentration(
     time_window: str = Query("7d", pattern="^(1h|24h|7d|30d|90d|1y|2y|5y)$"),
+    source: str = Query("auto", pattern="^(auto|rollup|raw)$"),
     db: AsyncSession = Depends(get_db),
 ) -> dict[str, object]:
-    return await fetch_concentration(db, time_window=time_window)
+    return await fetch_concentration(db, time_window=time_window, source=source)
 
 
 @router.get("/momentum")
 async def get_momentum(
     time_window: str = Query("24h", pattern="^(1h|24h|7d|30d|90d|1y|2y|5y)$"),
     limit: int = Query(8, ge=1, le=20),
+    dimensions: str = Query("category,publisher", pattern=f"^{DIMENSION_PATTERN}(,{DIMENSION_PATTERN})*$"),
     db: AsyncSession = Depends(get_db),
 ) -> dict[str, object]:
-    return await fetch_momentum(db, time_window=time_window, limit=limit)
+    selected = list(dict.fromkeys(dimensions.split(",")))
+    return await fetch_momentum(db, time_window=time_window, limit=limit, dimensions=selected)
 
 
 @router.get("/risk-index")
@@ -161,18 +190,70 @@ async def get_coverage(
     return await fetch_coverage(db, time_window=time_window, limit=limit)
 
 
+@router.get("/query")
+async def get_stats_query(
+    group_by: str = Query("category", pattern=f"^({DIMENSION_PATTERN}(,{DIMENSION_PATTERN})*)?$"),
+    bucket: str | None = Query(default=None, pattern="^(hour|day|week|month)$"),
+    time_window: str = Query("7d", pattern="^(1h|24h|7d|30d|90d|1y|2y|5y)$"),
+    category: str | None = Query(default=None),
+    jurisdiction: str | None = Query(default=None),
+    publisher: str | None = Query(default=None),
+    source_type: str | None = Query(default=None),
+    language: str | None = Query(default=None),
+    limit: int = Query(50, ge=1, le=200),
+    source: str = Query("auto", pattern="^(auto|rollup|raw)$"),
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, object]:
+    filters = {
+        "category": category,
+        "jurisdiction": jurisdiction,
+        "publisher": publisher,
+        "source_type": source_type,
+        "language": language,
+    }
+    query = StatsQuery(
+        group_by=tuple(name for name in group_by.split(",") if name),
+        time_window=time_window,
+        bucket=bucket,
+        filters={name: value for name, value in filters.items() if value},
+        limit=limit,
+        source=source,
+    )
+    try:
+        return await run_stats_query(db, query)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
 @router.get("/alerts", response_model=StatsAlertsResponse)
 async def get_alerts(
     time_window: str = Query("24h", pattern="^(1h|24h|7d|30d|90d|1y|2y|5y)$"),
     min_baseline: int = Query(3, ge=1, le=100),
     min_delta_percent: float = Query(35.0, ge=1.0, le=500.0),
     min_z_score: float = Query(1.2, ge=0.5, le=10.0),
+    series_limit: int = Query(50, ge=0, le=500),
     db: AsyncSession = Depends(get_db),
 ) -> StatsAlertsResponse:
-    return await fetch_alerts(
+    response = await fetch_alerts(
         db,
         time_window=time_window,
         min_baseline=min_baseline,
         min_delta_percent=min_delta_percent,
         min_z_score=min_z_score,
     )
+    if series_limit <= 0:
+        return response
+
+    client = redis.from_url(settings.redis_url, decode_responses=True)
+    try:
+        series_alerts = await fetch_series_alerts(
+            client,
+            since=datetime.now(UTC) - parse_time_window(time_window),
+            limit=series_limit,
+        )
+        response.series_alerts = [StatsSeriesAlertItem(**alert) for alert in series_alerts]
+    except Exception:
+        response.series_alerts = []
+    finally:
+        await client.close()
+    return response
@@ -7,7 +7,18 @@ class Settings(BaseSettings):
     database_url: str = "postgresql+asyncpg://ai_pulse:ai_pulse@db:5432/ai_pulse"
     redis_url: str = "redis://redis:6379/0"
     sse_channel: str = "ai_developments:new"
+    # Items published longer ago than this skip the live stream and only invalidate rollups.
+    sse_freshness_hours: int = 72
+    rollup_channel: str = "ai_developments:rollups"
     enable_synthetic_fallback: bool = False
+    ingest_fetch_concurrency: int = 8
+    ingest_host_concurrency: int = 2
+    ingest_write_concurrency: int = 4
+    backfill_month_concurrency: int = 4
+    # Processes for normalizing large API pages; 0 normalizes inline on the event loop. Only
+    # non-daemonic workers (the solo backfill worker) can start them; prefork children stay inline.
+    normalize_processes: int = 0
+    openalex_mailto: str = ""
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,4 +1,7 @@
 from backend.app.models.ai_development import AIDevelopment
+from backend.app.models.backfill_job import BackfillJob, BackfillMonth
+from backend.app.models.event_outbox import EventOutbox
 from backend.app.models.source_tracking import SourceIngestRun, SourceIngestState
+from backend.app.models.stats_rollup import StatsHourlyRollup
 
-__all__ = ["AIDevelopment", "SourceIngestState", "SourceIngestRun"]
+__all__ = ["AIDevelopment", "SourceIngestState", "SourceIngestRun", "StatsHourlyRollup", "EventOutbox", "BackfillJob", "BackfillMonth"]
@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Integer, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base import Base
+
+
+class StatsHourlyRollup(Base):
+    __tablename__ = "stats_hourly_rollups"
+
+    bucket: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    category: Mapped[str] = mapped_column(String(32), primary_key=True)
+    jurisdiction: Mapped[str] = mapped_column(String(128), primary_key=True)
+    publisher: Mapped[str] = mapped_column(String(255), primary_key=True)
+    source_type: Mapped[str] = mapped_column(String(32), primary_key=True)
+    language: Mapped[str] = mapped_column(String(16), primary_key=True)
+    confidence_bin: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=0)
+    item_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    confidence_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
@@ -71,6 +71,20 @@ class StatsAlertItem(BaseModel):
     trigger_reason: str | None = None
 
 
+class StatsSeriesAlertItem(BaseModel):
+    series: str
+    dimension: str
+    name: str
+    direction: str
+    severity: str
+    bucket: datetime
+    current: int
+    baseline_mean: float
+    baseline_stddev: float
+    z_score: float
+    flagged_at: datetime
+
+
 class StatsAlertsResponse(BaseModel):
     generated_at: datetime
     time_window: str
@@ -79,3 +93,4 @@ class StatsAlertsResponse(BaseModel):
     min_z_score: float
     lookback_windows: int
     alerts: list[StatsAlertItem]
+    series_alerts: list[StatsSeriesAlertItem] = Field(default_factory=list)
@@ -0,0 +1,308 @@
+import json
+import logging
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from math import sqrt
+
+import redis.asyncio as redis
+
+from backend.app.core.config import settings
+from backend.app.services.rollups import enum_name
+
+logger = logging.getLogger(__name__)
+
+ALERT_STATE_KEY = "alerts:series_state"
+ALERT_ACTIVE_KEY = "alerts:active"
+# Series -> the epoch hour its state is open at, so the idle sweep reads only lagging series.
+ALERT_HOURS_KEY = "alerts:series_hours"
+ALERT_SERIES_DIMENSIONS = ("category", "publisher", "jurisdiction", "entity")
+EWMA_ALPHA = 0.1
+MIN_HISTORY_HOURS = 12
+MAX_GAP_HOURS = 168
+ALERT_Z_SCORE = 3.0
+ALERT_MIN_COUNT = 3
+ALERT_RETENTION = timedelta(days=7)
+ALERT_UPDATE_RETRIES = 5
+
+# Per-series compare-and-set: a field is written only if it still holds the state the
+# update was computed from. Returns the fields that changed underneath, to recompute.
+# ARGV: series count, then per series: field, expected state ('' if new), new state,
+# open hour, alert JSON ('' for none).
+SERIES_UPDATE_LUA = """
+local conflicts = {}
+for i = 0, tonumber(ARGV[1]) - 1 do
+    local base = 2 + i * 5
+    local field = ARGV[base]
+    local current = redis.call('HGET', KEYS[1], field) or ''
+    if current == ARGV[base + 1] then
+        redis.call('HSET', KEYS[1], field, ARGV[base + 2])
+        redis.call('ZADD', KEYS[3], ARGV[base + 3], field)
+        if ARGV[base + 4] ~= '' then
+            redis.call('HSET', KEYS[2], field, ARGV[base + 4])
+        end
+    else
+        conflicts[#conflicts + 1] = field
+    end
+end
+return conflicts
+"""
+
+
+@dataclass(slots=True)
+class SeriesState:
+    hour: int
+    count: int = 0
+    mean: float = 0.0
+    var: float = 0.0
+    samples: int = 0
+
+    def encode(self) -> str:
+        return f"{self.hour}|{self.count}|{self.mean:.6g}|{self.var:.6g}|{self.samples}"
+
+    @classmethod
+    def decode(cls, raw: str) -> "SeriesState":
+        hour, count, mean, var, samples = raw.split("|")
+        return cls(hour=int(hour), count=int(count), mean=float(mean), var=float(var), samples=int(samples))
+
+
+def _epoch_hour(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return int(value.timestamp() // 3600)
+
+
+def _hour_start(hour: int) -> datetime:
+    return datetime.fromtimestamp(hour * 3600, tz=UTC)
+
+
+def series_keys(item: Mapping[str, object]) -> list[str]:
+    keys = [
+        f"{dimension}:{enum_name(item[dimension])}"
+        for dimension in ("category", "publisher", "jurisdiction")
+        if item.get(dimension)
+    ]
+    keys.extend(f"entity:{entity}" for entity in sorted({str(e) for e in item.get("entities") or []}) if entity)
+    return keys
+
+
+def series_increments(items: Iterable[Mapping[str, object]]) -> dict[str, dict[int, int]]:
+    """Per-series item counts keyed by epoch hour."""
+    increments: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+    for item in items:
+        hour = _epoch_hour(item["published_at"])
+        for key in series_keys(item):
+            increments[key][hour] += 1
+    return increments
+
+
+def _fold(state: SeriesState, value: float) -> None:
+    if state.samples == 0:
+        state.mean = value
+        state.samples = 1
+        return
+    diff = value - state.mean
+    increment = EWMA_ALPHA * diff
+    state.mean += increment
+    state.var = (1 - EWMA_ALPHA) * (state.var + diff * increment)
+    state.samples += 1
+
+
+def _score(state: SeriesState, value: int) -> tuple[float, float]:
+    # Poisson-style floor so flat or sparse series don't produce huge z-scores.
+    stddev = max(sqrt(max(state.var, 0.0)), sqrt(max(state.mean, 1.0)))
+    return (value - state.mean) / stddev, stddev
+
+
+def _alert(key: str, state: SeriesState, hour: int, value: int, direction: str, now: datetime) -> dict[str, object]:
+    z_score, stddev = _score(state, value)
+    dimension, _, name = key.partition(":")
+    return {
+        "series": key,
+        "dimension": dimension,
+        "name": name,
+        "direction": direction,
+        "severity": "high" if abs(z_score) >= ALERT_Z_SCORE * 2 else "medium",
+        "bucket": _hour_start(hour).isoformat(),
+        "current": value,
+        "baseline_mean": round(state.mean, 2),
+        "baseline_stddev": round(stddev, 2),
+        "z_score": round(z_score, 2),
+        "flagged_at": now.isoformat(),
+    }
+
+
+def _close_hour(
+    key: str,
+    state: SeriesState,
+    hour: int,
+    value: int,
+    recent_hour: int,
+    now: datetime,
+    alerts: list[dict[str, object]],
+) -> None:
+    if state.samples >= MIN_HISTORY_HOURS and state.mean >= ALERT_MIN_COUNT and hour >= recent_hour:
+        if _score(state, value)[0] <= -ALERT_Z_SCORE:
+            alerts.append(_alert(key, state, hour, value, "down", now))
+    _fold(state, value)
+
+
+def advance_series(
+    key: str,
+    state: SeriesState | None,
+    hour: int,
+    count: int,
+    *,
+    now: datetime,
+) -> tuple[SeriesState, list[dict[str, object]]]:
+    """Fold ``count`` new items at ``hour`` into a series' EWMA state.
+
+    Work is constant per update: closing an hour folds its count plus at most
+    ``MAX_GAP_HOURS`` empty hours into the baseline. Items for hours older than
+    the open one are counted in the open hour, as arrivals, rather than
+    rewriting history; items older than ``sse_freshness_hours`` are history
+    (backfills, late-indexed papers) and are not counted at all.
+    """
+    if state is None:
+        return SeriesState(hour=hour, count=count), []
+    if hour < state.hour:
+        if hour < _epoch_hour(now) - settings.sse_freshness_hours:
+            return state, []
+        hour = state.hour
+
+    alerts: list[dict[str, object]] = []
+    recent_hour = _epoch_hour(now) - 1
+    if hour > state.hour:
+        _close_hour(key, state, state.hour, state.count, recent_hour, now, alerts)
+        empty_hours = min(hour - state.hour - 1, MAX_GAP_HOURS)
+        for _ in range(empty_hours - 1):
+            _fold(state, 0)
+        if empty_hours > 0:
+            # Only the hour just before ``hour`` can be recent enough to alert on.
+            _close_hour(key, state, hour - 1, 0, recent_hour, now, alerts)
+        state.hour = hour
+        state.count = 0
+
+    state.count += count
+    if state.samples >= MIN_HISTORY_HOURS and state.count >= ALERT_MIN_COUNT and hour >= recent_hour:
+        if _score(state, state.count)[0] >= ALERT_Z_SCORE:
+            alerts.append(_alert(key, state, hour, state.count, "up", now))
+    return state, alerts
+
+
+SeriesUpdate = Callable[[str, SeriesState | None], tuple[SeriesState | None, list[dict[str, object]]]]
+
+
+async def _store_series_updates(
+    client: redis.Redis,
+    fields: list[str],
+    update: SeriesUpdate,
+) -> list[dict[str, object]]:
+    """Apply ``update`` to each series in ``fields`` and store the results atomically per series.
+
+    State lives in one Redis hash, one compact field per series. Each attempt
+    is one read and one script call; a series changed by a concurrent writer
+    is recomputed from its new state, so writers only collide on the same
+    series, never on the hash as a whole.
+    """
+    script = client.register_script(SERIES_UPDATE_LUA)
+    alerts: dict[str, dict[str, object]] = {}
+    pending = fields
+    for _ in range(ALERT_UPDATE_RETRIES):
+        raw_states = await client.hmget(ALERT_STATE_KEY, pending)
+        args: list[object] = []
+        flagged: dict[str, dict[str, object]] = {}
+        for key, raw in zip(pending, raw_states):
+            state, key_alerts = update(key, SeriesState.decode(raw) if raw else None)
+            if state is None:
+                continue
+            if key_alerts:
+                flagged[key] = key_alerts[-1]
+            alert = json.dumps(flagged[key]) if key in flagged else ""
+            args.extend([key, raw or "", state.encode(), state.hour, alert])
+        if not args:
+            return list(alerts.values())
+        conflicts = set(
+            await script(keys=[ALERT_STATE_KEY, ALERT_ACTIVE_KEY, ALERT_HOURS_KEY], args=[len(args) // 5, *args])
+        )
+        alerts.update((key, alert) for key, alert in flagged.items() if key not in conflicts)
+        pending = [key for key in pending if key in conflicts]
+        if not pending:
+            break
+    if pending:
+        logger.warning("Dropped alert series updates after %d attempts: %s", ALERT_UPDATE_RETRIES, ", ".join(pending))
+    return list(alerts.values())
+
+
+async def record_series_updates(
+    client: redis.Redis,
+    items: Iterable[Mapping[str, object]],
+    *,
+    now: datetime | None = None,
+) -> list[dict[str, object]]:
+    """Advance every series touched by ``items`` and store any flagged alerts."""
+    increments = series_increments(items)
+    if not increments:
+        return []
+    now = now or datetime.now(UTC)
+
+    def update(key: str, state: SeriesState | None) -> tuple[SeriesState | None, list[dict[str, object]]]:
+        alerts: list[dict[str, object]] = []
+        for hour in sorted(increments[key]):
+            state, flagged = advance_series(key, state, hour, increments[key][hour], now=now)
+            alerts.extend(flagged)
+        return state, alerts
+
+    return await _store_series_updates(client, sorted(increments), update)
+
+
+async def close_idle_series(client: redis.Redis, *, now: datetime | None = None) -> list[dict[str, object]]:
+    """Advance every series that has had no items this hour to the current hour.
+
+    Series only move when items arrive, so one that goes silent would never
+    fold its empty hours or raise a drop alert. Run on a timer, this closes
+    them with zero counts. Only series whose open hour (``ALERT_HOURS_KEY``)
+    is behind the current one are read.
+    """
+    now = now or datetime.now(UTC)
+    current_hour = _epoch_hour(now)
+    idle = await client.zrangebyscore(ALERT_HOURS_KEY, "-inf", f"({current_hour}")
+    if not idle:
+        return []
+
+    def update(key: str, state: SeriesState | None) -> tuple[SeriesState | None, list[dict[str, object]]]:
+        if state is None or state.hour >= current_hour:
+            return None, []
+        return advance_series(key, state, current_hour, 0, now=now)
+
+    return await _store_series_updates(client, sorted(idle), update)
+
+
+async def fetch_series_alerts(
+    client: redis.Redis,
+    *,
+    since: datetime,
+    limit: int = 50,
+) -> list[dict[str, object]]:
+    """Active series alerts whose bucket falls at or after ``since``, strongest first."""
+    raw_alerts = await client.hgetall(ALERT_ACTIVE_KEY)
+    cutoff = datetime.now(UTC) - ALERT_RETENTION
+    alerts: list[dict[str, object]] = []
+    expired: list[str] = []
+    for key, raw in raw_alerts.items():
+        try:
+            alert = json.loads(raw)
+            bucket = datetime.fromisoformat(str(alert["bucket"]))
+        except (ValueError, KeyError, TypeError):
+            expired.append(key)
+            continue
+        if bucket < cutoff:
+            expired.append(key)
+        elif bucket >= since - timedelta(hours=1):
+            alerts.append(alert)
+
+    if expired:
+        await client.hdel(ALERT_ACTIVE_KEY, *expired)
+    alerts.sort(key=lambda alert: abs(float(alert.get("z_score") or 0.0)), reverse=True)
+    return alerts[:limit]
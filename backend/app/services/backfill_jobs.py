@@ -0,0 +1,130 @@
+import uuid
+from datetime import UTC, date, datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models.backfill_job import BackfillJob, BackfillMonth
+
+# OpenAlex's cursor for the first page; a NULL cursor means the month is exhausted.
+FIRST_PAGE_CURSOR = "*"
+
+
+def month_windows(start: date, end: date) -> list[tuple[date, date]]:
+    windows: list[tuple[date, date]] = []
+    current = date(start.year, start.month, 1)
+    while current <= end:
+        if current.month == 12:
+            next_month = date(current.year + 1, 1, 1)
+        else:
+            next_month = date(current.year, current.month + 1, 1)
+        month_end = min(end, date(next_month.year, next_month.month, 1))
+        windows.append((current, month_end))
+        current = next_month
+    return windows
+
+
+async def create_job(
+    session: AsyncSession,
+    *,
+    start_date: date,
+    end_date: date,
+    per_page: int,
+    max_pages_per_month: int | None,
+) -> BackfillJob:
+    job = BackfillJob(
+        status="queued",
+        start_date=start_date,
+        end_date=end_date,
+        per_page=per_page,
+        max_pages_per_month=max_pages_per_month,
+        scanned=0,
+        inserted=0,
+        dedupe_suppressed=0,
+        error="",
+    )
+    session.add(job)
+    await session.flush()
+    return job
+
+
+async def ensure_months(session: AsyncSession, job: BackfillJob) -> list[BackfillMonth]:
+    """Checkpoint rows for every month of ``job``, creating the ones not seen yet."""
+    existing = {
+        month.month: month
+        for month in (
+            await session.execute(select(BackfillMonth).where(BackfillMonth.job_id == job.id))
+        ).scalars()
+    }
+    for month_start, month_end in month_windows(job.start_date, job.end_date):
+        if month_start not in existing:
+            existing[month_start] = BackfillMonth(
+                job_id=job.id,
+                month=month_start,
+                month_end=month_end,
+                status="pending",
+                cursor=FIRST_PAGE_CURSOR,
+                pages=0,
+                scanned=0,
+                inserted=0,
+                updated_at=datetime.now(UTC),
+            )
+            session.add(existing[month_start])
+    await session.flush()
+    return [existing[key] for key in sorted(existing)]
+
+
+async def load_job(session: AsyncSession, job_id: uuid.UUID) -> tuple[BackfillJob, list[BackfillMonth]] | None:
+    job = await session.get(BackfillJob, job_id)
+    if job is None:
+        return None
+    months = (
+        await session.execute(
+            select(BackfillMonth).where(BackfillMonth.job_id == job_id).order_by(BackfillMonth.month)
+        )
+    ).scalars().all()
+    return job, list(months)
+
+
+def _iso(value: date | datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def job_payload(job: BackfillJob, months: list[BackfillMonth], *, include_months: bool = False) -> dict[str, object]:
+    """The job in the shape ``/backfill/status`` has always returned, plus its id."""
+    completed = [month for month in months if month.status == "completed"]
+    touched = [month for month in months if month.pages > 0 or month.status == "completed"]
+    payload: dict[str, object] = {
+        "job_id": str(job.id),
+        "state": job.status,
+        "created_at": _iso(job.created_at),
+        "started_at": _iso(job.started_at),
+        "start_date": job.start_date.isoformat(),
+        "end_date": job.end_date.isoformat(),
+        "per_page": job.per_page,
+        "max_pages_per_month": job.max_pages_per_month,
+        "current_month": _iso(max(month.month for month in touched)) if touched else None,
+        "months_total": len(months) or len(month_windows(job.start_date, job.end_date)),
+        "months_completed": len(completed),
+        "scanned": job.scanned,
+        "inserted": job.inserted,
+        "dedupe_suppressed": job.dedupe_suppressed,
+        "error": job.error or None,
+    }
+    if job.status == "failed":
+        payload["failed_at"] = _iso(job.finished_at)
+    elif job.finished_at is not None:
+        payload["finished_at"] = _iso(job.finished_at)
+    if include_months:
+        payload["months"] = [
+            {
+                "month": month.month.isoformat(),
+                "status": month.status,
+                "pages": month.pages,
+                "scanned": month.scanned,
+                "inserted": month.inserted,
+                "updated_at": _iso(month.updated_at),
+            }
+            for month in months
+        ]
+    return payload
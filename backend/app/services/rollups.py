@@ -0,0 +1,110 @@
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models.stats_rollup import StatsHourlyRollup
+
+ROLLUP_DIMENSIONS = ("category", "jurisdiction", "publisher", "source_type", "language")
+ROLLUP_KEY = ("bucket", *ROLLUP_DIMENSIONS, "confidence_bin")
+ROLLUP_UPSERT_CHUNK = 1000
+CONFIDENCE_BINS = 20
+
+
+def enum_name(value: object) -> str:
+    """The stored string for an enum member (or any other dimension value)."""
+    if hasattr(value, "value"):
+        return str(getattr(value, "value"))
+    return str(value)
+
+
+def rollup_bucket(published_at: datetime) -> datetime:
+    if published_at.tzinfo is None:
+        published_at = published_at.replace(tzinfo=UTC)
+    return published_at.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def confidence_bin(confidence: object) -> int:
+    """Zero-based index of ``confidence`` in ``CONFIDENCE_BINS`` equal-width bins over [0, 1]."""
+    value = float(confidence or 0.0)
+    return min(max(int(value * CONFIDENCE_BINS), 0), CONFIDENCE_BINS - 1)
+
+
+def rollup_deltas(rows: Iterable[Mapping[str, object]], *, sign: int = 1) -> list[dict[str, object]]:
+    """Collapse item rows into one (bucket, dimensions, confidence bin) delta per rollup key."""
+    totals: dict[tuple[object, ...], list[float]] = defaultdict(lambda: [0, 0.0])
+    for row in rows:
+        key = (
+            rollup_bucket(row["published_at"]),
+            *(enum_name(row[name]) for name in ROLLUP_DIMENSIONS),
+            confidence_bin(row.get("confidence")),
+        )
+        totals[key][0] += sign
+        totals[key][1] += sign * float(row.get("confidence") or 0.0)
+
+    return [
+        {
+            **dict(zip(ROLLUP_KEY, key)),
+            "item_count": int(count),
+            "confidence_sum": float(confidence_sum),
+        }
+        for key, (count, confidence_sum) in totals.items()
+    ]
+
+
+async def apply_rollup_deltas(
+    session: AsyncSession,
+    rows: Iterable[Mapping[str, object]],
+    *,
+    sign: int = 1,
+) -> int:
+    """Add (or with ``sign=-1`` subtract) item rows to the hourly rollups.
+
+    Runs inside the caller's transaction so the rollups commit atomically with
+    the rows they describe.
+    """
+    deltas = rollup_deltas(rows, sign=sign)
+    for offset in range(0, len(deltas), ROLLUP_UPSERT_CHUNK):
+        stmt = insert(StatsHourlyRollup).values(deltas[offset : offset + ROLLUP_UPSERT_CHUNK])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(ROLLUP_KEY),
+            set_={
+                "item_count": StatsHourlyRollup.item_count + stmt.excluded.item_count,
+                "confidence_sum": StatsHourlyRollup.confidence_sum + stmt.excluded.confidence_sum,
+            },
+        )
+        await session.execute(stmt)
+
+    if sign < 0 and deltas:
+        await session.execute(delete(StatsHourlyRollup).where(StatsHourlyRollup.item_count <= 0))
+    return len(deltas)
+
+
+async def rebuild_rollups(session: AsyncSession) -> int:
+    """Recompute every rollup row from ``ai_developments``."""
+    await session.execute(delete(StatsHourlyRollup))
+    result = await session.execute(
+        text(
+            """
+            INSERT INTO stats_hourly_rollups
+              (bucket, category, jurisdiction, publisher, source_type, language, confidence_bin, item_count, confidence_sum)
+            SELECT
+              date_trunc('hour', published_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+              category::text,
+              jurisdiction,
+              publisher,
+              source_type::text,
+              language,
+              LEAST(GREATEST(width_bucket(confidence, 0, 1, :bins), 1), :bins) - 1,
+              COUNT(*)::int,
+              COALESCE(SUM(confidence), 0)
+            FROM ai_developments
+            GROUP BY 1, 2, 3, 4, 5, 6, 7
+            """
+        ),
+        {"bins": CONFIDENCE_BINS},
+    )
+    return int(result.rowcount or 0)
@@ -2,10 +2,12 @@ from collections import defaultdict
 from datetime import UTC, datetime, timedelta
 from math import sqrt
 
-from sqlalchemy import and_, func, select, text
+from sqlalchemy import String, and_, case, cast, func, literal, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from backend.app.models.ai_development import AIDevelopment, CategoryType
+from backend.app.models.stats_rollup import StatsHourlyRollup
 from backend.app.schemas.ai_development import (
     EChartsSeries,
     EChartsTimeseriesResponse,
@@ -15,6 +17,8 @@ from backend.app.schemas.ai_development import (
     StatsAlertsResponse,
 )
 from backend.app.services.feed import parse_time_window
+from backend.app.services.rollups import CONFIDENCE_BINS, enum_name, rollup_bucket
+from backend.app.services.stats_query import resolve_query_source
 
 
 def _calc_delta(current: int, previous: int) -> float:
@@ -23,12 +27,6 @@ def _calc_delta(current: int, previous: int) -> float:
     return round(((current - previous) / previous) * 100.0, 2)
 
 
-def _enum_name(value: object) -> str:
-    if hasattr(value, "value"):
-        return str(getattr(value, "value"))
-    return str(value)
-
-
 async def _count_between(db: AsyncSession, start: datetime, end: datetime) -> int:
     stmt = select(func.count(AIDevelopment.id)).where(
         and_(AIDevelopment.published_at >= start, AIDevelopment.published_at < end)
@@ -36,14 +34,62 @@ async def _count_between(db: AsyncSession, start: datetime, end: datetime) -> in
     return int((await db.execute(stmt)).scalar_one())
 
 
-async def _category_counts_between(db: AsyncSession, start: datetime, end: datetime) -> dict[str, int]:
-    stmt = (
-        select(AIDevelopment.category, func.count(AIDevelopment.id))
-        .where(and_(AIDevelopment.published_at >= start, AIDevelopment.published_at < end))
-        .group_by(AIDevelopment.category)
+STATS_DIMENSIONS: dict[str, InstrumentedAttribute] = {
+    "category": AIDevelopment.category,
+    "publisher": AIDevelopment.publisher,
+    "jurisdiction": AIDevelopment.jurisdiction,
+    "language": AIDevelopment.language,
+    "source_type": AIDevelopment.source_type,
+}
+DIMENSION_PLURALS = {
+    "category": "categories",
+    "publisher": "publishers",
+    "jurisdiction": "jurisdictions",
+    "language": "languages",
+    "source_type": "source_types",
+}
+
+
+async def fetch_windowed_counts(
+    db: AsyncSession,
+    *,
+    dimensions: list[str],
+    windows: list[tuple[datetime, datetime]],
+) -> dict[str, dict[str, list[int]]]:
+    """Count rows per (dimension, value, window_index) in one scan.
+
+    Every window becomes a ``COUNT(*) FILTER (WHERE ...)`` column, so a value
+    that only appears in one window still gets a real zero for the others
+    instead of dropping out of an independently limited query. Several
+    dimensions share the scan through ``GROUPING SETS``.
+    """
+    columns = [STATS_DIMENSIONS[name] for name in dimensions]
+    window_counts = [
+        func.count(AIDevelopment.id).filter(
+            and_(AIDevelopment.published_at >= start, AIDevelopment.published_at < end)
+        )
+        for start, end in windows
+    ]
+    earliest = min(start for start, _ in windows)
+    latest = max(end for _, end in windows)
+
+    stmt = select(*columns, *window_counts).where(
+        and_(AIDevelopment.published_at >= earliest, AIDevelopment.published_at < latest)
     )
-    rows = (await db.execute(stmt)).all()
-    return {_enum_name(category): int(count) for category, count in rows}
+    if len(columns) == 1:
+        stmt = stmt.group_by(columns[0])
+    else:
+        stmt = stmt.group_by(func.grouping_sets(*columns))
+
+    result: dict[str, dict[str, list[int]]] = {name: {} for name in dimensions}
+    for row in (await db.execute(stmt)).all():
+        values, counts = row[: len(columns)], row[len(columns) :]
+        for name, value in zip(dimensions, values):
+            # Dimension columns are NOT NULL, so NULL marks the grouping sets a row is not part of.
+            if value is None:
+                continue
+            result[name][enum_name(value)] = [int(count) for count in counts]
+    return result
 
 
 def _mean(values: list[int]) -> float:
@@ -211,7 +257,7 @@ async def fetch_sources_breakdown(db: AsyncSession, *, time_window: str = "7d",
         "time_window": time_window,
         "total": total,
         "publishers": [{"name": str(name), "count": int(count)} for name, count in publishers_rows],
-        "source_types": [{"name": _enum_name(name), "count": int(count)} for name, count in types_rows],
+        "source_types": [{"name": enum_name(name), "count": int(count)} for name, count in types_rows],
     }
 
 
@@ -354,7 +400,7 @@ async def fetch_brief_snapshot(db: AsyncSession, *, time_window: str = "24h") ->
         "total_items": total,
         "high_alert_count": len([a for a in alerts.alerts if a.severity == "high"]),
         "top_category": {
-            "name": _enum_name(category_row[0]) if category_row else "",
+            "name": enum_name(category_row[0]) if category_row else "",
             "count": int(category_row[1]) if category_row else 0,
         },
         "top_jurisdiction": {
@@ -398,7 +444,7 @@ async def fetch_scope_compare(db: AsyncSession, *, time_window: str = "7d") -> d
 
     by_category: dict[str, dict[str, int]] = defaultdict(lambda: {"canada": 0, "global": 0})
     for category, jurisdiction, count in category_rows:
-        key = _enum_name(category)
+        key = enum_name(category)
         jurisdiction_key = str(jurisdiction).lower()
         if jurisdiction_key == "canada":
             by_category[key]["canada"] += int(count)
@@ -424,63 +470,240 @@ async def fetch_scope_compare(db: AsyncSession, *, time_window: str = "7d") -> d
     }
 
 
-async def fetch_confidence_profile(db: AsyncSession, *, time_window: str = "7d") -> dict[str, object]:
-    now = datetime.now(UTC)
-    since = now - parse_time_window(time_window)
-    total_stmt = select(func.count(AIDevelopment.id)).where(AIDevelopment.published_at >= since)
-    avg_stmt = select(func.avg(AIDevelopment.confidence)).where(AIDevelopment.published_at >= since)
-    total = int((await db.execute(total_stmt)).scalar_one())
-    avg_conf = float((await db.execute(avg_stmt)).scalar_one() or 0.0)
+CONFIDENCE_LEVELS = (("very_high", 0.85), ("high", 0.70), ("medium", 0.50), ("low", 0.0))
+CONFIDENCE_PERCENTILES = (0.1, 0.5, 0.9)
+CONFIDENCE_SPLITS = ("source_type", "publisher")
+CONFIDENCE_SPLIT_LIMIT = 20
+MAX_CONFIDENCE_BINS = 100
+
+
+def _histogram_percentiles(counts: list[int], percentiles: tuple[float, ...]) -> list[float]:
+    """Approximate percentiles from equal-width bins over [0, 1] by interpolating inside the bin."""
+    total = sum(counts)
+    if total <= 0:
+        return [0.0 for _ in percentiles]
+    width = 1.0 / len(counts)
+    values: list[float] = []
+    for q in percentiles:
+        target = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if count and seen + count >= target:
+                values.append(width * (index + (target - seen) / count))
+                break
+            seen += count
+        else:
+            values.append(1.0)
+    return values
+
+
+def _confidence_histogram(counts: list[int], total: int) -> list[dict[str, object]]:
+    width = 1.0 / len(counts)
+    return [
+        {
+            "lower": round(index * width, 4),
+            "upper": round((index + 1) * width, 4),
+            "count": count,
+            "percent": round((count / max(1, total)) * 100.0, 2),
+        }
+        for index, count in enumerate(counts)
+    ]
 
+
+def _confidence_summary(
+    counts: list[int],
+    confidence_sum: float,
+    percentiles: list[float],
+) -> dict[str, object]:
+    total = sum(counts)
+    return {
+        "total": total,
+        "average_confidence": round(confidence_sum / total, 4) if total else 0.0,
+        "percentiles": {f"p{round(q * 100)}": round(value, 4) for q, value in zip(CONFIDENCE_PERCENTILES, percentiles)},
+        "histogram": _confidence_histogram(counts, total),
+    }
+
+
+async def _raw_confidence_profile(
+    db: AsyncSession,
+    *,
+    since: datetime,
+    now: datetime,
+    bins: int,
+    split_by: str | None,
+) -> tuple[dict[str | None, dict[str, object]], dict[str, int]]:
+    # One scan: GROUPING SETS produce the overall and per-split rows, each
+    # with its percentiles, alongside the per-bin counts that feed histograms.
+    split_expr = f"{split_by}::text" if split_by else "NULL::text"
+    grouping_sets = "((), (bin), (grp), (grp, bin))" if split_by else "((), (bin))"
+    grp_rolled = "GROUPING(grp)" if split_by else "1"
+    level_filters: list[str] = []
+    upper: float | None = None
+    for name, threshold in CONFIDENCE_LEVELS:
+        conditions = [f"confidence >= {threshold}"] if threshold > 0 else []
+        if upper is not None:
+            conditions.append(f"confidence < {upper}")
+        level_filters.append(f"COUNT(*) FILTER (WHERE {' AND '.join(conditions)})::int AS {name}")
+        upper = threshold
+    level_counts = ",\n                  ".join(level_filters)
     rows = (
         await db.execute(
             text(
-                """
+                f"""
+                WITH scored AS (
+                  SELECT
+                    {split_expr} AS grp,
+                    confidence,
+                    LEAST(GREATEST(width_bucket(confidence, 0, 1, :bins), 1), :bins) - 1 AS bin
+                  FROM ai_developments
+                  WHERE published_at >= :since AND published_at < :now
+                )
                 SELECT
-                  CASE
-                    WHEN confidence >= 0.85 THEN 'very_high'
-                    WHEN confidence >= 0.70 THEN 'high'
-                    WHEN confidence >= 0.50 THEN 'medium'
-                    ELSE 'low'
-                  END AS bucket,
-                  COUNT(*)::int AS count
-                FROM ai_developments
-                WHERE published_at >= :since
-                GROUP BY bucket
+                  grp,
+                  bin,
+                  {grp_rolled} AS grp_rolled,
+                  GROUPING(bin) AS bin_rolled,
+                  COUNT(*)::int AS count,
+                  COALESCE(SUM(confidence), 0) AS confidence_sum,
+                  percentile_cont(ARRAY[{", ".join(str(q) for q in CONFIDENCE_PERCENTILES)}])
+                    WITHIN GROUP (ORDER BY confidence) AS percentiles,
+                  {level_counts}
+                FROM scored
+                GROUP BY GROUPING SETS {grouping_sets}
                 """
             ),
-            {"since": since},
+            {"since": since, "now": now, "bins": bins},
         )
-    ).all()
+    ).mappings().all()
+
+    histograms: dict[str | None, list[int]] = defaultdict(lambda: [0] * bins)
+    sums: dict[str | None, float] = defaultdict(float)
+    percentiles: dict[str | None, list[float]] = {}
+    levels = {name: 0 for name, _ in CONFIDENCE_LEVELS}
+    for row in rows:
+        key = None if row["grp_rolled"] else str(row["grp"])
+        if row["bin_rolled"]:
+            sums[key] = float(row["confidence_sum"] or 0.0)
+            percentiles[key] = [float(value or 0.0) for value in (row["percentiles"] or [0.0] * len(CONFIDENCE_PERCENTILES))]
+            if key is None:
+                levels = {name: int(row[name] or 0) for name, _ in CONFIDENCE_LEVELS}
+        else:
+            histograms[key][int(row["bin"])] = int(row["count"] or 0)
 
-    counts = {"very_high": 0, "high": 0, "medium": 0, "low": 0}
-    for bucket, count in rows:
-        counts[str(bucket)] = int(count)
+    summaries = {
+        key: _confidence_summary(
+            histograms[key],
+            sums[key],
+            percentiles.get(key, [0.0] * len(CONFIDENCE_PERCENTILES)),
+        )
+        for key in {None, *histograms}
+    }
+    return summaries, levels
 
-    def pct(value: int) -> float:
-        return round((value / max(1, total)) * 100.0, 2)
+
+async def _rollup_confidence_profile(
+    db: AsyncSession,
+    *,
+    since: datetime,
+    now: datetime,
+    bins: int,
+    split_by: str | None,
+) -> tuple[dict[str | None, dict[str, object]], dict[str, int]]:
+    split_column = getattr(StatsHourlyRollup, split_by) if split_by else None
+    stmt = (
+        select(
+            *([split_column.label("grp")] if split_column is not None else []),
+            StatsHourlyRollup.confidence_bin,
+            func.sum(StatsHourlyRollup.item_count).label("count"),
+            func.sum(StatsHourlyRollup.confidence_sum).label("confidence_sum"),
+        )
+        .where(and_(StatsHourlyRollup.bucket >= since, StatsHourlyRollup.bucket < now))
+        .group_by(*([split_column] if split_column is not None else []), StatsHourlyRollup.confidence_bin)
+    )
+    rows = (await db.execute(stmt)).mappings().all()
+
+    fine: dict[str | None, list[int]] = defaultdict(lambda: [0] * CONFIDENCE_BINS)
+    sums: dict[str | None, float] = defaultdict(float)
+    for row in rows:
+        keys = [None] if split_column is None else [None, str(row["grp"])]
+        for key in keys:
+            fine[key][int(row["confidence_bin"])] += int(row["count"] or 0)
+            sums[key] += float(row["confidence_sum"] or 0.0)
+
+    per_bin = CONFIDENCE_BINS // bins
+    summaries: dict[str | None, dict[str, object]] = {}
+    for key in {None, *fine}:
+        counts = fine[key]
+        coarse = [sum(counts[index : index + per_bin]) for index in range(0, CONFIDENCE_BINS, per_bin)]
+        summaries[key] = _confidence_summary(
+            coarse,
+            sums[key],
+            _histogram_percentiles(counts, CONFIDENCE_PERCENTILES),
+        )
+
+    levels = {name: 0 for name, _ in CONFIDENCE_LEVELS}
+    for index, count in enumerate(fine[None]):
+        lower = index / CONFIDENCE_BINS
+        name = next(name for name, threshold in CONFIDENCE_LEVELS if lower >= threshold - 1e-9)
+        levels[name] += count
+    return summaries, levels
+
+
+async def fetch_confidence_profile(
+    db: AsyncSession,
+    *,
+    time_window: str = "7d",
+    bins: int = 10,
+    split_by: str | None = None,
+    source: str = "auto",
+) -> dict[str, object]:
+    """Confidence histogram, percentiles and level buckets in one query.
+
+    Windows of 24h or more are served from the pre-binned rollups when ``bins``
+    divides ``CONFIDENCE_BINS``; rollup percentiles are interpolated within
+    bins and so are approximate.
+    """
+    if not 1 <= bins <= MAX_CONFIDENCE_BINS:
+        raise ValueError(f"bins must be between 1 and {MAX_CONFIDENCE_BINS}")
+    if split_by is not None and split_by not in CONFIDENCE_SPLITS:
+        raise ValueError(f"split_by must be one of: {', '.join(CONFIDENCE_SPLITS)}")
+    resolved = resolve_query_source(source, time_window)
+    if resolved == "rollup" and CONFIDENCE_BINS % bins:
+        if source == "rollup":
+            raise ValueError(f"rollup-served profiles need bins dividing {CONFIDENCE_BINS}")
+        resolved = "raw"
+    source = resolved
+
+    now = datetime.now(UTC)
+    since = now - parse_time_window(time_window)
+    if source == "rollup":
+        since = rollup_bucket(since)
+        summaries, levels = await _rollup_confidence_profile(db, since=since, now=now, bins=bins, split_by=split_by)
+    else:
+        summaries, levels = await _raw_confidence_profile(db, since=since, now=now, bins=bins, split_by=split_by)
+
+    overall = summaries[None]
+    total = int(overall["total"])
+    groups = sorted(
+        ({"name": key, **summary} for key, summary in summaries.items() if key is not None),
+        key=lambda item: (-int(item["total"]), str(item["name"])),
+    )[:CONFIDENCE_SPLIT_LIMIT]
 
     return {
         "generated_at": now.isoformat(),
         "time_window": time_window,
-        "total": total,
-        "average_confidence": round(avg_conf, 4),
+        "source": source,
+        "bins": bins,
+        **overall,
         "buckets": [
-            {"name": "very_high", "count": counts["very_high"], "percent": pct(counts["very_high"])},
-            {"name": "high", "count": counts["high"], "percent": pct(counts["high"])},
-            {"name": "medium", "count": counts["medium"], "percent": pct(counts["medium"])},
-            {"name": "low", "count": counts["low"], "percent": pct(counts["low"])},
+            {"name": name, "count": levels[name], "percent": round((levels[name] / max(1, total)) * 100.0, 2)}
+            for name, _ in CONFIDENCE_LEVELS
         ],
+        "split_by": split_by,
+        "groups": groups,
     }
 
 
-def _hhi(values: list[int]) -> float:
-    total = sum(values)
-    if total <= 0:
-        return 0.0
-    return round(sum(((v / total) ** 2) for v in values), 4)
-
-
 def _concentration_label(hhi: float) -> str:
     if hhi >= 0.4:
         return "high"
@@ -489,51 +712,99 @@ def _concentration_label(hhi: float) -> str:
     return "low"
 
 
-async def fetch_concentration(db: AsyncSession, *, time_window: str = "7d") -> dict[str, object]:
-    now = datetime.now(UTC)
-    since = now - parse_time_window(time_window)
-    total_stmt = select(func.count(AIDevelopment.id)).where(AIDevelopment.published_at >= since)
-    total = int((await db.execute(total_stmt)).scalar_one())
+async def fetch_dimension_hhi(
+    db: AsyncSession,
+    *,
+    dimensions: list[str],
+    since: datetime,
+    now: datetime,
+    source: str = "raw",
+    top: int = 3,
+) -> dict[str, dict[str, object]]:
+    """Exact HHI (sum of squared shares) over each dimension's full distribution.
+
+    One statement: ``GROUPING SETS`` count every dimension in a single scan of
+    ``ai_developments`` or the hourly rollups, and window aggregates partitioned
+    by dimension reduce those counts to totals, sums of squares, group counts
+    and the top values, so only ``top`` rows per dimension leave the database.
+    """
+    if source == "rollup":
+        table_columns = {name: getattr(StatsHourlyRollup, name) for name in dimensions}
+        count_expr = func.sum(StatsHourlyRollup.item_count)
+        clauses = [StatsHourlyRollup.bucket >= since, StatsHourlyRollup.bucket < now]
+    else:
+        table_columns = {name: STATS_DIMENSIONS[name] for name in dimensions}
+        count_expr = func.count(AIDevelopment.id)
+        clauses = [AIDevelopment.published_at >= since, AIDevelopment.published_at < now]
+
+    columns = list(table_columns.values())
+    if len(columns) == 1:
+        dimension_expr = literal(dimensions[0])
+        value_expr = cast(columns[0], String)
+        grouping = columns[0]
+    else:
+        # Dimension columns are NOT NULL, so the non-NULL column names a row's grouping set.
+        dimension_expr = case(*[(column.is_not(None), literal(name)) for name, column in table_columns.items()])
+        value_expr = func.coalesce(*[cast(column, String) for column in columns])
+        grouping = func.grouping_sets(*columns)
+    grouped = (
+        select(dimension_expr.label("dimension"), value_expr.label("name"), count_expr.label("count"))
+        .where(and_(*clauses))
+        .group_by(grouping)
+        .subquery("grouped")
+    )
+
+    by_dimension = {"partition_by": grouped.c.dimension}
+    total_expr = func.sum(grouped.c.count).over(**by_dimension)
+    ranked = select(
+        grouped.c.dimension,
+        grouped.c.name,
+        grouped.c.count,
+        total_expr.label("total"),
+        func.sum(grouped.c.count * grouped.c.count).over(**by_dimension).label("sum_squares"),
+        func.count().over(**by_dimension).label("groups"),
+        func.row_number()
+        .over(partition_by=grouped.c.dimension, order_by=(grouped.c.count.desc(), grouped.c.name))
+        .label("rank"),
+    ).subquery("ranked")
+    stmt = select(ranked).where(ranked.c.rank <= top).order_by(ranked.c.dimension, ranked.c.rank)
+
+    result: dict[str, dict[str, object]] = {
+        name: {"hhi": 0.0, "level": "low", "total": 0, "groups": 0, "top": []} for name in dimensions
+    }
+    for row in (await db.execute(stmt)).mappings().all():
+        entry = result[str(row["dimension"])]
+        total = int(row["total"] or 0)
+        hhi = round(int(row["sum_squares"] or 0) / (total * total), 4) if total else 0.0
+        entry.update(hhi=hhi, level=_concentration_label(hhi), total=total, groups=int(row["groups"]))
+        entry["top"].append({"name": str(row["name"]), "count": int(row["count"])})
+    return result
 
-    sources_rows = (
-        await db.execute(
-            select(AIDevelopment.publisher, func.count(AIDevelopment.id).label("count"))
-            .where(AIDevelopment.published_at >= since)
-            .group_by(AIDevelopment.publisher)
-            .order_by(text("count DESC"))
-            .limit(8)
-        )
-    ).all()
-    jurisdictions_rows = (
-        await db.execute(
-            select(AIDevelopment.jurisdiction, func.count(AIDevelopment.id).label("count"))
-            .where(AIDevelopment.published_at >= since)
-            .group_by(AIDevelopment.jurisdiction)
-            .order_by(text("count DESC"))
-            .limit(8)
-        )
-    ).all()
-    categories_rows = (
-        await db.execute(
-            select(AIDevelopment.category, func.count(AIDevelopment.id).label("count"))
-            .where(AIDevelopment.published_at >= since)
-            .group_by(AIDevelopment.category)
-            .order_by(text("count DESC"))
-        )
-    ).all()
 
-    source_values = [int(row[1]) for row in sources_rows]
-    jurisdiction_values = [int(row[1]) for row in jurisdictions_rows]
-    category_values = [int(row[1]) for row in categories_rows]
-    source_hhi = _hhi(source_values)
-    jurisdiction_hhi = _hhi(jurisdiction_values)
-    category_hhi = _hhi(category_values)
+async def fetch_concentration(db: AsyncSession, *, time_window: str = "7d", source: str = "auto") -> dict[str, object]:
+    now = datetime.now(UTC)
+    since = now - parse_time_window(time_window)
+    source = resolve_query_source(source, time_window)
+    if source == "rollup":
+        since = rollup_bucket(since)
+
+    dimensions = await fetch_dimension_hhi(
+        db,
+        dimensions=list(STATS_DIMENSIONS),
+        since=since,
+        now=now,
+        source=source,
+    )
+    source_hhi = float(dimensions["publisher"]["hhi"])
+    jurisdiction_hhi = float(dimensions["jurisdiction"]["hhi"])
+    category_hhi = float(dimensions["category"]["hhi"])
     combined = round((source_hhi + jurisdiction_hhi + category_hhi) / 3.0, 4)
 
     return {
         "generated_at": now.isoformat(),
         "time_window": time_window,
-        "total": total,
+        "source": source,
+        "total": int(dimensions["category"]["total"]),
         "source_hhi": source_hhi,
         "source_level": _concentration_label(source_hhi),
         "jurisdiction_hhi": jurisdiction_hhi,
@@ -542,115 +813,65 @@ async def fetch_concentration(db: AsyncSession, *, time_window: str = "7d") -> d
         "category_level": _concentration_label(category_hhi),
         "combined_hhi": combined,
         "combined_level": _concentration_label(combined),
-        "top_sources": [{"name": str(name), "count": int(count)} for name, count in sources_rows[:3]],
-        "top_jurisdictions": [{"name": str(name), "count": int(count)} for name, count in jurisdictions_rows[:3]],
+        "top_sources": dimensions["publisher"]["top"],
+        "top_jurisdictions": dimensions["jurisdiction"]["top"],
+        "dimensions": dimensions,
     }
 
 
-async def fetch_momentum(db: AsyncSession, *, time_window: str = "24h", limit: int = 8) -> dict[str, object]:
+async def fetch_momentum(
+    db: AsyncSession,
+    *,
+    time_window: str = "24h",
+    limit: int = 8,
+    dimensions: list[str] | None = None,
+) -> dict[str, object]:
     now = datetime.now(UTC)
     window = parse_time_window(time_window)
     current_start = now - window
     previous_start = now - (window * 2)
+    selected = dimensions or ["category", "publisher"]
+    bounded = max(1, min(limit, 20))
 
-    def _delta(current: int, previous: int) -> float:
-        if previous == 0:
-            return 100.0 if current > 0 else 0.0
-        return round(((current - previous) / previous) * 100.0, 2)
-
-    category_current_rows = (
-        await db.execute(
-            select(AIDevelopment.category, func.count(AIDevelopment.id).label("count"))
-            .where(and_(AIDevelopment.published_at >= current_start, AIDevelopment.published_at < now))
-            .group_by(AIDevelopment.category)
-        )
-    ).all()
-    category_previous_rows = (
-        await db.execute(
-            select(AIDevelopment.category, func.count(AIDevelopment.id).label("count"))
-            .where(and_(AIDevelopment.published_at >= previous_start, AIDevelopment.published_at < current_start))
-            .group_by(AIDevelopment.category)
-        )
-    ).all()
-    publisher_current_rows = (
-        await db.execute(
-            select(AIDevelopment.publisher, func.count(AIDevelopment.id).label("count"))
-            .where(and_(AIDevelopment.published_at >= current_start, AIDevelopment.published_at < now))
-            .group_by(AIDevelopment.publisher)
-            .order_by(text("count DESC"))
-            .limit(40)
-        )
-    ).all()
-    publisher_previous_rows = (
-        await db.execute(
-            select(AIDevelopment.publisher, func.count(AIDevelopment.id).label("count"))
-            .where(and_(AIDevelopment.published_at >= previous_start, AIDevelopment.published_at < current_start))
-            .group_by(AIDevelopment.publisher)
-            .order_by(text("count DESC"))
-            .limit(40)
-        )
-    ).all()
-
-    category_current = {_enum_name(name): int(count) for name, count in category_current_rows}
-    category_previous = {_enum_name(name): int(count) for name, count in category_previous_rows}
-    publisher_current = {str(name): int(count) for name, count in publisher_current_rows}
-    publisher_previous = {str(name): int(count) for name, count in publisher_previous_rows}
-
-    category_items: list[dict[str, object]] = []
-    for name in sorted(set(category_current.keys()) | set(category_previous.keys())):
-        current = category_current.get(name, 0)
-        previous = category_previous.get(name, 0)
-        change = current - previous
-        category_items.append(
-            {
-                "name": name,
-                "current": current,
-                "previous": previous,
-                "change": change,
-                "delta_percent": _delta(current, previous),
-            }
-        )
-    category_items.sort(key=lambda item: abs(int(item["change"])), reverse=True)
-
-    publisher_items: list[dict[str, object]] = []
-    for name in sorted(set(publisher_current.keys()) | set(publisher_previous.keys())):
-        current = publisher_current.get(name, 0)
-        previous = publisher_previous.get(name, 0)
-        change = current - previous
-        if current == 0 and previous == 0:
-            continue
-        publisher_items.append(
-            {
-                "name": name,
-                "current": current,
-                "previous": previous,
-                "change": change,
-                "delta_percent": _delta(current, previous),
-            }
-        )
-    publisher_items.sort(key=lambda item: abs(int(item["change"])), reverse=True)
+    counts = await fetch_windowed_counts(
+        db,
+        dimensions=selected,
+        windows=[(previous_start, current_start), (current_start, now)],
+    )
 
-    return {
+    payload: dict[str, object] = {
         "generated_at": now.isoformat(),
         "time_window": time_window,
-        "categories": category_items[: max(1, min(limit, 20))],
-        "publishers": publisher_items[: max(1, min(limit, 20))],
     }
+    for name in selected:
+        items: list[dict[str, object]] = []
+        for value in sorted(counts[name].keys()):
+            previous, current = counts[name][value]
+            if current == 0 and previous == 0:
+                continue
+            items.append(
+                {
+                    "name": value,
+                    "current": current,
+                    "previous": previous,
+                    "change": current - previous,
+                    "delta_percent": _calc_delta(current, previous),
+                }
+            )
+        items.sort(key=lambda item: abs(int(item["change"])), reverse=True)
+        payload[DIMENSION_PLURALS[name]] = items[:bounded]
+    return payload
 
 
 async def fetch_risk_index(db: AsyncSession, *, time_window: str = "24h") -> dict[str, object]:
     now = datetime.now(UTC)
     since = now - parse_time_window(time_window)
-    total_stmt = select(func.count(AIDevelopment.id)).where(AIDevelopment.published_at >= since)
-    incidents_stmt = select(func.count(AIDevelopment.id)).where(
-        and_(AIDevelopment.published_at >= since, AIDevelopment.category == CategoryType.incidents)
-    )
-    low_conf_stmt = select(func.count(AIDevelopment.id)).where(
-        and_(AIDevelopment.published_at >= since, AIDevelopment.confidence < 0.5)
-    )
-    total = int((await db.execute(total_stmt)).scalar_one())
-    incidents = int((await db.execute(incidents_stmt)).scalar_one())
-    low_confidence = int((await db.execute(low_conf_stmt)).scalar_one())
+    counts_stmt = select(
+        func.count(AIDevelopment.id),
+        func.count(AIDevelopment.id).filter(AIDevelopment.category == CategoryType.incidents),
+        func.count(AIDevelopment.id).filter(AIDevelopment.confidence < 0.5),
+    ).where(AIDevelopment.published_at >= since)
+    total, incidents, low_confidence = (int(value or 0) for value in (await db.execute(counts_stmt)).one())
 
     incidents_ratio = incidents / max(1, total)
     low_confidence_ratio = low_confidence / max(1, total)
@@ -706,51 +927,34 @@ async def fetch_entity_momentum(db: AsyncSession, *, time_window: str = "24h", l
     current_start = now - window
     previous_start = now - (window * 2)
 
-    current_rows = (
-        await db.execute(
-            text(
-                """
-                SELECT entity_name AS name, COUNT(*)::int AS count
-                FROM ai_developments,
-                LATERAL jsonb_array_elements_text(COALESCE(entities, '[]'::jsonb)) AS entity_name
-                WHERE published_at >= :current_start
-                  AND published_at < :now
-                  AND entity_name <> ''
-                GROUP BY entity_name
-                ORDER BY count DESC
-                LIMIT 120
-                """
-            ),
-            {"current_start": current_start, "now": now},
-        )
-    ).all()
-    previous_rows = (
+    rows = (
         await db.execute(
             text(
                 """
-                SELECT entity_name AS name, COUNT(*)::int AS count
+                SELECT
+                  entity_name AS name,
+                  (COUNT(*) FILTER (WHERE published_at >= :current_start))::int AS current,
+                  (COUNT(*) FILTER (WHERE published_at < :current_start))::int AS previous
                 FROM ai_developments,
                 LATERAL jsonb_array_elements_text(COALESCE(entities, '[]'::jsonb)) AS entity_name
                 WHERE published_at >= :previous_start
-                  AND published_at < :current_start
+                  AND published_at < :now
                   AND entity_name <> ''
                 GROUP BY entity_name
-                ORDER BY count DESC
-                LIMIT 120
+                ORDER BY GREATEST(
+                  COUNT(*) FILTER (WHERE published_at >= :current_start),
+                  COUNT(*) FILTER (WHERE published_at < :current_start)
+                ) DESC
+                LIMIT 240
                 """
             ),
-            {"previous_start": previous_start, "current_start": current_start},
+            {"previous_start": previous_start, "current_start": current_start, "now": now},
         )
     ).all()
 
-    def _delta(current: int, previous: int) -> float:
-        if previous == 0:
-            return 100.0 if current > 0 else 0.0
-        return round(((current - previous) / previous) * 100.0, 2)
-
-    current_map = {str(name): int(count) for name, count in current_rows}
-    previous_map = {str(name): int(count) for name, count in previous_rows}
-    names = sorted(set(current_map.keys()) | set(previous_map.keys()))
+    current_map = {str(name): int(current) for name, current, _ in rows}
+    previous_map = {str(name): int(previous) for name, _, previous in rows}
+    names = sorted(current_map.keys())
 
     movers: list[dict[str, object]] = []
     for name in names:
@@ -765,7 +969,7 @@ async def fetch_entity_momentum(db: AsyncSession, *, time_window: str = "24h", l
                 "current": current,
                 "previous": previous,
                 "change": change,
-                "delta_percent": _delta(current, previous),
+                "delta_percent": _calc_delta(current, previous),
             }
         )
 
@@ -1000,11 +1204,11 @@ async def fetch_coverage(db: AsyncSession, *, time_window: str = "7d", limit: in
         "time_window": time_window,
         "total": total,
         "categories": [
-            {"name": _enum_name(name), "count": int(count), "percent": _pct(int(count))}
+            {"name": enum_name(name), "count": int(count), "percent": _pct(int(count))}
             for name, count in categories_rows
         ],
         "source_types": [
-            {"name": _enum_name(name), "count": int(count), "percent": _pct(int(count))}
+            {"name": enum_name(name), "count": int(count), "percent": _pct(int(count))}
             for name, count in source_type_rows
         ],
         "languages": [
@@ -1035,18 +1239,19 @@ async def fetch_alerts(
     elif window >= timedelta(days=90):
         lookback_windows = 6
 
-    current_map = await _category_counts_between(db, current_start, now)
-    history_maps: list[dict[str, int]] = []
-    for window_index in range(lookback_windows, 0, -1):
-        history_start = current_start - (window * window_index)
-        history_end = history_start + window
-        history_maps.append(await _category_counts_between(db, history_start, history_end))
+    windows = [
+        (current_start - (window * window_index), current_start - (window * (window_index - 1)))
+        for window_index in range(lookback_windows, 0, -1)
+    ]
+    windows.append((current_start, now))
+    counts = (await fetch_windowed_counts(db, dimensions=["category"], windows=windows))["category"]
 
     categories = [c.value for c in CategoryType]
     alerts: list[StatsAlertItem] = []
     for category in categories:
-        current = current_map.get(category, 0)
-        history_series = [history_map.get(category, 0) for history_map in history_maps]
+        series = counts.get(category, [0] * len(windows))
+        current = series[-1]
+        history_series = series[:-1]
         previous = history_series[-1] if len(history_series) > 0 else 0
         baseline_mean = _mean(history_series)
         baseline_stddev = _stddev(history_series, baseline_mean)
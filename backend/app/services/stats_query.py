@@ -0,0 +1,198 @@
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import and_, func, literal, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models.ai_development import AIDevelopment, CategoryType, SourceType
+from backend.app.models.stats_rollup import StatsHourlyRollup
+from backend.app.services.feed import parse_time_window
+from backend.app.services.rollups import ROLLUP_DIMENSIONS, enum_name, rollup_bucket
+
+QUERY_DIMENSIONS = ROLLUP_DIMENSIONS
+QUERY_BUCKETS = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+}
+# Enum-typed columns; any other filter value would fail the cast on the raw table.
+QUERY_ENUM_VALUES = {
+    "category": tuple(member.value for member in CategoryType),
+    "source_type": tuple(member.value for member in SourceType),
+}
+QUERY_SOURCES = ("auto", "rollup", "raw")
+MAX_GROUP_BY = 3
+MAX_GROUPS = 200
+MAX_BUCKETS = 800
+MAX_RESULT_CELLS = 20_000
+ROLLUP_MIN_WINDOW = timedelta(hours=24)
+
+
+@dataclass(frozen=True, slots=True)
+class StatsQuery:
+    group_by: tuple[str, ...] = ()
+    time_window: str = "7d"
+    bucket: str | None = None
+    filters: dict[str, str] = field(default_factory=dict)
+    limit: int = 50
+    source: str = "auto"
+
+
+def validate_stats_query(query: StatsQuery) -> None:
+    unknown = [name for name in (*query.group_by, *query.filters) if name not in QUERY_DIMENSIONS]
+    if unknown:
+        raise ValueError(f"unknown dimensions: {', '.join(sorted(set(unknown)))}")
+    for name, value in query.filters.items():
+        allowed = QUERY_ENUM_VALUES.get(name)
+        if allowed is not None and value not in allowed:
+            raise ValueError(f"{name} must be one of: {', '.join(allowed)}")
+    if len(query.group_by) > MAX_GROUP_BY:
+        raise ValueError(f"group_by accepts at most {MAX_GROUP_BY} dimensions")
+    if len(set(query.group_by)) != len(query.group_by):
+        raise ValueError("group_by dimensions must be unique")
+    if not 1 <= query.limit <= MAX_GROUPS:
+        raise ValueError(f"limit must be between 1 and {MAX_GROUPS}")
+    if query.source not in QUERY_SOURCES:
+        raise ValueError(f"source must be one of: {', '.join(QUERY_SOURCES)}")
+    if query.bucket is None:
+        return
+    if query.bucket not in QUERY_BUCKETS:
+        raise ValueError(f"bucket must be one of: {', '.join(QUERY_BUCKETS)}")
+
+    bucket_count = parse_time_window(query.time_window) // QUERY_BUCKETS[query.bucket] + 1
+    if bucket_count > MAX_BUCKETS:
+        raise ValueError(f"{query.time_window} in {query.bucket} buckets exceeds {MAX_BUCKETS} buckets")
+    group_count = query.limit if query.group_by else 1
+    if bucket_count * group_count > MAX_RESULT_CELLS:
+        raise ValueError(f"query would return more than {MAX_RESULT_CELLS} cells; use a coarser bucket or lower limit")
+
+
+def _bucket_expression(bucket: str, time_column):
+    # The unit is inlined (it is validated against QUERY_BUCKETS) so the SELECT
+    # and GROUP BY expressions compile identically under positional binds.
+    return func.date_trunc(literal_column(f"'{bucket}'"), time_column)
+
+
+def resolve_query_source(source: str, time_window: str) -> str:
+    """``rollup`` or ``raw`` for a requested ``source``; ``auto`` uses rollups for windows of 24h or more."""
+    if source not in QUERY_SOURCES:
+        raise ValueError(f"source must be one of: {', '.join(QUERY_SOURCES)}")
+    if source != "auto":
+        return source
+    return "rollup" if parse_time_window(time_window) >= ROLLUP_MIN_WINDOW else "raw"
+
+
+async def run_stats_query(db: AsyncSession, query: StatsQuery) -> dict[str, object]:
+    """Compile a grouped count query to a single statement.
+
+    Rollup-served queries read ``stats_hourly_rollups`` with the window start
+    aligned to the hour; short windows fall back to ``ai_developments``. When
+    grouping, only the ``limit`` largest groups are returned, and with a
+    bucket each of those groups gets its full time series.
+    """
+    validate_stats_query(query)
+    now = datetime.now(UTC)
+    since = now - parse_time_window(query.time_window)
+    source = resolve_query_source(query.source, query.time_window)
+
+    if source == "rollup":
+        since = rollup_bucket(since)
+        table = StatsHourlyRollup
+        dimensions = {name: getattr(StatsHourlyRollup, name) for name in QUERY_DIMENSIONS}
+        time_column = StatsHourlyRollup.bucket
+        count_expr = func.sum(StatsHourlyRollup.item_count)
+        confidence_expr = func.sum(StatsHourlyRollup.confidence_sum)
+    else:
+        table = AIDevelopment
+        dimensions = {name: getattr(AIDevelopment, name) for name in QUERY_DIMENSIONS}
+        time_column = AIDevelopment.published_at
+        count_expr = func.count(AIDevelopment.id)
+        confidence_expr = func.sum(AIDevelopment.confidence)
+
+    clauses = [time_column >= since, time_column < now]
+    clauses.extend(dimensions[name] == value for name, value in query.filters.items())
+    group_columns = [dimensions[name] for name in query.group_by]
+
+    top_groups = (
+        select(
+            *[column.label(name) for name, column in zip(query.group_by, group_columns)],
+            count_expr.label("count"),
+            confidence_expr.label("confidence_sum"),
+            func.sum(count_expr).over().label("grand_total"),
+            func.row_number().over(order_by=[count_expr.desc(), *group_columns]).label("group_rank"),
+        )
+        .select_from(table)
+        .where(and_(*clauses))
+        .group_by(*group_columns)
+        .order_by(count_expr.desc(), *group_columns)
+        .limit(query.limit + 1)
+    )
+
+    if query.bucket is None:
+        stmt = top_groups
+    elif not group_columns:
+        bucket_expr = _bucket_expression(query.bucket, time_column)
+        stmt = (
+            select(
+                bucket_expr.label("bucket"),
+                count_expr.label("count"),
+                confidence_expr.label("confidence_sum"),
+                func.sum(count_expr).over().label("grand_total"),
+                literal(1).label("group_rank"),
+            )
+            .select_from(table)
+            .where(and_(*clauses))
+            .group_by(bucket_expr)
+            .order_by(bucket_expr)
+        )
+    else:
+        top = top_groups.subquery("top_groups")
+        bucket_expr = _bucket_expression(query.bucket, time_column)
+        stmt = (
+            select(
+                bucket_expr.label("bucket"),
+                *[column.label(name) for name, column in zip(query.group_by, group_columns)],
+                count_expr.label("count"),
+                confidence_expr.label("confidence_sum"),
+                top.c.grand_total,
+                top.c.group_rank,
+            )
+            .select_from(table)
+            .join(top, and_(*[column == top.c[name] for name, column in zip(query.group_by, group_columns)]))
+            .where(and_(*clauses))
+            .group_by(bucket_expr, *group_columns, top.c.grand_total, top.c.group_rank)
+            .order_by(bucket_expr, top.c.group_rank)
+        )
+
+    rows = (await db.execute(stmt)).mappings().all()
+    truncated = any(int(row["group_rank"]) > query.limit for row in rows)
+
+    items: list[dict[str, object]] = []
+    total = 0
+    for row in rows:
+        total = int(row["grand_total"] or 0)
+        if int(row["group_rank"]) > query.limit:
+            continue
+        key = tuple(enum_name(row[name]) for name in query.group_by)
+        count = int(row["count"] or 0)
+        item: dict[str, object] = {}
+        if query.bucket is not None:
+            item["bucket"] = row["bucket"].astimezone(UTC).isoformat() if row["bucket"] else None
+        item.update(zip(query.group_by, key))
+        item["count"] = count
+        item["avg_confidence"] = round(float(row["confidence_sum"] or 0.0) / count, 4) if count else 0.0
+        items.append(item)
+
+    return {
+        "generated_at": now.isoformat(),
+        "time_window": query.time_window,
+        "since": since.isoformat(),
+        "bucket": query.bucket,
+        "group_by": list(query.group_by),
+        "filters": dict(query.filters),
+        "source": source,
+        "total": total,
+        "truncated": truncated,
+        "rows": items,
+    }
@@ -0,0 +1,73 @@
+import pytest
+import pytest_asyncio
+import redis.asyncio as redis
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.app.core.config import settings
+
+
+@pytest_asyncio.fixture
+async def async_session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
+    async_session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                """
+                CREATE TABLE ai_developments (
+                    id TEXT PRIMARY KEY,
+                    source_id TEXT,
+                    source_type TEXT,
+                    category TEXT NOT NULL,
+                    title TEXT,
+                    url TEXT,
+                    publisher TEXT,
+                    published_at TIMESTAMP NOT NULL,
+                    ingested_at TIMESTAMP NOT NULL,
+                    language TEXT,
+                    jurisdiction TEXT,
+                    confidence FLOAT
+                )
+                """
+            )
+        )
+    async with async_session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def live_redis():
+    """A client for the configured Redis, for tests of server-side scripts; skipped without one."""
+    client = redis.from_url(settings.redis_url, decode_responses=True)
+    try:
+        await client.ping()
+    except (redis.RedisError, OSError):
+        await client.aclose()
+        pytest.skip("Redis is not reachable")
+    yield client
+    await client.aclose()
+
+
+@pytest_asyncio.fixture
+async def live_pg_session():
+    """A session on the configured Postgres inside a transaction that is rolled back; skipped without one.
+
+    For queries sqlite cannot run. Tests create TEMP tables, which shadow the real ones.
+    """
+    engine = create_async_engine(settings.database_url, future=True, connect_args={"timeout": 3})
+    try:
+        connection = await engine.connect()
+    except (OSError, SQLAlchemyError):
+        await engine.dispose()
+        pytest.skip("Postgres is not reachable")
+    transaction = await connection.begin()
+    try:
+        async with AsyncSession(bind=connection, expire_on_commit=False) as session:
+            yield session
+    finally:
+        await transaction.rollback()
+        await connection.close()
+        await engine.dispose()
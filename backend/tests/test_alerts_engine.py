@@ -0,0 +1,210 @@
+import json
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from backend.app.core.config import settings
+from backend.app.services.alerts_engine import (
+    ALERT_ACTIVE_KEY,
+    ALERT_STATE_KEY,
+    ALERT_UPDATE_RETRIES,
+    MIN_HISTORY_HOURS,
+    SERIES_UPDATE_LUA,
+    SeriesState,
+    advance_series,
+    close_idle_series,
+    record_series_updates,
+    series_increments,
+)
+
+NOW = datetime(2026, 2, 17, 12, 30, tzinfo=UTC)
+NOW_HOUR = int(NOW.timestamp() // 3600)
+
+
+def _warm_state(mean_count: int) -> SeriesState:
+    start = NOW_HOUR - MIN_HISTORY_HOURS - 2
+    state = None
+    for hour in range(start, NOW_HOUR):
+        state, alerts = advance_series("publisher:Mila", state, hour, mean_count, now=NOW)
+        assert alerts == []
+    return state
+
+
+def test_spike_in_open_hour_is_flagged_once_threshold_is_crossed():
+    state = _warm_state(2)
+
+    state, alerts = advance_series("publisher:Mila", state, NOW_HOUR, 3, now=NOW)
+    assert alerts == []
+
+    state, alerts = advance_series("publisher:Mila", state, NOW_HOUR, 9, now=NOW)
+    assert len(alerts) == 1
+    assert alerts[0]["direction"] == "up"
+    assert alerts[0]["dimension"] == "publisher"
+    assert alerts[0]["current"] == 12
+
+
+def test_late_items_count_in_the_open_hour_and_history_is_ignored():
+    state = _warm_state(4)
+    before = state.encode()
+
+    ancient = NOW_HOUR - settings.sse_freshness_hours - 1
+    state, alerts = advance_series("publisher:Mila", state, ancient, 50, now=NOW)
+    assert alerts == []
+    assert state.encode() == before
+    assert SeriesState.decode(before).encode() == before
+
+    open_hour, open_count = state.hour, state.count
+    state, _ = advance_series("publisher:Mila", state, NOW_HOUR - 30, 3, now=NOW)
+    assert (state.hour, state.count) == (open_hour, open_count + 3)
+
+
+def test_series_increments_cover_every_dimension():
+    item = {
+        "published_at": NOW,
+        "category": "policy",
+        "publisher": "Mila",
+        "jurisdiction": "Quebec",
+        "entities": ["Mila", "Mila", "CIFAR"],
+    }
+    increments = series_increments([item, item])
+
+    assert set(increments) == {
+        "category:policy",
+        "publisher:Mila",
+        "jurisdiction:Quebec",
+        "entity:CIFAR",
+        "entity:Mila",
+    }
+    assert increments["entity:Mila"] == {NOW_HOUR: 2}
+
+
+def test_silent_hour_before_an_update_raises_a_drop():
+    state = _warm_state(12)
+
+    # Nothing arrived during NOW_HOUR; the next item lands an hour later.
+    later = NOW + timedelta(hours=1)
+    state, alerts = advance_series("publisher:Mila", state, NOW_HOUR + 1, 1, now=later)
+
+    assert [(alert["direction"], alert["current"]) for alert in alerts] == [("down", 0)]
+    assert alerts[0]["bucket"] == datetime.fromtimestamp(NOW_HOUR * 3600, tz=UTC).isoformat()
+
+
+class _SeriesRedis:
+    """The hashes and ZSET the engine uses, with SERIES_UPDATE_LUA's compare-and-set in Python."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {ALERT_STATE_KEY: {}, ALERT_ACTIVE_KEY: {}}
+        self.hours: dict[str, int] = {}
+        self.before_script = None
+        self.script_calls = 0
+
+    async def hmget(self, key, fields):
+        return [self.hashes[key].get(field) for field in fields]
+
+    async def zrangebyscore(self, key, low, high):
+        assert (low, high[0]) == ("-inf", "(")
+        return [field for field, hour in self.hours.items() if hour < int(high[1:])]
+
+    def register_script(self, source):
+        assert source == SERIES_UPDATE_LUA
+
+        async def run(keys, args):
+            self.script_calls += 1
+            if self.before_script is not None:
+                self.before_script(self)
+            states, active, _ = (self.hashes[key] if key in self.hashes else None for key in keys)
+            conflicts = []
+            for index in range(int(args[0])):
+                field, expected, new_state, hour, alert = args[1 + index * 5 : 6 + index * 5]
+                if states.get(field, "") != expected:
+                    conflicts.append(field)
+                    continue
+                states[field] = new_state
+                self.hours[field] = int(hour)
+                if alert:
+                    active[field] = alert
+            return conflicts
+
+        return run
+
+
+def _store_warm(client: _SeriesRedis, key: str, state: SeriesState) -> None:
+    client.hashes[ALERT_STATE_KEY][key] = state.encode()
+    client.hours[key] = state.hour
+
+
+@pytest.mark.asyncio
+async def test_close_idle_series_folds_only_lagging_series_up_to_now():
+    client = _SeriesRedis()
+    silent = _warm_state(12)
+    _store_warm(client, "publisher:Mila", silent)
+    later = NOW + timedelta(hours=1)
+    current = SeriesState(hour=NOW_HOUR + 1, count=4)
+    _store_warm(client, "publisher:CIFAR", current)
+
+    alerts = await close_idle_series(client, now=later)
+
+    assert [alert["series"] for alert in alerts] == ["publisher:Mila"]
+    assert json.loads(client.hashes[ALERT_ACTIVE_KEY]["publisher:Mila"])["direction"] == "down"
+    closed = SeriesState.decode(client.hashes[ALERT_STATE_KEY]["publisher:Mila"])
+    assert (closed.hour, closed.count) == (NOW_HOUR + 1, 0)
+    assert closed.mean < silent.mean
+    assert client.hashes[ALERT_STATE_KEY]["publisher:CIFAR"] == current.encode()
+
+    # A second sweep in the same hour finds no lagging series and reads nothing.
+    calls = client.script_calls
+    assert await close_idle_series(client, now=later) == []
+    assert client.script_calls == calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_to_a_series_are_recomputed_not_dropped():
+    client = _SeriesRedis()
+    _store_warm(client, "publisher:Mila", SeriesState(hour=NOW_HOUR, count=2))
+    item = {"published_at": NOW, "publisher": "Mila"}
+
+    def other_writer(redis_double):
+        # Another source lands 5 items in the same hour between our first read and write.
+        if redis_double.script_calls == 1:
+            redis_double.hashes[ALERT_STATE_KEY]["publisher:Mila"] = SeriesState(hour=NOW_HOUR, count=7).encode()
+
+    client.before_script = other_writer
+    await record_series_updates(client, [item, item], now=NOW)
+
+    assert client.script_calls == 2
+    assert SeriesState.decode(client.hashes[ALERT_STATE_KEY]["publisher:Mila"]).count == 9
+    assert client.hours["publisher:Mila"] == NOW_HOUR
+
+
+@pytest.mark.asyncio
+async def test_dropped_series_updates_are_logged(caplog):
+    client = _SeriesRedis()
+
+    def busy_writer(redis_double):
+        # Some other source advances this series before every one of our writes.
+        count = redis_double.script_calls
+        redis_double.hashes[ALERT_STATE_KEY]["publisher:Mila"] = SeriesState(hour=NOW_HOUR, count=count).encode()
+
+    client.before_script = busy_writer
+    await record_series_updates(client, [{"published_at": NOW, "publisher": "Mila"}], now=NOW)
+
+    assert client.script_calls == ALERT_UPDATE_RETRIES
+    assert "Dropped alert series updates" in caplog.text
+    assert "publisher:Mila" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_series_update_script_against_redis(live_redis):
+    suffix = uuid.uuid4().hex
+    keys = [f"test:{suffix}:state", f"test:{suffix}:active", f"test:{suffix}:hours"]
+    script = live_redis.register_script(SERIES_UPDATE_LUA)
+    try:
+        args = ["a", "", "1|1|0|0|0", 1, '{"z": 1}', "b", "stale", "1|1|0|0|0", 1, ""]
+        assert await script(keys=keys, args=[2, *args]) == ["b"]
+        assert await live_redis.hgetall(keys[0]) == {"a": "1|1|0|0|0"}
+        assert await live_redis.hgetall(keys[1]) == {"a": '{"z": 1}'}
+        assert await live_redis.zrange(keys[2], 0, -1, withscores=True) == [("a", 1.0)]
+        assert await script(keys=keys, args=[1, "a", "1|1|0|0|0", "2|0|0|0|0", 2, ""]) == []
+    finally:
+        await live_redis.delete(*keys)
@@ -0,0 +1,76 @@
+from datetime import date
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.app.models.backfill_job import BackfillJob, BackfillMonth
+from backend.app.services.backfill_jobs import create_job, ensure_months, job_payload
+from workers.app.backfill import iter_openalex_month
+
+
+@pytest_asyncio.fixture
+async def job_session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: BackfillJob.metadata.create_all(
+                sync_conn, tables=[BackfillJob.__table__, BackfillMonth.__table__]
+            )
+        )
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_ensure_months_keeps_existing_checkpoints(job_session):
+    job = await create_job(
+        job_session,
+        start_date=date(2024, 1, 15),
+        end_date=date(2024, 3, 10),
+        per_page=200,
+        max_pages_per_month=None,
+    )
+    months = await ensure_months(job_session, job)
+    assert [month.month for month in months] == [date(2024, 1, 1), date(2024, 2, 1), date(2024, 3, 1)]
+    assert all(month.cursor == "*" for month in months)
+
+    months[0].status = "completed"
+    months[1].cursor, months[1].pages = "abc", 3
+    await job_session.commit()
+
+    resumed = await ensure_months(job_session, job)
+    assert [(month.status, month.cursor, month.pages) for month in resumed] == [
+        ("completed", "*", 0),
+        ("pending", "abc", 3),
+        ("pending", "*", 0),
+    ]
+    payload = job_payload(job, resumed)
+    assert payload["months_total"] == 3
+    assert payload["months_completed"] == 1
+    assert payload["current_month"] == "2024-02-01"
+
+
+@pytest.mark.asyncio
+async def test_iter_openalex_month_resumes_from_cursor():
+    cursors: list[str] = []
+    next_cursors = {"abc": "def", "def": None}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursor = request.url.params["cursor"]
+        cursors.append(cursor)
+        return httpx.Response(200, json={"results": [{"id": cursor}], "meta": {"next_cursor": next_cursors[cursor]}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        pages = [
+            (len(records), next_cursor, fetched)
+            async for records, next_cursor, fetched in iter_openalex_month(
+                client, start_date=date(2024, 2, 1), end_date=date(2024, 3, 1), cursor="abc"
+            )
+        ]
+
+    assert cursors == ["abc", "def"]
+    # Untitled works are dropped by normalization but still count as fetched.
+    assert pages == [(0, "def", 1), (0, None, 1)]
@@ -0,0 +1,51 @@
+from workers.app.keywords import KeywordMatcher
+from workers.app.source_adapters import _canada_relevance_score, _contains_ai, _infer_jurisdiction, _likely_french
+
+
+def test_matches_whole_words_and_prefixes_only():
+    matcher = KeywordMatcher({"ai": {"ai", "llm*"}, "canada": {"pei", "canada"}})
+
+    terms = matcher.scan("He said the speical LLMs from Canada were fine")
+
+    assert matcher.hits(terms, "ai") == {"llm"}
+    assert matcher.hits(terms, "canada") == {"canada"}
+    assert not matcher.has(matcher.scan("She said so"), "ai")
+
+
+def test_phrases_report_contained_terms_for_other_dictionaries():
+    matcher = KeywordMatcher({"entity": {"university of alberta"}, "province": {"alberta"}})
+
+    terms = matcher.scan("A University of Alberta lab")
+
+    assert matcher.hits(terms, "entity") == {"university of alberta"}
+    assert matcher.hits(terms, "province") == {"alberta"}
+
+
+def test_source_classifiers_use_word_boundaries():
+    assert not _contains_ai("Minister said funding is available")
+    assert _contains_ai("AI-driven triage pilot")
+    assert _infer_jurisdiction("A speical report", "") == "Global"
+    assert _infer_jurisdiction("Mila and the University of Alberta", "Canada") == "Alberta"
+    assert _canada_relevance_score("Vector Institute", "https://www.canada.ca/en", "Mila") == 1.0
+    assert _likely_french("La politique économique du gouvernement dans l'Ontario")
+
+
+def test_plural_possessive_and_demonym_forms_still_match():
+    assert _contains_ai("Chatbots and AIs in schools")
+    assert _contains_ai("Canada's LLMs")
+    assert _canada_relevance_score("New AI rules for Canadians") == 0.35
+    assert _canada_relevance_score("Albertans react to AI policy") == 0.35
+    assert _infer_jurisdiction("Ontarians and Canadians weigh AI") == "Ontario"
+    assert _infer_jurisdiction("Canada's AI strategy") == "Canada"
+    assert _infer_jurisdiction("Montrealers test generative tools") == "Quebec"
+    assert not _contains_ai("Minister said the aid arrives Tuesday")
+
+
+def test_compound_ai_names_match():
+    assert _contains_ai("OpenAI opens Toronto office")
+    assert _contains_ai("GenAI startup raises funds")
+    assert _contains_ai("xAI hires in Montreal")
+    assert _contains_ai("CohereAI expands its Toronto lab")
+    assert _contains_ai("openai and genai in lowercase feeds")
+    assert not _contains_ai("Officials said Thai exports rose")
+    assert not _contains_ai("THAI RESTAURANT OWNERS SAID RENTS ROSE")
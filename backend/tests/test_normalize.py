@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from backend.app.core.config import settings
+from workers.app.backfill import _to_record
+from workers.app.normalize import NORMALIZE_CHUNK_SIZE, normalize_items
+from workers.app.runtime import WorkerRuntime
+
+
+def _openalex_work(index: int) -> dict[str, object]:
+    title = f"Machine learning study {index}" if index % 3 else f"Soil survey {index}"
+    return {
+        "id": f"https://openalex.org/W{index}",
+        "display_name": title,
+        "publication_date": "2024-02-10",
+        "primary_location": {"landing_page_url": f"https://example.ca/{index}"},
+        "language": "en",
+        "authorships": [{"institutions": [{"display_name": "Mila", "country_code": "CA"}]}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_pool_normalization_matches_inline_and_keeps_order():
+    works = [_openalex_work(index) for index in range(NORMALIZE_CHUNK_SIZE * 3 + 7)]
+
+    inline = await normalize_items(_to_record, works)
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as pool:
+        pooled = await normalize_items(_to_record, works, pool=pool)
+
+    assert pooled == inline
+    assert [record["url"] for record in pooled] == [
+        f"https://example.ca/{index}" for index in range(len(works)) if index % 3
+    ]
+
+
+def _normalize_in_daemon(results: "multiprocessing.Queue[bool]") -> None:
+    works = [_openalex_work(index) for index in range(NORMALIZE_CHUNK_SIZE * 2 + 1)]
+    pool = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        pooled = asyncio.run(normalize_items(_to_record, works, pool=pool))
+        results.put(pooled == asyncio.run(normalize_items(_to_record, works)))
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def test_pool_that_cannot_start_under_a_daemonic_parent_falls_back_inline():
+    # Celery's prefork children are daemonic, and daemonic processes may not start their own.
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    worker = context.Process(target=_normalize_in_daemon, args=(results,), daemon=True)
+    worker.start()
+    worker.join(timeout=60)
+
+    assert worker.exitcode == 0
+    assert results.get(timeout=5) is True
+
+
+def _pool_path_in_daemon(results: "multiprocessing.Queue[bool]") -> None:
+    settings.normalize_processes = 2
+    runtime = WorkerRuntime()
+    try:
+        results.put(runtime.normalize_pool() is None and runtime.normalize_pool() is None)
+    finally:
+        runtime.close()
+
+
+def test_runtime_pool_runs_only_outside_daemonic_workers(monkeypatch, caplog):
+    # A prefork child (daemonic) normalizes inline; the solo backfill worker gets the pool.
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    worker = context.Process(target=_pool_path_in_daemon, args=(results,), daemon=True)
+    worker.start()
+    worker.join(timeout=60)
+    assert worker.exitcode == 0
+    assert results.get(timeout=5) is True
+
+    monkeypatch.setattr(settings, "normalize_processes", 2)
+    runtime = WorkerRuntime()
+    try:
+        with caplog.at_level(logging.INFO, logger="workers.app.runtime"):
+            assert isinstance(runtime.normalize_pool(), ProcessPoolExecutor)
+        assert "across 2 spawned processes" in caplog.text
+    finally:
+        runtime.close()
@@ -0,0 +1,52 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from backend.app.core.config import settings
+from workers.app.outbox import enqueue_item_events
+
+NOW = datetime(2026, 2, 17, 12, 30, tzinfo=UTC)
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.rows: list[dict[str, object]] = []
+
+    async def execute(self, statement, rows):
+        self.rows.extend(rows)
+
+
+def _item(item_id: str, published_at: datetime) -> dict[str, object]:
+    return {"id": item_id, "title": f"Item {item_id}", "published_at": published_at.isoformat()}
+
+
+@pytest.mark.asyncio
+async def test_fresh_items_go_live_and_stale_ones_invalidate_rollups():
+    fresh_cutoff = NOW - timedelta(hours=settings.sse_freshness_hours)
+    payloads = [
+        _item("fresh", NOW - timedelta(hours=1)),
+        _item("edge", fresh_cutoff),
+        _item("old-a", datetime(2024, 3, 5, 9, 10, tzinfo=UTC)),
+        _item("old-b", datetime(2024, 3, 5, 9, 50, tzinfo=UTC)),
+        _item("old-c", datetime(2023, 11, 1, 0, 0, tzinfo=UTC)),
+    ]
+    session = _RecordingSession()
+
+    queued = await enqueue_item_events(session, payloads, now=NOW)
+
+    assert queued == 3
+    live = [row["payload"]["id"] for row in session.rows if row["channel"] == settings.sse_channel]
+    assert live == ["fresh", "edge"]
+    [invalidation] = [row["payload"] for row in session.rows if row["channel"] == settings.rollup_channel]
+    assert invalidation == {
+        "event": "rollups_invalidated",
+        "data": {"items": 3, "buckets": ["2023-11-01T00:00:00+00:00", "2024-03-05T09:00:00+00:00"]},
+    }
+
+
+@pytest.mark.asyncio
+async def test_only_fresh_items_queue_no_invalidation():
+    session = _RecordingSession()
+
+    assert await enqueue_item_events(session, [_item("fresh", NOW)], now=NOW) == 1
+    assert {row["channel"] for row in session.rows} == {settings.sse_channel}
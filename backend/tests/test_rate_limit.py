@@ -0,0 +1,164 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from workers.app import rate_limit
+from workers.app.rate_limit import (
+    DEFAULT_HOST_LIMIT,
+    HOST_LIMITS,
+    LEASE_LUA,
+    MAX_RETRY_AFTER_SECONDS,
+    TOKEN_BUCKET_LUA,
+    HostLimit,
+    HostThrottled,
+    host_limit,
+    host_slot,
+    limited_get,
+    retry_after_seconds,
+)
+
+
+class _ScriptedRedis:
+    """Replays canned script replies in order; records the keys the limiter sets."""
+
+    def __init__(self, *, bucket=(), lease=()):
+        self.replies = {TOKEN_BUCKET_LUA: list(bucket), LEASE_LUA: list(lease)}
+        self.blocked: dict[str, int] = {}
+        self.released: list[str] = []
+
+    def register_script(self, source):
+        async def run(keys, args):
+            return self.replies[source].pop(0)
+
+        return run
+
+    async def set(self, key, value, px):
+        self.blocked[key] = px
+
+    async def zrem(self, key, token):
+        self.released.append(token)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded: list[float] = []
+
+    async def fake_sleep(seconds):
+        recorded.append(seconds)
+
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def _in_runtime(monkeypatch, client):
+    monkeypatch.setattr(rate_limit, "active_runtime", lambda: SimpleNamespace(redis=client))
+
+
+def test_host_limit_matches_listed_parent_domains():
+    assert host_limit("www.gazette.gc.ca") is HOST_LIMITS["www.gazette.gc.ca"]
+    assert host_limit("WWW.Canada.ca") is HOST_LIMITS["www.canada.ca"]
+    assert host_limit("gazette.gc.ca") is DEFAULT_HOST_LIMIT
+    assert host_limit("example.org") is DEFAULT_HOST_LIMIT
+
+
+def test_retry_after_accepts_seconds_and_http_dates():
+    def response(value):
+        return httpx.Response(429, headers={"Retry-After": value})
+
+    assert retry_after_seconds(response("12")) == 12.0
+    assert retry_after_seconds(response("-5")) == 0.0
+    assert retry_after_seconds(response("86400")) == MAX_RETRY_AFTER_SECONDS
+    assert retry_after_seconds(response("soon")) is None
+    assert retry_after_seconds(httpx.Response(429)) is None
+
+    in_a_minute = format_datetime(datetime.now(UTC) + timedelta(seconds=60), usegmt=True)
+    assert 55 <= retry_after_seconds(response(in_a_minute)) <= 60
+
+
+@pytest.mark.asyncio
+async def test_host_slot_waits_for_the_bucket_and_a_lease(monkeypatch, sleeps):
+    client = _ScriptedRedis(bucket=[(0, 2_000), (1, 500)], lease=[0, 0, 1])
+    _in_runtime(monkeypatch, client)
+
+    async with host_slot("https://api.openalex.org/works"):
+        pass
+
+    # A short block, then the reserved token's wait, then two lease polls.
+    assert sleeps[:2] == [2.0, 0.5]
+    assert len(sleeps) == 4
+    assert len(client.released) == 1
+
+
+@pytest.mark.asyncio
+async def test_host_slot_fails_fast_on_long_blocks(monkeypatch, sleeps):
+    client = _ScriptedRedis(bucket=[(0, 600_000)])
+    _in_runtime(monkeypatch, client)
+
+    with pytest.raises(HostThrottled) as raised:
+        async with host_slot("https://api.github.com/search/repositories"):
+            pass
+
+    assert raised.value.host == "api.github.com"
+    assert raised.value.seconds == 600
+    assert sleeps == []
+    assert client.released == []
+
+
+@pytest.mark.asyncio
+async def test_limited_get_blocks_host_and_returns_long_throttles(monkeypatch, sleeps):
+    client = _ScriptedRedis(bucket=[(1, 0)], lease=[1])
+    _in_runtime(monkeypatch, client)
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(429, headers={"Retry-After": "120"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        response = await limited_get(http, "https://api.crossref.org/works")
+
+    assert response.status_code == 429
+    assert len(calls) == 1
+    assert client.blocked == {"ratelimit:blocked:api.crossref.org": 120_000}
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_limited_get_retries_short_throttles_outside_a_runtime(sleeps):
+    statuses = iter([503, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), headers={"Retry-After": "3"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        response = await limited_get(http, "https://www.canada.ca/en.html")
+
+    assert response.status_code == 200
+    assert sleeps == [3.0]
+
+
+@pytest.mark.asyncio
+async def test_lua_scripts_against_redis(live_redis):
+    host = f"test-{uuid.uuid4().hex}.example"
+    bucket_key, blocked_key, lease_key = rate_limit._keys(host)
+    limit = HostLimit(rate_per_second=1.0, burst=2, concurrency=1)
+    take = live_redis.register_script(TOKEN_BUCKET_LUA)
+    lease = live_redis.register_script(LEASE_LUA)
+    try:
+        replies = [await take(keys=[bucket_key, blocked_key], args=[limit.rate_per_second / 1000, limit.burst]) for _ in range(3)]
+        assert [reserved for reserved, _ in replies] == [1, 1, 1]
+        assert [wait_ms for _, wait_ms in replies[:2]] == [0, 0]
+        assert 900 <= replies[2][1] <= 1000
+
+        await live_redis.set(blocked_key, "1", px=45_000)
+        reserved, wait_ms = await take(keys=[bucket_key, blocked_key], args=[limit.rate_per_second / 1000, limit.burst])
+        assert reserved == 0 and wait_ms > 30_000
+
+        assert await lease(keys=[lease_key], args=[1, "a", 60_000]) == 1
+        assert await lease(keys=[lease_key], args=[1, "b", 60_000]) == 0
+    finally:
+        await live_redis.delete(bucket_key, blocked_key, lease_key)
@@ -0,0 +1,101 @@
+import httpx
+import pytest
+
+from workers.app import source_adapters
+from workers.app.conditional import conditional_requests
+from workers.app.cursors import source_cursor
+
+
+def _openalex_work(index: int, created: str) -> dict[str, object]:
+    return {"id": f"https://openalex.org/W{index}", "display_name": f"AI study {index}", "created_date": created}
+
+
+@pytest.mark.asyncio
+async def test_openalex_cursor_resumes_a_query_larger_than_the_page_budget():
+    size, budget = source_adapters.CURSOR_PAGE_SIZE, source_adapters.CURSOR_MAX_PAGES
+    pages = budget + 1
+    requests: list[httpx.URL] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url)
+        position = 0 if request.url.params["cursor"] == "*" else int(request.url.params["cursor"])
+        # Every work was created on the mark day except the very last one.
+        created = "2026-10-20" if position == pages - 1 else "2026-10-18"
+        works = [_openalex_work(position * size + offset, created) for offset in range(size)]
+        next_cursor = str(position + 1) if position + 1 < pages else None
+        return httpx.Response(200, json={"results": works, "meta": {"next_cursor": next_cursor}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with source_cursor("2026-10-18") as first:
+            await source_adapters.fetch_openalex_metadata(client)
+        assert first.advanced == f"2026-10-18|{budget}|2026-10-18"
+
+        with source_cursor(first.advanced) as second:
+            await source_adapters.fetch_openalex_metadata(client)
+
+    assert all(url.params["filter"] == "from_created_date:2026-10-18" for url in requests)
+    assert [url.params["cursor"] for url in requests][budget:] == [str(budget)]
+    assert second.advanced == "2026-10-20"
+
+
+@pytest.mark.asyncio
+async def test_github_mark_holds_until_the_search_is_read_to_the_end():
+    size, budget = source_adapters.CURSOR_PAGE_SIZE, source_adapters.CURSOR_MAX_PAGES
+    total_pages = budget + 2
+    requested: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        requested.append(page)
+        # Sorted by ``updated``: the newest push sits on the first page, not the last.
+        pushed = "2026-10-19T09:00:00Z" if page == 1 else "2026-10-18T10:00:00Z"
+        count = size if page < total_pages else 3
+        items = [{"id": page * 1000 + n, "full_name": f"org/ai-{page}-{n}", "pushed_at": pushed} for n in range(count)]
+        return httpx.Response(200, json={"items": items})
+
+    mark = "2026-10-18T00:00:00Z"
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with source_cursor(mark) as first:
+            await source_adapters.fetch_github_ai_canada_metadata(client)
+        assert first.advanced == f"{mark}|{budget + 1}|2026-10-19T09:00:00Z"
+
+        with source_cursor(first.advanced) as second:
+            await source_adapters.fetch_github_ai_canada_metadata(client)
+
+    assert requested == [*range(1, budget + 1), budget, budget + 1, budget + 2]
+    assert second.advanced == "2026-10-19T09:00:00Z"
+
+
+@pytest.mark.asyncio
+async def test_crossref_reads_a_busy_index_day_across_runs():
+    size, budget = source_adapters.CURSOR_PAGE_SIZE, source_adapters.CURSOR_MAX_PAGES
+    # One index day holding more matches than a run's page budget, then a short last page.
+    total = (budget + 1) * size + 7
+    offsets: list[int] = []
+    not_modified: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        offsets.append(offset)
+        etag = f'"rows-{offset}"'
+        if request.headers.get("If-None-Match") == etag:
+            not_modified.append(offset)
+            return httpx.Response(304)
+        items = [
+            {"DOI": f"10.1/{n}", "indexed": {"date-time": "2026-10-19T08:00:00Z" if n == total - 1 else "2026-10-18T12:00:00Z"}}
+            for n in range(offset, min(offset + size, total))
+        ]
+        return httpx.Response(200, json={"message": {"items": items}}, headers={"ETag": etag})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with source_cursor("2026-10-18T06:00:00Z") as first, conditional_requests(None, None) as validators:
+            await source_adapters.fetch_crossref_ai_canada_metadata(client)
+        assert first.advanced == f"2026-10-18|{budget * size}|2026-10-18T12:00:00Z"
+
+        with source_cursor(first.advanced) as second, conditional_requests(*validators.encode()):
+            await source_adapters.fetch_crossref_ai_canada_metadata(client)
+
+    assert offsets == [n * size for n in range(budget)] + [(budget - 1) * size, budget * size, (budget + 1) * size]
+    # The overlap page had not changed, and stepping past it still finishes the day.
+    assert not_modified == [(budget - 1) * size]
+    assert second.advanced == "2026-10-19T08:00:00Z"
@@ -0,0 +1,38 @@
+from dataclasses import replace
+
+import httpx
+import pytest
+
+from backend.app.models.ai_development import CategoryType, SourceType
+from workers.app import source_adapters
+from workers.app.source_registry import get_source_definition, list_source_definitions
+
+FEED = b"""<?xml version="1.0"?><rss><channel>
+<item><title>AI rules for federal agencies</title><link>https://example.ca/a</link><guid>a</guid>
+<pubDate>Mon, 12 Oct 2026 10:00:00 GMT</pubDate></item>
+<item><title>Harbour dredging notice</title><link>https://example.ca/b</link><guid>b</guid></item>
+<item><title>Machine learning procurement guidance</title><link>https://example.ca/c</link><guid>c</guid>
+<pubDate>Tue, 13 Oct 2026 10:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+def test_feed_specs_are_runnable():
+    for source in list_source_definitions():
+        if source.parser in source_adapters.FEED_PARSERS:
+            assert source_adapters.has_adapter(source), source.key
+            assert source.id_prefix and source.publisher, source.key
+            SourceType(source.source_type)
+            CategoryType(source.category)
+
+
+@pytest.mark.asyncio
+async def test_fetch_source_records_merges_feeds_and_applies_policy():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=FEED))
+    source = replace(get_source_definition("canada_gazette_ai"), max_age_days=None, recency_boost=False)
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        records = await source_adapters.fetch_source_records(source, client)
+
+    assert [record["url"] for record in records] == ["https://example.ca/c", "https://example.ca/a"]
+    assert all("gazette" in record["tags"] for record in records)
+    assert all(record["confidence"] == source.confidence.score(record["relevance_score"]) for record in records)
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from backend.app.api.v1.endpoints import feed
+from backend.app.api.v1.endpoints.feed import _sse_frame
+from backend.app.core.config import settings
+
+
+def test_item_payloads_stream_as_new_item():
+    payload = json.dumps({"id": "1", "title": "Item"})
+
+    assert _sse_frame(payload) == f"event: new_item\ndata: {payload}\n\n"
+
+
+def test_typed_envelopes_stream_under_their_event_name():
+    payload = json.dumps({"event": "backfill_progress", "data": {"months_completed": 3}})
+
+    assert _sse_frame(payload) == 'event: backfill_progress\ndata: {"months_completed": 3}\n\n'
+
+
+class _OneMessagePubSub:
+    def __init__(self, message):
+        self.message = message
+        self.channels: tuple[str, ...] = ()
+
+    async def subscribe(self, *channels):
+        self.channels = channels
+
+    async def get_message(self, ignore_subscribe_messages, timeout):
+        message, self.message = self.message, None
+        return message
+
+    async def unsubscribe(self, *channels):
+        pass
+
+    async def close(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_stream_relays_rollup_invalidations(monkeypatch):
+    data = json.dumps({"event": "rollups_invalidated", "data": {"items": 2, "buckets": []}})
+    pubsub = _OneMessagePubSub({"type": "message", "channel": settings.rollup_channel, "data": data})
+
+    class _Client:
+        def pubsub(self):
+            return pubsub
+
+        async def close(self):
+            pass
+
+    monkeypatch.setattr(feed.redis, "from_url", lambda *args, **kwargs: _Client())
+    stream = feed._stream_events()
+    frame = await stream.__anext__()
+    await stream.aclose()
+
+    assert pubsub.channels == (settings.sse_channel, settings.rollup_channel)
+    assert frame == 'event: rollups_invalidated\ndata: {"items": 2, "buckets": []}\n\n'
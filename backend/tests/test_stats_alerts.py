@@ -2,9 +2,8 @@ import uuid
 from datetime import UTC, datetime, timedelta
 
 import pytest
-import pytest_asyncio
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.models.ai_development import CategoryType
 from backend.app.services.feed import parse_time_window
@@ -21,36 +20,6 @@ class FixedDatetime:
         return FIXED_NOW.replace(tzinfo=None)
 
 
-@pytest_asyncio.fixture
-async def async_session():
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async_session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    async with engine.begin() as conn:
-        await conn.execute(
-            text(
-                """
-                CREATE TABLE ai_developments (
-                    id TEXT PRIMARY KEY,
-                    source_id TEXT,
-                    source_type TEXT,
-                    category TEXT NOT NULL,
-                    title TEXT,
-                    url TEXT,
-                    publisher TEXT,
-                    published_at TIMESTAMP NOT NULL,
-                    ingested_at TIMESTAMP NOT NULL,
-                    language TEXT,
-                    jurisdiction TEXT,
-                    confidence FLOAT
-                )
-                """
-            )
-        )
-    async with async_session_factory() as session:
-        yield session
-    await engine.dispose()
-
-
 @pytest.fixture(autouse=True)
 def freeze_time(monkeypatch):
     monkeypatch.setattr("backend.app.services.stats.datetime", FixedDatetime)
@@ -0,0 +1,75 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models.stats_rollup import StatsHourlyRollup
+from backend.app.services.stats import fetch_dimension_hhi
+
+FIXED_NOW = datetime(2026, 2, 17, 12, 0, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_hhi_covers_the_full_distribution(async_session: AsyncSession):
+    insert_sql = text(
+        """
+        INSERT INTO ai_developments
+        (id, source_id, source_type, category, title, url, publisher, published_at, ingested_at, language, jurisdiction, confidence)
+        VALUES (:id, :id, 'media', 'news', 'test', 'https://example.com', :publisher, :published_at, :published_at, 'en', 'Canada', 0.9)
+        """
+    )
+    published_at = FIXED_NOW - timedelta(minutes=30)
+    publishers = ["big"] * 10 + [f"tail-{index:02d}" for index in range(10)]
+    for publisher in publishers:
+        await async_session.execute(
+            insert_sql,
+            {"id": str(uuid.uuid4()), "publisher": publisher, "published_at": published_at},
+        )
+    await async_session.commit()
+
+    result = await fetch_dimension_hhi(
+        async_session,
+        dimensions=["publisher"],
+        since=FIXED_NOW - timedelta(hours=1),
+        now=FIXED_NOW,
+    )
+
+    publisher = result["publisher"]
+    # (10/20)^2 + 10 * (1/20)^2 -- a top-8 sample would report 0.5 + 7/400.
+    assert publisher["hhi"] == 0.275
+    assert publisher["groups"] == 11
+    assert publisher["total"] == 20
+    assert publisher["top"][0] == {"name": "big", "count": 10}
+    assert len(publisher["top"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_hhi_from_rollups_sums_hours(async_session: AsyncSession):
+    await async_session.run_sync(lambda sync_session: StatsHourlyRollup.__table__.create(sync_session.connection()))
+    for hours_ago, jurisdiction, count in [(2, "Ontario", 3), (5, "Ontario", 3), (3, "Quebec", 2)]:
+        async_session.add(
+            StatsHourlyRollup(
+                bucket=FIXED_NOW - timedelta(hours=hours_ago),
+                category="news",
+                jurisdiction=jurisdiction,
+                publisher="pytest",
+                source_type="media",
+                language="en",
+                item_count=count,
+                confidence_sum=count * 0.8,
+            )
+        )
+    await async_session.commit()
+
+    result = await fetch_dimension_hhi(
+        async_session,
+        dimensions=["jurisdiction"],
+        since=FIXED_NOW - timedelta(hours=24),
+        now=FIXED_NOW,
+        source="rollup",
+    )
+
+    assert result["jurisdiction"]["hhi"] == round((6 / 8) ** 2 + (2 / 8) ** 2, 4)
+    assert result["jurisdiction"]["top"] == [{"name": "Ontario", "count": 6}, {"name": "Quebec", "count": 2}]
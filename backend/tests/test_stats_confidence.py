@@ -0,0 +1,129 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models.stats_rollup import StatsHourlyRollup
+from backend.app.services.rollups import confidence_bin, rollup_deltas
+from backend.app.services.stats import _histogram_percentiles, fetch_confidence_profile
+
+FIXED_NOW = datetime(2026, 2, 17, 12, 30, tzinfo=UTC)
+
+
+class FixedDatetime:
+    @classmethod
+    def now(cls, tz=None):
+        if tz:
+            return FIXED_NOW
+        return FIXED_NOW.replace(tzinfo=None)
+
+
+@pytest.fixture(autouse=True)
+def freeze_time(monkeypatch):
+    monkeypatch.setattr("backend.app.services.stats.datetime", FixedDatetime)
+
+
+@pytest.mark.asyncio
+async def test_rollup_profile_rebins_and_splits(async_session: AsyncSession):
+    await async_session.run_sync(lambda sync_session: StatsHourlyRollup.__table__.create(sync_session.connection()))
+    published_at = datetime(2026, 2, 16, 9, 10, tzinfo=UTC)
+    rows = [
+        {"source_type": "media", "confidence": 0.92},
+        {"source_type": "media", "confidence": 0.88},
+        {"source_type": "media", "confidence": 0.72},
+        {"source_type": "academic", "confidence": 0.55},
+        {"source_type": "academic", "confidence": 0.2},
+    ]
+    for delta in rollup_deltas(
+        [
+            {
+                "published_at": published_at,
+                "category": "news",
+                "jurisdiction": "Canada",
+                "publisher": "pytest",
+                "language": "en",
+                **row,
+            }
+            for row in rows
+        ]
+    ):
+        async_session.add(StatsHourlyRollup(**delta))
+    await async_session.commit()
+
+    response = await fetch_confidence_profile(async_session, time_window="7d", bins=4, split_by="source_type")
+
+    assert response["source"] == "rollup"
+    assert response["total"] == 5
+    assert [item["count"] for item in response["histogram"]] == [1, 0, 2, 2]
+    assert {item["name"]: item["count"] for item in response["buckets"]} == {
+        "very_high": 2,
+        "high": 1,
+        "medium": 1,
+        "low": 1,
+    }
+    assert [group["name"] for group in response["groups"]] == ["media", "academic"]
+    assert response["groups"][0]["total"] == 3
+    assert 0.85 <= response["groups"][0]["percentiles"]["p50"] <= 0.9
+
+
+@pytest.mark.asyncio
+async def test_rollup_profile_rejects_bins_that_do_not_align(async_session: AsyncSession):
+    with pytest.raises(ValueError):
+        await fetch_confidence_profile(async_session, time_window="7d", bins=3, source="rollup")
+
+
+@pytest.mark.asyncio
+async def test_raw_and_rollup_profiles_count_the_same_rows(live_pg_session: AsyncSession):
+    await live_pg_session.execute(
+        text(
+            "CREATE TEMP TABLE ai_developments "
+            "(published_at TIMESTAMPTZ NOT NULL, confidence FLOAT, source_type TEXT, publisher TEXT)"
+        )
+    )
+    await live_pg_session.execute(
+        text(
+            "CREATE TEMP TABLE stats_hourly_rollups (bucket TIMESTAMPTZ, category TEXT, jurisdiction TEXT, "
+            "publisher TEXT, source_type TEXT, language TEXT, confidence_bin SMALLINT, "
+            "item_count INTEGER, confidence_sum FLOAT)"
+        )
+    )
+    rows = [
+        {"published_at": FIXED_NOW - timedelta(days=2), "confidence": 0.91},
+        {"published_at": FIXED_NOW - timedelta(hours=5), "confidence": 0.62},
+        {"published_at": FIXED_NOW - timedelta(hours=5), "confidence": 0.3},
+        # Future-dated: outside the window on both paths.
+        {"published_at": FIXED_NOW + timedelta(days=3), "confidence": 0.8},
+    ]
+    for row in rows:
+        await live_pg_session.execute(
+            text(
+                "INSERT INTO ai_developments (published_at, confidence, source_type, publisher) "
+                "VALUES (:published_at, :confidence, 'media', 'pytest')"
+            ),
+            row,
+        )
+    dimensions = {"category": "news", "jurisdiction": "Canada", "publisher": "pytest", "source_type": "media", "language": "en"}
+    for delta in rollup_deltas([{**row, **dimensions} for row in rows]):
+        await live_pg_session.execute(
+            text(
+                "INSERT INTO stats_hourly_rollups VALUES (:bucket, :category, :jurisdiction, :publisher, "
+                ":source_type, :language, :confidence_bin, :item_count, :confidence_sum)"
+            ),
+            delta,
+        )
+
+    raw = await fetch_confidence_profile(live_pg_session, time_window="7d", bins=4, source="raw")
+    rollup = await fetch_confidence_profile(live_pg_session, time_window="7d", bins=4, source="rollup")
+
+    assert raw["total"] == rollup["total"] == 3
+    assert [item["count"] for item in raw["histogram"]] == [item["count"] for item in rollup["histogram"]]
+    assert raw["buckets"] == rollup["buckets"]
+
+
+def test_histogram_percentiles_interpolate_within_bins():
+    counts = [0] * 20
+    counts[10] = 10
+    assert _histogram_percentiles(counts, (0.1, 0.5, 0.9)) == pytest.approx([0.505, 0.525, 0.545])
+    assert confidence_bin(1.0) == 19
+    assert confidence_bin(0.0) == 0
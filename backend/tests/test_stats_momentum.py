@@ -0,0 +1,73 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.services.stats import fetch_momentum, fetch_windowed_counts
+
+FIXED_NOW = datetime(2026, 2, 17, 12, 0, tzinfo=UTC)
+
+
+class FixedDatetime:
+    @classmethod
+    def now(cls, tz=None):
+        if tz:
+            return FIXED_NOW
+        return FIXED_NOW.replace(tzinfo=None)
+
+
+@pytest.fixture(autouse=True)
+def freeze_time(monkeypatch):
+    monkeypatch.setattr("backend.app.services.stats.datetime", FixedDatetime)
+
+
+async def _persist(session: AsyncSession, *, publisher: str, published_at: datetime, count: int) -> None:
+    insert_sql = text(
+        """
+        INSERT INTO ai_developments
+        (id, source_id, source_type, category, title, url, publisher, published_at, ingested_at, language, jurisdiction, confidence)
+        VALUES (:id, :source_id, 'media', 'news', 'test', 'https://example.com', :publisher, :published_at, :published_at, 'en', 'Canada', 0.9)
+        """
+    )
+    for idx in range(count):
+        await session.execute(
+            insert_sql,
+            {
+                "id": str(uuid.uuid4()),
+                "source_id": f"{publisher}-{idx}",
+                "publisher": publisher,
+                "published_at": published_at,
+            },
+        )
+    await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_momentum_keeps_baseline_for_publishers_outside_top_rows(async_session: AsyncSession):
+    current_mid = FIXED_NOW - timedelta(minutes=30)
+    previous_mid = FIXED_NOW - timedelta(minutes=90)
+    for index in range(45):
+        await _persist(async_session, publisher=f"busy-{index:02d}", published_at=current_mid, count=2)
+    await _persist(async_session, publisher="steady", published_at=current_mid, count=1)
+    await _persist(async_session, publisher="steady", published_at=previous_mid, count=6)
+
+    response = await fetch_momentum(async_session, time_window="1h", limit=20, dimensions=["publisher"])
+
+    steady = next(item for item in response["publishers"] if item["name"] == "steady")
+    assert steady["current"] == 1
+    assert steady["previous"] == 6
+    assert steady["change"] == -5
+    assert response["publishers"][0]["name"] == "steady"
+
+
+@pytest.mark.asyncio
+async def test_windowed_counts_cover_every_window(async_session: AsyncSession):
+    for offset, count in [(150, 1), (90, 2), (30, 3)]:
+        await _persist(async_session, publisher="pytest", published_at=FIXED_NOW - timedelta(minutes=offset), count=count)
+
+    windows = [(FIXED_NOW - timedelta(hours=hours), FIXED_NOW - timedelta(hours=hours - 1)) for hours in (3, 2, 1)]
+    counts = await fetch_windowed_counts(async_session, dimensions=["publisher"], windows=windows)
+
+    assert counts["publisher"]["pytest"] == [1, 2, 3]
@@ -0,0 +1,143 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models.stats_rollup import StatsHourlyRollup
+from backend.app.services.rollups import rollup_deltas
+from backend.app.services.stats_query import (
+    StatsQuery,
+    resolve_query_source,
+    run_stats_query,
+    validate_stats_query,
+)
+
+FIXED_NOW = datetime(2026, 2, 17, 12, 30, tzinfo=UTC)
+
+
+class FixedDatetime:
+    @classmethod
+    def now(cls, tz=None):
+        if tz:
+            return FIXED_NOW
+        return FIXED_NOW.replace(tzinfo=None)
+
+
+@pytest.fixture(autouse=True)
+def freeze_time(monkeypatch):
+    monkeypatch.setattr("backend.app.services.stats_query.datetime", FixedDatetime)
+
+
+async def _seed_rollups(session: AsyncSession) -> None:
+    await session.run_sync(lambda sync_session: StatsHourlyRollup.__table__.create(sync_session.connection()))
+    bucket = datetime(2026, 2, 16, 9, 0, tzinfo=UTC)
+    for publisher, count in [("BetaKit", 6), ("Mila", 4), ("CIFAR", 1)]:
+        session.add(
+            StatsHourlyRollup(
+                bucket=bucket,
+                category="news",
+                jurisdiction="Canada",
+                publisher=publisher,
+                source_type="media",
+                language="en",
+                item_count=count,
+                confidence_sum=count * 0.9,
+            )
+        )
+    session.add(
+        StatsHourlyRollup(
+            bucket=bucket - timedelta(days=30),
+            category="news",
+            jurisdiction="Canada",
+            publisher="Outside",
+            source_type="media",
+            language="en",
+            item_count=50,
+            confidence_sum=45.0,
+        )
+    )
+    await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_rollup_query_limits_groups_and_reports_total(async_session: AsyncSession):
+    await _seed_rollups(async_session)
+
+    response = await run_stats_query(
+        async_session,
+        StatsQuery(group_by=("publisher",), time_window="7d", limit=2),
+    )
+
+    assert response["source"] == "rollup"
+    assert response["truncated"] is True
+    assert response["total"] == 11
+    assert [row["publisher"] for row in response["rows"]] == ["BetaKit", "Mila"]
+    assert response["rows"][0]["avg_confidence"] == 0.9
+
+
+@pytest.mark.asyncio
+async def test_raw_query_applies_filters(async_session: AsyncSession):
+    insert_sql = text(
+        """
+        INSERT INTO ai_developments
+        (id, source_id, source_type, category, title, url, publisher, published_at, ingested_at, language, jurisdiction, confidence)
+        VALUES (:id, :id, 'media', :category, 'test', 'https://example.com', 'pytest', :published_at, :published_at, 'en', 'Canada', 0.8)
+        """
+    )
+    published_at = FIXED_NOW - timedelta(minutes=20)
+    for category in ["policy", "policy", "news"]:
+        await async_session.execute(
+            insert_sql,
+            {"id": str(uuid.uuid4()), "category": category, "published_at": published_at},
+        )
+    await async_session.commit()
+
+    response = await run_stats_query(
+        async_session,
+        StatsQuery(group_by=("publisher",), time_window="1h", filters={"category": "policy"}),
+    )
+
+    assert response["source"] == "raw"
+    assert response["rows"] == [{"publisher": "pytest", "count": 2, "avg_confidence": 0.8}]
+
+
+def test_query_validation_enforces_cardinality():
+    with pytest.raises(ValueError):
+        validate_stats_query(StatsQuery(group_by=("publisher",), time_window="5y", bucket="hour"))
+    with pytest.raises(ValueError):
+        validate_stats_query(StatsQuery(group_by=("entities",)))
+    with pytest.raises(ValueError, match="category must be one of"):
+        validate_stats_query(StatsQuery(filters={"category": "foo"}))
+    with pytest.raises(ValueError, match="source_type must be one of"):
+        validate_stats_query(StatsQuery(filters={"source_type": "blog"}))
+    validate_stats_query(StatsQuery(filters={"category": "policy", "source_type": "gov", "publisher": "Mila"}))
+    validate_stats_query(StatsQuery(group_by=("category", "jurisdiction"), time_window="1y", bucket="week"))
+
+
+def test_resolve_query_source():
+    assert resolve_query_source("auto", "1h") == "raw"
+    assert resolve_query_source("auto", "24h") == "rollup"
+    assert resolve_query_source("raw", "1y") == "raw"
+    with pytest.raises(ValueError):
+        resolve_query_source("cache", "7d")
+
+
+def test_rollup_deltas_collapse_rows_by_hour():
+    published_at = datetime(2026, 2, 16, 9, 15, tzinfo=UTC)
+    row = {
+        "published_at": published_at,
+        "category": "news",
+        "jurisdiction": "Canada",
+        "publisher": "BetaKit",
+        "source_type": "media",
+        "language": "en",
+        "confidence": 0.5,
+    }
+    deltas = rollup_deltas([row, {**row, "published_at": published_at + timedelta(minutes=30)}], sign=-1)
+
+    assert len(deltas) == 1
+    assert deltas[0]["bucket"] == datetime(2026, 2, 16, 9, 0, tzinfo=UTC)
+    assert deltas[0]["item_count"] == -2
+    assert deltas[0]["confidence_sum"] == -1.0
@@ -0,0 +1,45 @@
+import httpx
+import pytest
+
+from workers.app.xml_stream import collect_elements, iter_elements
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss><channel><title>Feed</title>
+<item><title>First</title><guid>1</guid></item>
+<item><title>Second</title><guid>2</guid></item>
+<item><title>Third</title><guid>3</guid></item>
+</channel></rss>"""
+
+ENTITY_BOMB = b"""<?xml version="1.0"?>
+<!DOCTYPE rss [<!ENTITY a "aaaaaaaaaa"><!ENTITY b "&a;&a;&a;&a;&a;&a;&a;&a;">]>
+<rss><channel><item><title>&b;</title></item></channel></rss>"""
+
+
+class _ChunkedBody(httpx.AsyncByteStream):
+    def __init__(self, body: bytes, chunk_size: int) -> None:
+        self.body = body
+        self.chunk_size = chunk_size
+        self.sent = 0
+
+    async def __aiter__(self):
+        for start in range(0, len(self.body), self.chunk_size):
+            self.sent += 1
+            yield self.body[start : start + self.chunk_size]
+
+
+@pytest.mark.asyncio
+async def test_collect_elements_stops_reading_once_limit_is_reached():
+    body = _ChunkedBody(FEED, chunk_size=16)
+    response = httpx.Response(200, stream=body)
+
+    items = await collect_elements(response, {"item"}, limit=2)
+
+    assert [item.findtext("title") for item in items] == ["First", "Second"]
+    assert body.sent < -(-len(FEED) // 16)
+
+
+@pytest.mark.asyncio
+async def test_iter_elements_refuses_entity_expansion():
+    response = httpx.Response(200, stream=_ChunkedBody(ENTITY_BOMB, chunk_size=64))
+
+    assert [element async for element in iter_elements(response, {"item"})] == []
@@ -431,7 +431,22 @@ export function DashboardPage({ scope, initialTimeWindow = "7d", initialMode }:
         return;
       }
     };
+    const progressHandler = (event: MessageEvent) => {
+      try {
+        const status = JSON.parse(event.data) as BackfillStatus;
+        setBackfillStatus(status);
+        setIsBackfillRunning(["queued", "running"].includes(status.state));
+      } catch {
+        return;
+      }
+    };
+    // Historical inserts only invalidate aggregates; reload them instead of adding feed items.
+    const invalidatedHandler = () => {
+      refreshData().catch(() => undefined);
+    };
     source.addEventListener("new_item", handler);
+    source.addEventListener("backfill_progress", progressHandler);
+    source.addEventListener("rollups_invalidated", invalidatedHandler);
     return () => source.close();
   }, [scope, category, jurisdiction, language, debouncedSearch, timeWindow]);
 
@@ -464,7 +479,7 @@ export function DashboardPage({ scope, initialTimeWindow = "7d", initialMode }:
         if (!mounted) return;
         if (results[0].status === "fulfilled") {
           setBackfillStatus(results[0].value);
-          setIsBackfillRunning(results[0].value.state === "running");
+          setIsBackfillRunning(["queued", "running"].includes(results[0].value.state));
         }
         if (results[1].status === "fulfilled") {
           const sources = results[1].value;
@@ -78,8 +78,10 @@ export const SidebarHistory = memo(function SidebarHistory({
   // Backfill local state
   const [backfillStartDate, setBackfillStartDate] = useState("2022-11-01");
   const [backfillEndDate, setBackfillEndDate] = useState("");
-  const [backfillPerPage, setBackfillPerPage] = useState(50);
-  const [backfillPagesPerMonth, setBackfillPagesPerMonth] = useState(1);
+  const [backfillPerPage, setBackfillPerPage] = useState(200);
+  const [backfillPagesPerMonth, setBackfillPagesPerMonth] = useState<
+    number | undefined
+  >(undefined);
   const [isBackfillSubmitting, setIsBackfillSubmitting] = useState(false);
   const [backfillError, setBackfillError] = useState("");
 
@@ -106,7 +108,7 @@ export const SidebarHistory = memo(function SidebarHistory({
     return t("cleanup.idle");
   })();
 
-  async function startBackfill() {
+  async function startBackfill(resumeJobId?: string) {
     setIsBackfillSubmitting(true);
     setBackfillError("");
     try {
@@ -115,6 +117,7 @@ export const SidebarHistory = memo(function SidebarHistory({
         end_date: backfillEndDate || undefined,
         per_page: backfillPerPage,
         max_pages_per_month: backfillPagesPerMonth,
+        job_id: resumeJobId,
       });
       onBackfillStarted();
       if (response.status !== "queued") {
@@ -265,7 +268,7 @@ export const SidebarHistory = memo(function SidebarHistory({
                 max={200}
                 value={backfillPerPage}
                 onChange={(e) =>
-                  setBackfillPerPage(Number(e.target.value || 50))
+                  setBackfillPerPage(Number(e.target.value || 200))
                 }
                 className="rounded-lg border border-borderSoft bg-bg px-2 py-1.5"
               />
@@ -277,10 +280,12 @@ export const SidebarHistory = memo(function SidebarHistory({
               <input
                 type="number"
                 min={1}
-                max={10}
-                value={backfillPagesPerMonth}
+                value={backfillPagesPerMonth ?? ""}
+                placeholder={t("backfill.allPages")}
                 onChange={(e) =>
-                  setBackfillPagesPerMonth(Number(e.target.value || 1))
+                  setBackfillPagesPerMonth(
+                    e.target.value ? Number(e.target.value) : undefined,
+                  )
                 }
                 className="rounded-lg border border-borderSoft bg-bg px-2 py-1.5"
               />
@@ -290,13 +295,24 @@ export const SidebarHistory = memo(function SidebarHistory({
             <span className="rounded-lg bg-surfaceInset px-3 py-1.5">
               {backfillStateLabel}
             </span>
-            <button
-              onClick={startBackfill}
-              disabled={isBackfillRunning || isBackfillSubmitting}
-              className="btn-secondary disabled:cursor-not-allowed disabled:opacity-60"
-            >
-              {t("backfill.run")}
-            </button>
+            <div className="flex items-center gap-2">
+              {backfillStatus?.state === "failed" && backfillStatus.job_id && (
+                <button
+                  onClick={() => startBackfill(backfillStatus.job_id)}
+                  disabled={isBackfillRunning || isBackfillSubmitting}
+                  className="btn-secondary disabled:cursor-not-allowed disabled:opacity-60"
+                >
+                  {t("backfill.resume")}
+                </button>
+              )}
+              <button
+                onClick={() => startBackfill()}
+                disabled={isBackfillRunning || isBackfillSubmitting}
+                className="btn-secondary disabled:cursor-not-allowed disabled:opacity-60"
+              >
+                {t("backfill.run")}
+              </button>
+            </div>
           </div>
           <div className="mt-2 grid grid-cols-2 gap-2 text-caption text-textSecondary">
             <span>
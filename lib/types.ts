@@ -59,16 +59,19 @@ export interface BackfillRunRequest {
   start_date: string;
   end_date?: string;
   per_page: number;
-  max_pages_per_month: number;
+  max_pages_per_month?: number;
+  job_id?: string;
 }
 
 export interface BackfillRunResponse {
   status: string;
   task_id: string;
+  job_id: string;
 }
 
 export interface BackfillStatus {
-  state: "idle" | "running" | "completed" | "failed" | string;
+  job_id?: string;
+  state: "idle" | "queued" | "running" | "completed" | "failed" | string;
   started_at?: string;
   finished_at?: string;
   failed_at?: string;
@@ -76,6 +79,8 @@ export interface BackfillStatus {
   start_date?: string;
   end_date?: string;
   current_month?: string;
+  months_total?: number;
+  months_completed?: number;
   scanned?: number;
   inserted?: number;
   error?: string;
@@ -100,6 +105,10 @@ export interface SourceHealthEntry {
   duration_ms: number;
   last_run: string;
   error: string;
+  cadence_minutes?: number;
+  interval_minutes?: number;
+  yield_per_hour?: number | null;
+  next_run_at?: string | null;
 }
 
 export interface SourcesHealthResponse {
@@ -154,6 +163,20 @@ export interface StatsAlertItem {
   trigger_reason?: "delta" | "z_score" | "hybrid";
 }
 
+export interface StatsSeriesAlertItem {
+  series: string;
+  dimension: "category" | "publisher" | "jurisdiction" | "entity";
+  name: string;
+  direction: "up" | "down";
+  severity: "medium" | "high";
+  bucket: string;
+  current: number;
+  baseline_mean: number;
+  baseline_stddev: number;
+  z_score: number;
+  flagged_at: string;
+}
+
 export interface StatsAlertsResponse {
   generated_at: string;
   time_window: TimeWindow;
@@ -162,6 +185,7 @@ export interface StatsAlertsResponse {
   min_z_score: number;
   lookback_windows: number;
   alerts: StatsAlertItem[];
+  series_alerts?: StatsSeriesAlertItem[];
 }
 
 export interface StatsBriefPoint {
@@ -202,12 +226,33 @@ export interface ConfidenceBucket {
   percent: number;
 }
 
+export interface ConfidenceHistogramBin {
+  lower: number;
+  upper: number;
+  count: number;
+  percent: number;
+}
+
+export interface ConfidenceGroupProfile {
+  name: string;
+  total: number;
+  average_confidence: number;
+  percentiles: Record<string, number>;
+  histogram: ConfidenceHistogramBin[];
+}
+
 export interface ConfidenceProfileResponse {
   generated_at: string;
   time_window: TimeWindow;
   total: number;
   average_confidence: number;
   buckets: ConfidenceBucket[];
+  source?: "rollup" | "raw";
+  bins?: number;
+  percentiles?: Record<string, number>;
+  histogram?: ConfidenceHistogramBin[];
+  split_by?: "source_type" | "publisher" | null;
+  groups?: ConfidenceGroupProfile[];
 }
 
 export interface ConcentrationPoint {
@@ -215,9 +260,18 @@ export interface ConcentrationPoint {
   count: number;
 }
 
+export interface DimensionConcentration {
+  hhi: number;
+  level: "low" | "medium" | "high";
+  total: number;
+  groups: number;
+  top: ConcentrationPoint[];
+}
+
 export interface ConcentrationResponse {
   generated_at: string;
   time_window: TimeWindow;
+  source?: "rollup" | "raw";
   total: number;
   source_hhi: number;
   source_level: "low" | "medium" | "high";
@@ -229,6 +283,7 @@ export interface ConcentrationResponse {
   combined_level: "low" | "medium" | "high";
   top_sources: ConcentrationPoint[];
   top_jurisdictions: ConcentrationPoint[];
+  dimensions?: Record<"category" | "publisher" | "jurisdiction" | "language" | "source_type", DimensionConcentration>;
 }
 
 export interface MomentumItem {
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import hashlib
+from collections.abc import AsyncIterator, Mapping
 from datetime import UTC, date, datetime
 from typing import Any
 from uuid import uuid4
 
 import httpx
 
+from workers.app.normalize import normalize_items
+from workers.app.rate_limit import limited_get
 from workers.app.source_adapters import (
     _canada_relevance_score,
     _clamp_future_date,
@@ -14,31 +17,18 @@ from workers.app.source_adapters import (
     _detect_language,
     _extract_tags,
     _infer_jurisdiction,
+    _openalex_params,
 )
 
 OPENALEX_URL = "https://api.openalex.org/works"
 
 
-def month_windows(start: date, end: date) -> list[tuple[date, date]]:
-    windows: list[tuple[date, date]] = []
-    current = date(start.year, start.month, 1)
-    while current <= end:
-        if current.month == 12:
-            next_month = date(current.year + 1, 1, 1)
-        else:
-            next_month = date(current.year, current.month + 1, 1)
-        month_end = min(end, date(next_month.year, next_month.month, 1))
-        windows.append((current, month_end))
-        current = next_month
-    return windows
-
-
 def _fingerprint(source_id: str, url: str, published_at: datetime) -> str:
     material = f"{source_id}|{url}|{published_at.isoformat()}".encode("utf-8")
     return hashlib.sha256(material).hexdigest()
 
 
-def _to_record(result: dict[str, Any]) -> dict[str, Any] | None:
+def _to_record(result: Mapping[str, Any]) -> dict[str, Any] | None:
     title = result.get("display_name") or ""
     if not title or not _contains_ai(title):
         return None
@@ -88,35 +78,45 @@ def _to_record(result: dict[str, Any]) -> dict[str, Any] | None:
     }
 
 
-async def fetch_openalex_month(
+async def iter_openalex_month(
+    client: httpx.AsyncClient,
     *,
     start_date: date,
     end_date: date,
-    per_page: int = 100,
-    max_pages: int = 5,
-) -> list[dict[str, Any]]:
-    params_base = {
-        "filter": (
-            f"from_publication_date:{start_date.isoformat()},"
-            f"to_publication_date:{end_date.isoformat()},"
-            "authorships.institutions.country_code:CA"
-        ),
-        "search": "artificial intelligence OR machine learning OR generative",
-        "per-page": str(per_page),
-        "sort": "publication_date:desc",
-    }
-    records: list[dict[str, Any]] = []
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        for page in range(1, max_pages + 1):
-            params = {**params_base, "page": str(page)}
-            response = await client.get(OPENALEX_URL, params=params)
-            response.raise_for_status()
-            payload = response.json()
-            results = payload.get("results", [])
-            if not results:
-                break
-            for item in results:
-                normalized = _to_record(item)
-                if normalized:
-                    records.append(normalized)
-    return records
+    per_page: int = 200,
+    max_pages: int | None = None,
+    cursor: str = "*",
+) -> AsyncIterator[tuple[list[dict[str, Any]], str | None, int]]:
+    """Yield one month's normalized records a page at a time, as each page arrives.
+
+    Pages follow OpenAlex's ``cursor`` from ``cursor`` until the month is
+    exhausted, or for ``max_pages`` pages when a cap is given. Each page comes
+    with the cursor of the page after it (None once the month is exhausted),
+    so a caller can checkpoint and resume mid-month, and with the number of
+    works fetched, before normalization drops the ones that aren't about AI. Pages are normalized
+    with :func:`normalize_items`, off the event loop when a pool is configured.
+    """
+    params_base = _openalex_params(
+        {
+            "filter": (
+                f"from_publication_date:{start_date.isoformat()},"
+                f"to_publication_date:{end_date.isoformat()},"
+                "authorships.institutions.country_code:CA"
+            ),
+            "search": "artificial intelligence OR machine learning OR generative",
+            "per-page": str(per_page),
+            "sort": "publication_date:desc",
+        }
+    )
+    page_cursor: str | None = cursor
+    pages = 0
+    while page_cursor and (max_pages is None or pages < max_pages):
+        response = await limited_get(client, OPENALEX_URL, params={**params_base, "cursor": page_cursor})
+        response.raise_for_status()
+        payload = response.json()
+        results = payload.get("results", [])
+        if not results:
+            break
+        pages += 1
+        page_cursor = (payload.get("meta") or {}).get("next_cursor")
+        yield await normalize_items(_to_record, results), page_cursor, len(results)
@@ -1,18 +1,25 @@
 from celery import Celery
 
 from backend.app.core.config import settings
-from workers.app.source_registry import list_source_definitions
 
 
-def _build_source_beat_schedule() -> dict[str, dict[str, object]]:
-    schedule: dict[str, dict[str, object]] = {}
-    for source in list_source_definitions(include_disabled=False):
-        schedule[f"ingest-{source.key}-every-{source.cadence_minutes}m"] = {
-            "task": "workers.app.tasks.ingest_source_developments",
-            "schedule": float(source.cadence_minutes * 60),
-            "kwargs": {"source_key": source.key},
-        }
-    return schedule
+def _build_beat_schedule() -> dict[str, dict[str, object]]:
+    # Sources are dispatched from source_states.next_run_at rather than fixed per-source entries.
+    return {
+        "dispatch-due-sources-every-1m": {
+            "task": "workers.app.tasks.dispatch_due_sources",
+            "schedule": 60.0,
+        },
+        "relay-event-outbox-every-1m": {
+            "task": "workers.app.tasks.relay_event_outbox",
+            "schedule": 60.0,
+        },
+        # Silent series only fold their empty hours (and raise drop alerts) when closed here.
+        "close-idle-alert-series-every-5m": {
+            "task": "workers.app.tasks.close_idle_alert_series",
+            "schedule": 300.0,
+        },
+    }
 
 
 celery_app = Celery("ai_pulse_worker")
@@ -21,6 +28,8 @@ celery_app.conf.update(
     result_backend="redis://redis:6379/1",
     timezone="UTC",
     enable_utc=True,
-    beat_schedule=_build_source_beat_schedule(),
+    beat_schedule=_build_beat_schedule(),
+    # Backfill runs on its own solo worker, whose main process can start the normalization pool.
+    task_routes={"workers.app.tasks.backfill_openalex_history": {"queue": "backfill"}},
 )
 celery_app.autodiscover_tasks(["workers.app"])
@@ -0,0 +1,118 @@
+import json
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+import httpx
+
+from workers.app.rate_limit import limited_get, limited_stream
+
+
+@dataclass(slots=True)
+class ConditionalState:
+    """HTTP validators for one source run, keyed by request URL."""
+
+    etags: dict[str, str] = field(default_factory=dict)
+    last_modified: dict[str, str] = field(default_factory=dict)
+    requested: set[str] = field(default_factory=set)
+    not_modified: set[str] = field(default_factory=set)
+
+    @property
+    def unchanged(self) -> bool:
+        return bool(self.requested) and self.not_modified == self.requested
+
+    def encode(self) -> tuple[str | None, str | None]:
+        # Only URLs requested this run are kept, so changing query strings don't accumulate.
+        etags = {url: value for url, value in self.etags.items() if url in self.requested}
+        last_modified = {url: value for url, value in self.last_modified.items() if url in self.requested}
+        return (
+            json.dumps(etags, sort_keys=True) if etags else None,
+            json.dumps(last_modified, sort_keys=True) if last_modified else None,
+        )
+
+
+_conditional_state: ContextVar[ConditionalState | None] = ContextVar("conditional_state", default=None)
+
+
+def _decode(raw: str | None) -> dict[str, str]:
+    if not raw:
+        return {}
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        return {}
+    return {str(url): str(validator) for url, validator in value.items()} if isinstance(value, dict) else {}
+
+
+@contextmanager
+def conditional_requests(etag: str | None, last_modified: str | None) -> Iterator[ConditionalState]:
+    """Make ``conditional_get`` calls in this context send and collect validators."""
+    state = ConditionalState(etags=_decode(etag), last_modified=_decode(last_modified))
+    token = _conditional_state.set(state)
+    try:
+        yield state
+    finally:
+        _conditional_state.reset(token)
+
+
+def _request_headers(state: ConditionalState | None, key: str, headers: Mapping[str, str] | None) -> dict[str, str]:
+    request_headers = dict(headers or {})
+    if state is not None:
+        state.requested.add(key)
+        if key in state.etags:
+            request_headers["If-None-Match"] = state.etags[key]
+        if key in state.last_modified:
+            request_headers["If-Modified-Since"] = state.last_modified[key]
+    return request_headers
+
+
+def _checked(state: ConditionalState | None, key: str, response: httpx.Response) -> httpx.Response | None:
+    if response.status_code == 304 and state is not None:
+        state.not_modified.add(key)
+        return None
+    response.raise_for_status()
+
+    if state is not None:
+        for validators, header in ((state.etags, "ETag"), (state.last_modified, "Last-Modified")):
+            value = response.headers.get(header)
+            if value:
+                validators[key] = value
+            else:
+                validators.pop(key, None)
+    return response
+
+
+async def conditional_get(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    params: Mapping[str, str] | None = None,
+    headers: Mapping[str, str] | None = None,
+) -> httpx.Response | None:
+    """GET ``url``, returning None on ``304 Not Modified``.
+
+    Outside ``conditional_requests`` this is a plain GET. Errors other than
+    304 are raised as ``httpx.HTTPStatusError``.
+    """
+    state = _conditional_state.get()
+    key = str(httpx.URL(url, params=params))
+    request_headers = _request_headers(state, key, headers)
+    response = await limited_get(client, url, params=params, headers=request_headers or None)
+    return _checked(state, key, response)
+
+
+@asynccontextmanager
+async def conditional_stream(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    params: Mapping[str, str] | None = None,
+    headers: Mapping[str, str] | None = None,
+) -> AsyncIterator[httpx.Response | None]:
+    """``conditional_get`` with the body left unread, for parsing as it arrives."""
+    state = _conditional_state.get()
+    key = str(httpx.URL(url, params=params))
+    request_headers = _request_headers(state, key, headers)
+    async with limited_stream(client, url, params=params, headers=request_headers or None) as response:
+        yield _checked(state, key, response)
@@ -0,0 +1,57 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class SourceCursor:
+    """High-water mark for one source run.
+
+    ``value`` is what ``source_states.cursor`` held when the run started;
+    fetchers report progress through ``advance_cursor`` and the run stores
+    ``advanced`` only once its batch has committed.
+    """
+
+    value: str | None = None
+    advanced: str | None = None
+
+
+_source_cursor: ContextVar[SourceCursor | None] = ContextVar("source_cursor", default=None)
+
+
+@contextmanager
+def source_cursor(value: str | None) -> Iterator[SourceCursor]:
+    cursor = SourceCursor(value=value)
+    token = _source_cursor.set(cursor)
+    try:
+        yield cursor
+    finally:
+        _source_cursor.reset(token)
+
+
+def current_cursor() -> str | None:
+    cursor = _source_cursor.get()
+    return cursor.value if cursor is not None else None
+
+
+def advance_cursor(value: str | None) -> None:
+    """Record a new high-water mark; marks never move backwards within a run."""
+    cursor = _source_cursor.get()
+    if cursor is None or not value:
+        return
+    if cursor.value and value < cursor.value:
+        return
+    if cursor.advanced is None or value > cursor.advanced:
+        cursor.advanced = value
+
+
+def set_cursor(value: str) -> None:
+    """Record exactly ``value`` as the state to store, bypassing the forward-only check.
+
+    For fetchers whose cursor carries a resume position alongside the mark,
+    where the next state need not sort after the current one.
+    """
+    cursor = _source_cursor.get()
+    if cursor is not None and value:
+        cursor.advanced = value
@@ -0,0 +1,63 @@
+from collections.abc import Iterable, Mapping
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import redis.asyncio as redis
+
+SEEN_HASHES_KEY_PREFIX = "ingest:seen"
+SEEN_HASHES_RETENTION = timedelta(days=30)
+SEEN_HASHES_MAX = 20_000
+
+
+def _seen_key(source_key: str) -> str:
+    return f"{SEEN_HASHES_KEY_PREFIX}:{source_key}"
+
+
+async def filter_unseen(
+    client: redis.Redis,
+    source_key: str,
+    records: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], int]:
+    """Drop records whose hash this source has already stored.
+
+    One ``ZMSCORE`` call checks the whole batch against the per-source set of
+    recently stored hashes. The set only ever holds hashes known to be in
+    ``ai_developments``, so a miss just falls through to the ``ON CONFLICT``
+    insert; if Redis is unavailable every record is passed on.
+    """
+    if not records:
+        return records, 0
+    try:
+        scores = await client.zmscore(_seen_key(source_key), [str(record["hash"]) for record in records])
+    except Exception:
+        return records, 0
+
+    unseen = [record for record, score in zip(records, scores) if score is None]
+    return unseen, len(records) - len(unseen)
+
+
+async def remember_hashes(
+    client: redis.Redis,
+    source_key: str,
+    records: Iterable[Mapping[str, Any]],
+) -> None:
+    """Record hashes that are now in the database (inserted or conflicting).
+
+    Call only after the insert has committed. Scores are last-seen
+    timestamps, so hashes a feed keeps serving stay in the set while the rest
+    age out after ``SEEN_HASHES_RETENTION`` or past ``SEEN_HASHES_MAX`` entries.
+    """
+    now = datetime.now(UTC)
+    mapping = {str(record["hash"]): now.timestamp() for record in records}
+    if not mapping:
+        return
+    key = _seen_key(source_key)
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.zadd(key, mapping)
+            pipe.zremrangebyscore(key, "-inf", (now - SEEN_HASHES_RETENTION).timestamp())
+            pipe.zremrangebyrank(key, 0, -(SEEN_HASHES_MAX + 1))
+            pipe.expire(key, int(SEEN_HASHES_RETENTION.total_seconds()))
+            await pipe.execute()
+    except Exception:
+        pass
@@ -0,0 +1,98 @@
+import re
+from collections.abc import Iterable, Mapping
+
+PREFIX_MARKER = "*"
+# Plural and possessive endings a whole-word term still matches through: "AIs", "Canadians", "Canada's".
+# Checked in a lookahead so the match, and so the reported term, stays the bare term.
+WORD_END = r"(?=(?:'s|s|es)?\b)"
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """Render terms as one regex alternation factored on shared prefixes.
+
+    ``re`` tries alternatives one by one, so a flat ``a|b|c`` over dozens of
+    phrases re-reads the same leading characters for every candidate; the
+    factored form reads each character once per position.
+    """
+    trie: dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        optional = "" in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if optional else group
+
+    return render(trie)
+
+
+class KeywordMatcher:
+    """Match several keyword dictionaries against text in a single regex pass.
+
+    Terms match on word boundaries, so "ai" does not fire inside "said", but
+    through a plural or possessive ending, so "canadian" hits "Canadians". A
+    term ending in ``*`` matches as a word prefix, so "economi*" hits
+    "economics". A phrase that contains another dictionary's term as a whole
+    word also reports that term, so "university of alberta" still registers
+    "alberta" even though matches don't overlap.
+    """
+
+    __slots__ = ("names", "_pattern", "_reports", "_members")
+
+    def __init__(self, dictionaries: Mapping[str, Iterable[str]]) -> None:
+        self.names = tuple(dictionaries)
+        exact: set[str] = set()
+        prefixes: set[str] = set()
+        owners: dict[str, set[str]] = {}
+        for name, terms in dictionaries.items():
+            for raw in terms:
+                term = raw.strip().lower()
+                if term.endswith(PREFIX_MARKER):
+                    term = term[: -len(PREFIX_MARKER)]
+                    prefixes.add(term)
+                else:
+                    exact.add(term)
+                owners.setdefault(term, set()).add(name)
+
+        # Per dictionary: matchable term -> that dictionary's terms a match reports.
+        reports: dict[str, dict[str, frozenset[str]]] = {name: {} for name in self.names}
+        for term, names in owners.items():
+            for name in names:
+                reports[name][term] = frozenset({term})
+            for other in exact:
+                if other != term and re.search(rf"\b{re.escape(other)}\b", term):
+                    for name in owners[other]:
+                        reports[name][term] = reports[name].get(term, frozenset()) | {other}
+        self._reports = reports
+        self._members = {name: frozenset(name_reports) for name, name_reports in reports.items()}
+
+        alternatives = []
+        if exact:
+            alternatives.append(f"(?:{_trie_pattern(exact)}){WORD_END}")
+        if prefixes:
+            alternatives.append(f"(?:{_trie_pattern(prefixes)})")
+        self._pattern = re.compile(rf"\b(?:{'|'.join(alternatives)})" if alternatives else r"(?!)")
+
+    def scan(self, text: str) -> frozenset[str]:
+        """Distinct terms matched in ``text``, from one pass over its lowercase form."""
+        return frozenset(self._pattern.findall(text.lower()))
+
+    def has(self, matched: frozenset[str], name: str) -> bool:
+        return not self._members[name].isdisjoint(matched)
+
+    def hits(self, matched: Iterable[str], name: str) -> set[str]:
+        """Terms of dictionary ``name`` among ``matched`` scan results."""
+        reports = self._reports[name]
+        found: set[str] = set()
+        for term in matched:
+            if term in reports:
+                found |= reports[term]
+        return found
@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from workers.app.runtime import WorkerRuntime, active_runtime
+
+logger = logging.getLogger(__name__)
+
+# Large enough that pickling overhead stays small next to the regex work per chunk.
+NORMALIZE_CHUNK_SIZE = 50
+
+Normalizer = Callable[[Mapping[str, Any]], dict[str, Any] | None]
+
+
+def _normalize_chunk(normalize: Normalizer, items: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    return [record for item in items if (record := normalize(item)) is not None]
+
+
+async def normalize_items(
+    normalize: Normalizer,
+    items: Sequence[Mapping[str, Any]],
+    *,
+    pool: Executor | None = None,
+) -> list[dict[str, Any]]:
+    """Map raw API items to records with ``normalize``, dropping the ones it rejects.
+
+    With a process pool (``pool``, else the worker's ``normalize_processes``
+    pool) the items are split into ``NORMALIZE_CHUNK_SIZE`` chunks and
+    normalized across cores, so tokenizing and scoring a large page does not
+    stall the event loop. ``normalize`` must be a module-level function.
+    Without a pool, for a single chunk, or when the pool cannot run, it runs
+    inline. Record order follows item order either way.
+
+    A pool that fails to start or dies (a Celery prefork child is daemonic
+    and may not have children of its own) is reported once and, if it is the
+    worker's, left disabled for the rest of the process.
+    """
+    runtime = None
+    if pool is None:
+        runtime = active_runtime()
+        pool = runtime.normalize_pool() if runtime is not None else None
+    if pool is None or len(items) <= NORMALIZE_CHUNK_SIZE:
+        return _normalize_chunk(normalize, items)
+
+    loop = asyncio.get_running_loop()
+    chunks = [items[offset : offset + NORMALIZE_CHUNK_SIZE] for offset in range(0, len(items), NORMALIZE_CHUNK_SIZE)]
+    futures: list[asyncio.Future[list[dict[str, Any]]]] = []
+    try:
+        # Workers start on the first submit, so a pool that cannot start fails here,
+        # with the daemonic-process AssertionError rather than BrokenProcessPool.
+        for chunk in chunks:
+            futures.append(loop.run_in_executor(pool, _normalize_chunk, normalize, chunk))
+    except (AssertionError, OSError, RuntimeError) as exc:
+        for future in futures:
+            future.cancel()
+        return _normalize_inline(normalize, items, runtime, exc)
+    try:
+        results = await asyncio.gather(*futures)
+    except BrokenProcessPool as exc:
+        return _normalize_inline(normalize, items, runtime, exc)
+    return [record for chunk in results for record in chunk]
+
+
+def _normalize_inline(
+    normalize: Normalizer,
+    items: Sequence[Mapping[str, Any]],
+    runtime: WorkerRuntime | None,
+    exc: BaseException,
+) -> list[dict[str, Any]]:
+    if runtime is None or runtime.disable_normalize_pool():
+        logger.warning("Normalization pool unavailable, normalizing inline: %r", exc)
+    return _normalize_chunk(normalize, items)
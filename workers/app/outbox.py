@@ -0,0 +1,146 @@
+import asyncio
+import json
+from collections.abc import Iterable, Mapping
+from datetime import UTC, datetime, timedelta
+
+import asyncpg
+import redis.asyncio as redis
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.models.event_outbox import EventOutbox
+from backend.app.services.rollups import rollup_bucket
+from workers.app.runtime import worker_resources
+
+OUTBOX_NOTIFY_CHANNEL = "event_outbox"
+OUTBOX_BATCH_SIZE = 500
+OUTBOX_POLL_SECONDS = 5.0
+
+
+async def enqueue_events(
+    session: AsyncSession,
+    payloads: Iterable[Mapping[str, object]],
+    *,
+    channel: str | None = None,
+) -> int:
+    """Queue SSE payloads in the caller's transaction.
+
+    Rows only become visible to the relay (and its ``NOTIFY`` only fires)
+    when the surrounding insert commits, so an event is never published for
+    a rolled-back row and never lost to a crash after commit.
+    """
+    rows = [{"channel": channel or settings.sse_channel, "payload": dict(payload)} for payload in payloads]
+    if rows:
+        await session.execute(insert(EventOutbox), rows)
+    return len(rows)
+
+
+def typed_event(event: str, data: Mapping[str, object]) -> dict[str, object]:
+    """Envelope for a non-item event; the SSE stream sends ``data`` under ``event``."""
+    return {"event": event, "data": dict(data)}
+
+
+async def enqueue_item_events(
+    session: AsyncSession,
+    payloads: Iterable[Mapping[str, object]],
+    *,
+    now: datetime | None = None,
+) -> int:
+    """Queue item payloads under the publish policy.
+
+    Items published within ``sse_freshness_hours`` go to the live channel one
+    event each. Older ones (backfilled history, late-indexed papers) are
+    folded into a single ``rollups_invalidated`` event on ``rollup_channel``
+    naming the hourly buckets they touched, so dashboards are not handed
+    months-old items as if they were new.
+    """
+    horizon = (now or datetime.now(UTC)) - timedelta(hours=settings.sse_freshness_hours)
+    fresh: list[Mapping[str, object]] = []
+    stale_buckets: set[datetime] = set()
+    stale = 0
+    for payload in payloads:
+        published_at = datetime.fromisoformat(str(payload["published_at"]))
+        if published_at >= horizon:
+            fresh.append(payload)
+        else:
+            stale += 1
+            stale_buckets.add(rollup_bucket(published_at))
+
+    queued = await enqueue_events(session, fresh)
+    if stale:
+        invalidation = typed_event(
+            "rollups_invalidated",
+            {"items": stale, "buckets": [bucket.isoformat() for bucket in sorted(stale_buckets)]},
+        )
+        queued += await enqueue_events(session, [invalidation], channel=settings.rollup_channel)
+    return queued
+
+
+async def drain_outbox(client: redis.Redis, SessionLocal, *, batch_size: int = OUTBOX_BATCH_SIZE) -> int:
+    """Publish and delete one batch of queued events; returns the batch size.
+
+    Rows are claimed with ``FOR UPDATE SKIP LOCKED`` so concurrent relays
+    split the backlog. Rows are deleted only after Redis accepted the
+    pipeline; a failure rolls back and they are retried (at-least-once).
+    """
+    async with SessionLocal() as session:
+        rows = (
+            await session.execute(
+                select(EventOutbox.id, EventOutbox.channel, EventOutbox.payload)
+                .order_by(EventOutbox.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+        ).all()
+        if not rows:
+            return 0
+
+        async with client.pipeline(transaction=False) as pipe:
+            for _, channel, payload in rows:
+                pipe.publish(channel, json.dumps(payload))
+            await pipe.execute()
+
+        await session.execute(delete(EventOutbox).where(EventOutbox.id.in_([row.id for row in rows])))
+        await session.commit()
+        return len(rows)
+
+
+async def relay_pending(client: redis.Redis, SessionLocal, *, batch_size: int = OUTBOX_BATCH_SIZE) -> int:
+    relayed = 0
+    while True:
+        count = await drain_outbox(client, SessionLocal, batch_size=batch_size)
+        relayed += count
+        if count < batch_size:
+            return relayed
+
+
+def _listen_dsn() -> str:
+    return settings.database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+async def run_outbox_relay(*, poll_seconds: float = OUTBOX_POLL_SECONDS) -> None:
+    """Drain the outbox whenever an insert commits, polling as a fallback."""
+    wakeup = asyncio.Event()
+    async with worker_resources() as (client, SessionLocal):
+        connection = await asyncpg.connect(_listen_dsn())
+        await connection.add_listener(OUTBOX_NOTIFY_CHANNEL, lambda *_: wakeup.set())
+        try:
+            while True:
+                # Clear before draining so a commit during the drain still wakes us.
+                wakeup.clear()
+                try:
+                    await relay_pending(client, SessionLocal)
+                except Exception:
+                    await asyncio.sleep(poll_seconds)
+                    continue
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await connection.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_outbox_relay())
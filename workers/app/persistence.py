@@ -0,0 +1,145 @@
+import json
+import uuid
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models.ai_development import AIDevelopment
+from backend.app.services.rollups import apply_rollup_deltas
+
+INSERT_CHUNK_SIZE = 500
+STAGE_TABLE = "ai_developments_stage"
+ROW_DEFAULTS: dict[str, Any] = {
+    "description": "",
+    "language": "other",
+    "entities": [],
+    "tags": [],
+    "confidence": 0.0,
+}
+INSERT_COLUMNS = (
+    "id",
+    "source_id",
+    "source_type",
+    "category",
+    "title",
+    "description",
+    "url",
+    "publisher",
+    "published_at",
+    "language",
+    "jurisdiction",
+    "entities",
+    "tags",
+    "hash",
+    "confidence",
+)
+_COLUMN_LIST = ", ".join(INSERT_COLUMNS)
+# A temp table is never WAL-logged and is private to the connection, so
+# concurrent writers each stage into their own copy.
+_CREATE_STAGE = (
+    f"CREATE TEMP TABLE IF NOT EXISTS {STAGE_TABLE} AS "
+    f"SELECT {_COLUMN_LIST} FROM ai_developments WITH NO DATA"
+)
+# Emptying the stage in the merge itself keeps it clean for the next batch on this connection.
+_MERGE_STAGE = (
+    f"WITH staged AS (DELETE FROM {STAGE_TABLE} RETURNING {_COLUMN_LIST}) "
+    f"INSERT INTO ai_developments ({_COLUMN_LIST}) SELECT {_COLUMN_LIST} FROM staged "
+    "ON CONFLICT (hash) DO NOTHING RETURNING id, hash, ingested_at"
+)
+
+
+def _insert_row(record: Mapping[str, Any]) -> dict[str, Any]:
+    row = {**ROW_DEFAULTS, **{key: value for key, value in record.items() if key in INSERT_COLUMNS}}
+    row.setdefault("id", uuid.uuid4())
+    return row
+
+
+def _rows_by_hash(records: Iterable[Mapping[str, Any]]) -> dict[str, dict[str, Any]]:
+    rows_by_hash: dict[str, dict[str, Any]] = {}
+    for record in records:
+        row = _insert_row(record)
+        rows_by_hash.setdefault(str(row["hash"]), row)
+    return rows_by_hash
+
+
+def _copy_record(row: Mapping[str, Any]) -> tuple[Any, ...]:
+    values = []
+    for column in INSERT_COLUMNS:
+        value = row.get(column)
+        if column == "entities":
+            # SQLAlchemy's asyncpg codec for jsonb takes the encoded document.
+            value = json.dumps(value)
+        elif column in {"source_type", "category"}:
+            value = getattr(value, "value", value)
+        values.append(value)
+    return tuple(values)
+
+
+async def insert_new_developments(
+    session: AsyncSession,
+    records: Iterable[Mapping[str, Any]],
+) -> list[dict[str, Any]]:
+    """Insert records whose hash is new and return them with ``id``/``ingested_at`` set.
+
+    Each chunk is one ``INSERT ... ON CONFLICT (hash) DO NOTHING RETURNING``,
+    so duplicates are skipped by the database instead of raising, and the
+    hourly rollups are updated in the caller's transaction. Nothing is
+    committed here.
+    """
+    rows_by_hash = _rows_by_hash(records)
+    rows = list(rows_by_hash.values())
+
+    inserted: list[dict[str, Any]] = []
+    for offset in range(0, len(rows), INSERT_CHUNK_SIZE):
+        stmt = (
+            insert(AIDevelopment)
+            .values(rows[offset : offset + INSERT_CHUNK_SIZE])
+            .on_conflict_do_nothing(index_elements=["hash"])
+            .returning(AIDevelopment.id, AIDevelopment.hash, AIDevelopment.ingested_at)
+        )
+        for row_id, row_hash, ingested_at in (await session.execute(stmt)).all():
+            inserted.append({**rows_by_hash[row_hash], "id": row_id, "ingested_at": ingested_at})
+
+    if inserted:
+        await apply_rollup_deltas(session, inserted)
+    return inserted
+
+
+async def copy_new_developments(
+    session: AsyncSession,
+    records: Iterable[Mapping[str, Any]],
+) -> list[dict[str, Any]]:
+    """Bulk variant of :func:`insert_new_developments` for large batches.
+
+    Rows are streamed with ``COPY`` into a staging table and merged by one
+    set-based ``INSERT ... SELECT ... ON CONFLICT (hash) DO NOTHING
+    RETURNING``; rollups are applied once for the whole batch. Runs in the
+    caller's transaction and falls back to the chunked insert on drivers
+    other than asyncpg.
+    """
+    connection = await session.connection()
+    if connection.dialect.driver != "asyncpg":
+        return await insert_new_developments(session, records)
+
+    rows_by_hash = _rows_by_hash(records)
+    if not rows_by_hash:
+        return []
+    await session.execute(text(_CREATE_STAGE))
+    raw = (await connection.get_raw_connection()).driver_connection
+    await raw.copy_records_to_table(
+        STAGE_TABLE,
+        records=[_copy_record(row) for row in rows_by_hash.values()],
+        columns=INSERT_COLUMNS,
+    )
+    merged = await session.execute(text(_MERGE_STAGE))
+    inserted = [
+        {**rows_by_hash[row_hash], "id": row_id, "ingested_at": ingested_at}
+        for row_id, row_hash, ingested_at in merged.all()
+    ]
+
+    if inserted:
+        await apply_rollup_deltas(session, inserted)
+    return inserted
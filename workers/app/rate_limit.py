@@ -0,0 +1,259 @@
+import asyncio
+import random
+import uuid
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+import redis.asyncio as redis
+
+from workers.app.runtime import active_runtime
+
+RATE_LIMIT_KEY_PREFIX = "ratelimit"
+LEASE_TTL_MS = 60_000
+LEASE_POLL_SECONDS = 0.1
+MAX_RETRY_AFTER_SECONDS = 900.0
+MAX_INLINE_RETRY_SECONDS = 30.0
+DEFAULT_THROTTLE_SECONDS = 10.0
+MAX_THROTTLE_RETRIES = 2
+THROTTLE_STATUSES = {429, 503}
+
+
+class HostThrottled(httpx.HTTPError):
+    """The host is paused by a ``Retry-After`` longer than ``MAX_INLINE_RETRY_SECONDS``.
+
+    Raised instead of sleeping, so a caller holding fetch slots (and an
+    ingest lock) fails this source now rather than stalling the whole run.
+    """
+
+    def __init__(self, host: str, seconds: float) -> None:
+        super().__init__(f"{host} is throttled for another {seconds:.0f}s")
+        self.host = host
+        self.seconds = seconds
+
+
+@dataclass(frozen=True, slots=True)
+class HostLimit:
+    rate_per_second: float
+    burst: int
+    concurrency: int
+
+
+DEFAULT_HOST_LIMIT = HostLimit(rate_per_second=2.0, burst=4, concurrency=2)
+HOST_LIMITS: dict[str, HostLimit] = {
+    "news.google.com": HostLimit(rate_per_second=0.5, burst=2, concurrency=1),
+    "www.canada.ca": HostLimit(rate_per_second=1.0, burst=3, concurrency=2),
+    "www.gazette.gc.ca": HostLimit(rate_per_second=1.0, burst=3, concurrency=2),
+    "api.openalex.org": HostLimit(rate_per_second=8.0, burst=10, concurrency=4),
+    "api.crossref.org": HostLimit(rate_per_second=5.0, burst=5, concurrency=3),
+    # Unauthenticated search allows 10 requests a minute.
+    "api.github.com": HostLimit(rate_per_second=0.15, burst=3, concurrency=1),
+    # arXiv asks for one request every three seconds on a single connection.
+    "export.arxiv.org": HostLimit(rate_per_second=1 / 3, burst=1, concurrency=1),
+}
+
+# Reserves one token from the host's bucket and returns how long to wait for
+# it (ms); an active Retry-After block is returned instead, without reserving.
+TOKEN_BUCKET_LUA = """
+local blocked = redis.call('PTTL', KEYS[2])
+if blocked > 0 then
+    return {0, blocked}
+end
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((burst - tokens) / rate) + 1000)
+if tokens >= 0 then
+    return {1, 0}
+end
+return {1, math.ceil(-tokens / rate)}
+"""
+
+# Takes a concurrency lease if fewer than ARGV[1] unexpired leases are held.
+LEASE_LUA = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[1]) then
+    redis.call('ZADD', KEYS[1], now + tonumber(ARGV[3]), ARGV[2])
+    redis.call('PEXPIRE', KEYS[1], ARGV[3])
+    return 1
+end
+return 0
+"""
+
+
+def host_limit(host: str) -> HostLimit:
+    """The limit for ``host`` or, failing that, for its nearest listed parent domain."""
+    labels = host.lower().split(".")
+    for start in range(len(labels) - 1):
+        limit = HOST_LIMITS.get(".".join(labels[start:]))
+        if limit is not None:
+            return limit
+    return DEFAULT_HOST_LIMIT
+
+
+def _keys(host: str) -> tuple[str, str, str]:
+    return (
+        f"{RATE_LIMIT_KEY_PREFIX}:bucket:{host}",
+        f"{RATE_LIMIT_KEY_PREFIX}:blocked:{host}",
+        f"{RATE_LIMIT_KEY_PREFIX}:leases:{host}",
+    )
+
+
+async def _acquire_token(client: redis.Redis, host: str, limit: HostLimit) -> None:
+    bucket_key, blocked_key, _ = _keys(host)
+    rate_per_ms = limit.rate_per_second / 1000
+    while True:
+        reserved, wait_ms = await client.register_script(TOKEN_BUCKET_LUA)(
+            keys=[bucket_key, blocked_key],
+            args=[rate_per_ms, limit.burst],
+        )
+        if not reserved and int(wait_ms) > MAX_INLINE_RETRY_SECONDS * 1000:
+            # Same rule as limited_get: long Retry-After pauses are not waited out inline.
+            raise HostThrottled(host, int(wait_ms) / 1000)
+        if wait_ms > 0:
+            await asyncio.sleep(int(wait_ms) / 1000)
+        if reserved:
+            return
+
+
+async def _acquire_lease(client: redis.Redis, host: str, limit: HostLimit, token: str) -> None:
+    _, _, lease_key = _keys(host)
+    acquire = client.register_script(LEASE_LUA)
+    while not await acquire(keys=[lease_key], args=[limit.concurrency, token, LEASE_TTL_MS]):
+        await asyncio.sleep(LEASE_POLL_SECONDS * (1 + random.random()))
+
+
+@asynccontextmanager
+async def host_slot(url: str) -> AsyncIterator[None]:
+    """Hold one rate-limited, concurrency-limited request slot for ``url``'s host.
+
+    Buckets and leases live in Redis so every worker process shares them.
+    Outside a worker runtime, or if Redis fails, requests go through unthrottled.
+    Raises ``HostThrottled`` rather than waiting out a long ``Retry-After`` pause.
+    """
+    runtime = active_runtime()
+    host = urlsplit(url).hostname or ""
+    if runtime is None or not host:
+        yield
+        return
+
+    client = runtime.redis
+    limit = host_limit(host)
+    token = uuid.uuid4().hex
+    leased = False
+    try:
+        await _acquire_token(client, host, limit)
+        await _acquire_lease(client, host, limit, token)
+        leased = True
+    except redis.RedisError:
+        pass
+    try:
+        yield
+    finally:
+        if leased:
+            try:
+                await client.zrem(_keys(host)[2], token)
+            except redis.RedisError:
+                pass
+
+
+def retry_after_seconds(response: httpx.Response) -> float | None:
+    raw = response.headers.get("Retry-After")
+    if not raw:
+        return None
+    try:
+        seconds = float(raw)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(raw) - datetime.now(UTC)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+async def _block_host(host: str, seconds: float) -> None:
+    runtime = active_runtime()
+    if runtime is None or seconds <= 0:
+        return
+    try:
+        await runtime.redis.set(_keys(host)[1], "1", px=int(seconds * 1000))
+    except redis.RedisError:
+        pass
+
+
+def _throttle_delay(response: httpx.Response) -> float | None:
+    """Seconds the host asked us to back off, or None if ``response`` isn't a throttle."""
+    if response.status_code not in THROTTLE_STATUSES:
+        return None
+    delay = retry_after_seconds(response)
+    if delay is None and response.status_code == 429:
+        return DEFAULT_THROTTLE_SECONDS
+    return delay
+
+
+async def limited_get(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    params: Mapping[str, str] | None = None,
+    headers: Mapping[str, str] | None = None,
+    **kwargs: Any,
+) -> httpx.Response:
+    """GET through the host's shared limiter, honouring ``Retry-After``.
+
+    A 429/503 pauses the host for every worker. Short pauses are waited out
+    and retried here; longer ones return the response for the caller to fail on.
+    """
+    host = urlsplit(url).hostname or ""
+    for attempt in range(MAX_THROTTLE_RETRIES + 1):
+        async with host_slot(url):
+            response = await client.get(url, params=params, headers=headers, **kwargs)
+        delay = _throttle_delay(response)
+        if delay is None:
+            return response
+        await _block_host(host, delay)
+        if attempt == MAX_THROTTLE_RETRIES or delay > MAX_INLINE_RETRY_SECONDS:
+            return response
+        if active_runtime() is None:
+            await asyncio.sleep(delay)
+    return response
+
+
+@asynccontextmanager
+async def limited_stream(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    params: Mapping[str, str] | None = None,
+    headers: Mapping[str, str] | None = None,
+    **kwargs: Any,
+) -> AsyncIterator[httpx.Response]:
+    """Streaming ``limited_get``: the body is left unread for the caller.
+
+    The host slot is held until the caller leaves the block, so a slow
+    download counts against the host's concurrency like any other request.
+    """
+    host = urlsplit(url).hostname or ""
+    for attempt in range(MAX_THROTTLE_RETRIES + 1):
+        async with host_slot(url), client.stream("GET", url, params=params, headers=headers, **kwargs) as response:
+            delay = _throttle_delay(response)
+            if delay is not None:
+                await _block_host(host, delay)
+            if delay is None or attempt == MAX_THROTTLE_RETRIES or delay > MAX_INLINE_RETRY_SECONDS:
+                yield response
+                return
+        if active_runtime() is None:
+            await asyncio.sleep(delay)
@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import multiprocessing
+from collections.abc import AsyncIterator, Coroutine
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+import httpx
+import redis.asyncio as redis
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from backend.app.core.config import settings
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Fail fast on dead hosts and pool starvation; leave slow feeds time to stream.
+HTTP_TIMEOUT = httpx.Timeout(20.0, connect=5.0, pool=10.0)
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=90.0)
+
+
+def build_http_client(*, verify: bool = True) -> httpx.AsyncClient:
+    """The one client shape every fetch uses: HTTP/2 with pooled keepalive connections per origin."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+        limits=HTTP_LIMITS,
+        verify=verify,
+    )
+
+
+class WorkerRuntime:
+    """Long-lived async resources for one worker process.
+
+    Tasks run on a single event loop, so the engine's pool, the Redis pool and
+    the HTTP/2 client keep their connections (and TLS sessions) between task
+    invocations instead of being rebuilt by every ``asyncio.run``.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.engine: AsyncEngine = create_async_engine(settings.database_url, future=True, pool_pre_ping=True)
+        self.SessionLocal = async_sessionmaker(self.engine, expire_on_commit=False)
+        self.redis: redis.Redis = redis.from_url(settings.redis_url, decode_responses=True)
+        self.http = build_http_client()
+        self._unverified_http: httpx.AsyncClient | None = None
+        self._normalize_pool: ProcessPoolExecutor | None = None
+        self._normalize_pool_disabled = False
+
+    def http_for(self, *, verify: bool = True) -> httpx.AsyncClient:
+        if verify:
+            return self.http
+        # A few government hosts serve incomplete chains; they share one unverified pool.
+        if self._unverified_http is None:
+            self._unverified_http = build_http_client(verify=False)
+        return self._unverified_http
+
+    def normalize_pool(self) -> ProcessPoolExecutor | None:
+        """The CPU pool for record normalization, started on first use; None when disabled."""
+        if settings.normalize_processes <= 0 or self._normalize_pool_disabled:
+            return None
+        if self._normalize_pool is None:
+            if multiprocessing.current_process().daemon:
+                # Prefork pool children are daemonic and may not start processes of their own;
+                # only a solo or threads worker (the backfill worker) can run the pool.
+                logger.warning("NORMALIZE_PROCESSES ignored in a daemonic worker process; normalizing inline")
+                self.disable_normalize_pool()
+                return None
+            # Spawned rather than forked so children inherit no loop, sockets or DB connections.
+            self._normalize_pool = ProcessPoolExecutor(
+                max_workers=settings.normalize_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info("Normalizing large pages across %d spawned processes", settings.normalize_processes)
+        return self._normalize_pool
+
+    def disable_normalize_pool(self) -> bool:
+        """Stop using the normalization pool for the rest of this process; True the first time."""
+        if self._normalize_pool_disabled:
+            return False
+        self._normalize_pool_disabled = True
+        if self._normalize_pool is not None:
+            self._normalize_pool.shutdown(wait=False, cancel_futures=True)
+            self._normalize_pool = None
+        return True
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        asyncio.set_event_loop(self.loop)
+        return self.loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        async def _close() -> None:
+            await self.http.aclose()
+            if self._unverified_http is not None:
+                await self._unverified_http.aclose()
+            await self.redis.close()
+            await self.engine.dispose()
+
+        try:
+            self.loop.run_until_complete(_close())
+        finally:
+            self.loop.close()
+            if self._normalize_pool is not None:
+                self._normalize_pool.shutdown(cancel_futures=True)
+
+
+_runtime: WorkerRuntime | None = None
+
+
+def get_runtime() -> WorkerRuntime:
+    global _runtime
+    if _runtime is None:
+        _runtime = WorkerRuntime()
+    return _runtime
+
+
+def shutdown_runtime() -> None:
+    global _runtime
+    if _runtime is not None:
+        runtime, _runtime = _runtime, None
+        runtime.close()
+
+
+def run_in_worker(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a task coroutine on this process's persistent loop."""
+    return get_runtime().run(coro)
+
+
+def active_runtime() -> WorkerRuntime | None:
+    """The runtime owning the running loop, if any (None under a bare ``asyncio.run``)."""
+    if _runtime is None:
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return _runtime if loop is _runtime.loop else None
+
+
+@asynccontextmanager
+async def worker_resources() -> AsyncIterator[tuple[redis.Redis, async_sessionmaker]]:
+    """Yield (redis client, session factory), shared when a runtime is active."""
+    runtime = active_runtime()
+    if runtime is not None:
+        yield runtime.redis, runtime.SessionLocal
+        return
+
+    client = redis.from_url(settings.redis_url, decode_responses=True)
+    engine = create_async_engine(settings.database_url, future=True, pool_pre_ping=True)
+    try:
+        yield client, async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+        await client.close()
+
+
+@asynccontextmanager
+async def http_client(*, verify: bool = True) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the process's pooled HTTP client, or a one-off client outside a runtime.
+
+    Fetchers take the client as an argument; tasks open it here once and
+    pass it down, so every poll reuses warm connections.
+    """
+    runtime = active_runtime()
+    if runtime is not None:
+        yield runtime.http_for(verify=verify)
+        return
+
+    async with build_http_client(verify=verify) as client:
+        yield client
+
+
+@worker_process_init.connect
+def _start_runtime(**_: object) -> None:
+    get_runtime()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _stop_runtime(**_: object) -> None:
+    # worker_shutdown covers the solo backfill worker, which runs tasks in its main process.
+    shutdown_runtime()
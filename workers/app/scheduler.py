@@ -0,0 +1,72 @@
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert
+
+from backend.app.models.source_tracking import SourceIngestState
+
+DISPATCH_LEASE = timedelta(minutes=15)
+YIELD_EWMA_ALPHA = 0.3
+TARGET_ITEMS_PER_RUN = 2.0
+MIN_INTERVAL_MINUTES = 5
+MAX_INTERVAL_MINUTES = 720
+INTERVAL_FLOOR_RATIO = 0.25
+INTERVAL_CEILING_RATIO = 4.0
+
+
+def update_yield(previous: float | None, inserted: int, elapsed_minutes: float) -> float:
+    """EWMA of new items per hour, observed over the time since the last success."""
+    observed = inserted * 60.0 / max(elapsed_minutes, 1.0)
+    if previous is None:
+        return observed
+    return previous + YIELD_EWMA_ALPHA * (observed - previous)
+
+
+def adaptive_interval_minutes(cadence_minutes: int, yield_per_hour: float | None) -> int:
+    """Minutes until the next poll, aiming for ``TARGET_ITEMS_PER_RUN`` new items.
+
+    Busy feeds are polled down to a quarter of their configured cadence and
+    quiet ones back off to four times it.
+    """
+    floor = max(MIN_INTERVAL_MINUTES, int(cadence_minutes * INTERVAL_FLOOR_RATIO))
+    ceiling = min(MAX_INTERVAL_MINUTES, max(floor, int(cadence_minutes * INTERVAL_CEILING_RATIO)))
+    if yield_per_hour is None:
+        return min(max(cadence_minutes, floor), ceiling)
+    if yield_per_hour <= 0:
+        return ceiling
+    return min(max(int(TARGET_ITEMS_PER_RUN * 60.0 / yield_per_hour), floor), ceiling)
+
+
+async def claim_due_sources(SessionLocal, source_keys: Iterable[str], *, now: datetime) -> list[str]:
+    """Lease every due source and return the keys to dispatch.
+
+    Rows are claimed with ``FOR UPDATE SKIP LOCKED`` and pushed out by
+    ``DISPATCH_LEASE``, so overlapping dispatchers never send the same source
+    twice and a lost task is retried once the lease lapses. The ingest run
+    itself sets the real ``next_run_at`` when it finishes.
+    """
+    keys = sorted(set(source_keys))
+    if not keys:
+        return []
+    async with SessionLocal() as session:
+        await session.execute(
+            insert(SourceIngestState)
+            .values([{"source_key": key, "consecutive_failures": 0} for key in keys])
+            .on_conflict_do_nothing(index_elements=["source_key"])
+        )
+        states = (
+            await session.execute(
+                select(SourceIngestState)
+                .where(
+                    SourceIngestState.source_key.in_(keys),
+                    or_(SourceIngestState.next_run_at.is_(None), SourceIngestState.next_run_at <= now),
+                )
+                .order_by(SourceIngestState.next_run_at.asc().nulls_first())
+                .with_for_update(skip_locked=True)
+            )
+        ).scalars().all()
+        for state in states:
+            state.next_run_at = now + DISPATCH_LEASE
+        await session.commit()
+        return [state.source_key for state in states]
@@ -2,34 +2,67 @@ import hashlib
 import html
 import re
 import uuid
-from datetime import UTC, datetime, timedelta
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from xml.etree import ElementTree as ET
 
 import httpx
 
+from backend.app.core.config import settings
 from backend.app.models.ai_development import CategoryType, SourceType
+from workers.app.conditional import conditional_get, conditional_stream
+from workers.app.cursors import advance_cursor, current_cursor, set_cursor
+from workers.app.keywords import KeywordMatcher
+from workers.app.normalize import normalize_items
+from workers.app.source_registry import SourceDefinition
+from workers.app.xml_stream import collect_elements, iter_elements, safe_fromstring
 
 OPENALEX_URL = "https://api.openalex.org/works"
-GOV_CANADA_RSS_URL = "https://www.canada.ca/en/news/advanced-news-search/news-results.html?dprtmnt=departmentofindustry&typ=newsreleases&rss"
-BETAKIT_AI_RSS_URL = "https://betakit.com/tag/artificial-intelligence/feed/"
-GOOGLE_NEWS_CANADA_AI_RSS_URL = (
-    "https://news.google.com/rss/search?q=artificial+intelligence+Canada&hl=en-CA&gl=CA&ceid=CA:en"
-)
-AI_KEYWORDS = {"ai", "artificial intelligence", "machine learning", "deep learning", "llm", "generative"}
+OPENALEX_SEARCH = "artificial intelligence Canada"
+# Root fields the OpenAlex normalizers read; the rest of each work stays off the wire.
+OPENALEX_SELECT = "id,display_name,publication_date,created_date,primary_location,language,authorships"
+# Incremental API fetches page oldest-first from the stored cursor, up to this many items per run.
+CURSOR_PAGE_SIZE = 50
+CURSOR_MAX_PAGES = 5
+# Crossref serves rows only up to this offset; deeper reads need its (short-lived) cursors.
+CROSSREF_MAX_OFFSET = 10_000
+AI_KEYWORDS = {
+    "ai",
+    "artificial intelligence",
+    "machine learning",
+    "deep learning",
+    "llm*",
+    "generative",
+    "openai",
+    "genai",
+    "xai",
+}
+# Brand names fusing "AI" onto a word ("CohereAI", "StabilityAI"); the lowercase
+# letter before it keeps all-caps words such as "SAID" or "THAI" out.
+AI_SUFFIX_PATTERN = re.compile(r"[a-z]AI(?:s)?\b")
 CANADA_KEYWORDS = {
     "canada",
     "canadian",
     "ottawa",
     "quebec",
+    "quebecer",
+    "quebecois",
     "ontario",
+    "ontarian",
     "alberta",
+    "albertan",
     "british columbia",
+    "british columbian",
     "manitoba",
+    "manitoban",
     "saskatchewan",
     "nova scotia",
+    "nova scotian",
     "new brunswick",
     "newfoundland",
+    "newfoundlander",
     "pei",
 }
 CANADA_ENTITIES = {
@@ -46,31 +79,61 @@ CANADA_ENTITIES = {
 }
 PROVINCE_TOKENS = {
     "ontario": "Ontario",
+    "ontarian": "Ontario",
     "toronto": "Ontario",
+    "torontonian": "Ontario",
     "waterloo": "Ontario",
     "quebec": "Quebec",
+    "quebecer": "Quebec",
+    "quebecois": "Quebec",
     "montreal": "Quebec",
+    "montrealer": "Quebec",
     "alberta": "Alberta",
+    "albertan": "Alberta",
     "edmonton": "Alberta",
     "calgary": "Alberta",
+    "calgarian": "Alberta",
     "british columbia": "British Columbia",
+    "british columbian": "British Columbia",
     "vancouver": "British Columbia",
+    "vancouverite": "British Columbia",
 }
 
 
 _FRENCH_MARKERS = {
-    " des ", " dans ", " les ", " une ", " pour ", " sur ", " aux ",
-    " est ", " par ", " avec ", " entre ", " cette ", " mais ",
-    " politique", " gouvernement", " légalisation", " environnement",
-    " société", " économi", " l'", " d'", " s'", " n'", " qu'",
+    "des", "dans", "les", "une", "pour", "sur", "aux",
+    "est", "par", "avec", "entre", "cette", "mais",
+    "politique*", "gouvernement*", "légalisation*", "environnement*",
+    "société*", "économi*", "l'*", "d'*", "s'*", "n'*", "qu'*",
 }
+KEYWORD_MATCHER = KeywordMatcher(
+    {
+        "ai": AI_KEYWORDS,
+        "canada": CANADA_KEYWORDS,
+        "entity": CANADA_ENTITIES,
+        "province": PROVINCE_TOKENS,
+        "country": {"canada", "canadian"},
+        "gov": {"government of canada", "canada.ca"},
+        "openalex": {"openalex.org"},
+        "french": _FRENCH_MARKERS,
+    }
+)
+
+
+@lru_cache(maxsize=4096)
+def _keyword_terms(text: str) -> frozenset[str]:
+    # Adapters classify the same title several times; each distinct part is scanned once.
+    return KEYWORD_MATCHER.scan(text)
+
+
+def _parts_terms(parts: tuple[str, ...]) -> frozenset[str]:
+    return frozenset().union(*map(_keyword_terms, filter(None, parts)))
 
 
 def _likely_french(text: str) -> bool:
     """Heuristic: if ≥3 French marker words appear in the text, it's likely French."""
-    low = f" {text.lower()} "
-    hits = sum(1 for marker in _FRENCH_MARKERS if marker in low)
-    return hits >= 3
+    terms = _keyword_terms(text)
+    return KEYWORD_MATCHER.has(terms, "french") and len(KEYWORD_MATCHER.hits(terms, "french")) >= 3
 
 
 def _detect_language(value: str | None, *, title: str = "") -> str:
@@ -87,34 +150,33 @@ def _clamp_future_date(dt: datetime) -> datetime:
     return min(dt, now)
 
 
-
 def _contains_ai(text: str) -> bool:
-    low = text.lower()
-    return any(keyword in low for keyword in AI_KEYWORDS)
+    return KEYWORD_MATCHER.has(_keyword_terms(text), "ai") or AI_SUFFIX_PATTERN.search(text) is not None
 
 
 def _canada_relevance_score(*parts: str) -> float:
-    blob = " ".join(parts).lower()
+    terms = _parts_terms(parts)
     score = 0.0
 
-    if any(keyword in blob for keyword in CANADA_KEYWORDS):
+    if KEYWORD_MATCHER.has(terms, "canada"):
         score += 0.35
-    entity_hits = sum(1 for ent in CANADA_ENTITIES if ent in blob)
-    score += min(entity_hits * 0.2, 0.4)
-    if "government of canada" in blob or "canada.ca" in blob:
+    score += min(len(KEYWORD_MATCHER.hits(terms, "entity")) * 0.2, 0.4)
+    if KEYWORD_MATCHER.has(terms, "gov"):
         score += 0.25
-    if "openalex.org" in blob:
+    if KEYWORD_MATCHER.has(terms, "openalex"):
         score += 0.05
 
     return min(score, 1.0)
 
 
 def _infer_jurisdiction(*parts: str) -> str:
-    blob = " ".join(parts).lower()
-    for token, province in PROVINCE_TOKENS.items():
-        if token in blob:
-            return province
-    if "canada" in blob or "canadian" in blob:
+    terms = _parts_terms(parts)
+    if KEYWORD_MATCHER.has(terms, "province"):
+        provinces = KEYWORD_MATCHER.hits(terms, "province")
+        for token, province in PROVINCE_TOKENS.items():
+            if token in provinces:
+                return province
+    if KEYWORD_MATCHER.has(terms, "country"):
         return "Canada"
     return "Global"
 
@@ -145,10 +207,7 @@ def _extract_publisher_from_title(title: str, fallback: str) -> str:
 
 
 def _safe_parse_xml(xml_text: str) -> ET.Element | None:
-    try:
-        return ET.fromstring(xml_text)
-    except ET.ParseError:
-        return None
+    return safe_fromstring(xml_text)
 
 
 def _normalize_source_id(source_id: str, *, prefix: str) -> str:
@@ -164,15 +223,85 @@ def _fingerprint(source_id: str, url: str, published_at: datetime) -> str:
     return hashlib.sha256(material).hexdigest()
 
 
-async def fetch_openalex_metadata(limit: int = 3) -> list[dict[str, object]]:
-    params = {"search": "artificial intelligence Canada", "per-page": str(limit), "sort": "publication_date:desc"}
-    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-        response = await client.get(OPENALEX_URL, params=params)
-        response.raise_for_status()
-        payload = response.json()
+def _cursor_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _split_cursor(value: str | None) -> tuple[datetime | None, str | None, str]:
+    """Parse a resumable cursor ``<mark>[|<resume position>|<highest value seen>]``.
+
+    A plain mark, as every other fetcher stores, has no resume position.
+    """
+    if not value:
+        return None, None, ""
+    mark, _, rest = value.partition("|")
+    resume, _, seen = rest.partition("|")
+    return _cursor_datetime(mark), resume or None, seen
+
+
+def _openalex_params(params: dict[str, str]) -> dict[str, str]:
+    """Add the field projection and, when configured, the polite-pool ``mailto``."""
+    params = {**params, "select": OPENALEX_SELECT}
+    if settings.openalex_mailto:
+        params["mailto"] = settings.openalex_mailto
+    return params
+
+
+async def fetch_openalex_metadata(client: httpx.AsyncClient, limit: int = 3) -> list[dict[str, object]]:
+    """Latest OpenAlex works; with a cursor, every work OpenAlex created since the mark.
+
+    The mark is a ``created_date``, so works indexed long after their
+    publication date are still picked up. It only moves once the whole result
+    set has been read; a run that spends its page budget stores OpenAlex's
+    ``next_cursor`` and the next run continues that same query.
+    """
+    mark, resume, seen = _split_cursor(current_cursor())
+    results: list[dict[str, object]] = []
+    if mark is None:
+        params = _openalex_params({"search": OPENALEX_SEARCH, "per-page": str(limit), "sort": "publication_date:desc"})
+        response = await conditional_get(client, OPENALEX_URL, params=params)
+        if response is None:
+            return []
+        results = response.json().get("results", [])
+        set_cursor(datetime.now(UTC).date().isoformat())
+    else:
+        mark_date = mark.date().isoformat()
+        page_cursor = resume or "*"
+        exhausted = False
+        for _ in range(CURSOR_MAX_PAGES):
+            params = _openalex_params(
+                {
+                    "search": OPENALEX_SEARCH,
+                    "filter": f"from_created_date:{mark_date}",
+                    "per-page": str(CURSOR_PAGE_SIZE),
+                    "cursor": page_cursor,
+                }
+            )
+            response = await conditional_get(client, OPENALEX_URL, params=params)
+            if response is None:
+                break
+            payload = response.json()
+            page = payload.get("results", [])
+            results.extend(page)
+            seen = max([seen, *(str(result["created_date"]) for result in page if result.get("created_date"))])
+            page_cursor = (payload.get("meta") or {}).get("next_cursor")
+            if not page_cursor or len(page) < CURSOR_PAGE_SIZE:
+                exhausted = True
+                break
+        if exhausted:
+            # The mark date is inclusive, so works created later that same day are not lost.
+            set_cursor(max(seen, mark_date))
+        elif results:
+            set_cursor(f"{mark_date}|{page_cursor}|{seen}")
 
     records: list[dict[str, object]] = []
-    for result in payload.get("results", []):
+    for result in results:
         title = _clean_text(result.get("display_name"))
         if not title:
             continue
@@ -218,118 +347,63 @@ async def fetch_openalex_metadata(limit: int = 3) -> list[dict[str, object]]:
     return records
 
 
-async def fetch_canada_gov_metadata(limit: int = 3) -> list[dict[str, object]]:
-    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-        response = await client.get(GOV_CANADA_RSS_URL)
-        response.raise_for_status()
-        xml_text = response.text
-
-    root = _safe_parse_xml(xml_text)
-    if root is None:
-        return []
-    items = root.findall(".//item")
-    records: list[dict[str, object]] = []
-    for item in items[:limit]:
-        title = _clean_text(item.findtext("title"))
-        if not title or not _contains_ai(title):
-            continue
-
-        link = (item.findtext("link") or "").strip()
-        guid_raw = (item.findtext("guid") or "").strip() or f"gc-{uuid.uuid4().hex[:12]}"
-        guid = _normalize_source_id(guid_raw, prefix="gc")
-        pubdate_raw = (item.findtext("pubDate") or "").strip()
-        try:
-            published_at = parsedate_to_datetime(pubdate_raw).astimezone(UTC)
-        except Exception:
-            published_at = datetime.now(UTC)
-
-        relevance = _canada_relevance_score(title, link, "Government of Canada ISED")
-        records.append(
-            {
-                "source_id": guid,
-                "source_type": SourceType.gov,
-                "category": CategoryType.policy,
-                "title": title,
-                "url": link or "https://www.canada.ca/en/news.html",
-                "publisher": "Government of Canada",
-                "published_at": published_at,
-                "language": "en",
-                "jurisdiction": "Canada",
-                "entities": ["Government of Canada", "ISED"],
-                "tags": _extract_tags(title),
-                "hash": _fingerprint(guid, link, published_at),
-                "confidence": round(max(0.9, relevance), 2),
-                "relevance_score": relevance,
-            }
-        )
-    return records
-
-
-async def fetch_betakit_ai_metadata(limit: int = 5) -> list[dict[str, object]]:
-    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-        response = await client.get(BETAKIT_AI_RSS_URL)
-        response.raise_for_status()
-        xml_text = response.text
-
-    root = _safe_parse_xml(xml_text)
-    if root is None:
-        return []
-    items = root.findall(".//item")
-    records: list[dict[str, object]] = []
-    for item in items[:limit]:
-        title = _clean_text(item.findtext("title"))
-        if not title or not _contains_ai(title):
-            continue
-
-        link = _clean_text(item.findtext("link"))
-        guid_raw = _clean_text(item.findtext("guid")) or f"betakit-{uuid.uuid4().hex[:12]}"
-        guid = _normalize_source_id(guid_raw, prefix="betakit")
-        pubdate_raw = _clean_text(item.findtext("pubDate"))
-        try:
-            published_at = parsedate_to_datetime(pubdate_raw).astimezone(UTC)
-        except Exception:
-            published_at = datetime.now(UTC)
-
-        relevance = _canada_relevance_score(title, link, "BetaKit Canada")
-        records.append(
-            {
-                "source_id": guid,
-                "source_type": SourceType.media,
-                "category": CategoryType.news,
-                "title": title,
-                "url": link or "https://betakit.com/",
-                "publisher": "BetaKit",
-                "published_at": published_at,
-                "language": "en",
-                "jurisdiction": "Canada",
-                "entities": ["BetaKit"],
-                "tags": _extract_tags(title),
-                "hash": _fingerprint(guid, link, published_at),
-                "confidence": round(max(0.82, relevance), 2),
-                "relevance_score": relevance,
-            }
-        )
-    return records
-
-
 GITHUB_SEARCH_URL = "https://api.github.com/search/repositories"
 GITHUB_AI_CANADA_ORGS = ["maboroshi", "mila-iqia", "VectorInstitute", "CIFAR"]
 ARXIV_API_URL = "http://export.arxiv.org/api/query"
+GITHUB_SEARCH_MAX_RESULTS = 1000
 
 
-async def fetch_github_ai_canada_metadata(limit: int = 10) -> list[dict[str, object]]:
+async def fetch_github_ai_canada_metadata(client: httpx.AsyncClient, limit: int = 10) -> list[dict[str, object]]:
     """Search GitHub for AI repositories with Canadian connections."""
     query = "artificial intelligence canada language:python sort:updated"
-    params = {"q": query, "sort": "updated", "order": "desc", "per_page": str(min(limit, 30))}
     headers = {"Accept": "application/vnd.github+json"}
-
-    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-        response = await client.get(GITHUB_SEARCH_URL, params=params, headers=headers)
-        response.raise_for_status()
-        payload = response.json()
+    mark, resume, seen = _split_cursor(current_cursor())
+    repos: list[dict[str, object]] = []
+
+    if mark is None:
+        params = {"q": query, "sort": "updated", "order": "desc", "per_page": str(min(limit, 30))}
+        response = await conditional_get(client, GITHUB_SEARCH_URL, params=params, headers=headers)
+        if response is None:
+            return []
+        repos = response.json().get("items", [])[:limit]
+        advance_cursor(max((str(repo["pushed_at"]) for repo in repos if repo.get("pushed_at")), default=None))
+    else:
+        mark_value = mark.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        pushed_query = f"{query} pushed:>{mark_value}"
+        last_page = GITHUB_SEARCH_MAX_RESULTS // CURSOR_PAGE_SIZE
+        # Results are ordered by ``updated``, not by the ``pushed`` filter key, so the mark
+        # only moves once the search is read to the end. Resuming one page early covers
+        # repos that moved to the back of the order since the last run.
+        first_page = max(1, int(resume) - 1) if resume and resume.isdigit() else 1
+        next_page = first_page
+        finished = False
+        for page_number in range(first_page, min(first_page + CURSOR_MAX_PAGES, last_page + 1)):
+            params = {
+                "q": pushed_query,
+                "sort": "updated",
+                "order": "asc",
+                "per_page": str(CURSOR_PAGE_SIZE),
+                "page": str(page_number),
+            }
+            response = await conditional_get(client, GITHUB_SEARCH_URL, params=params, headers=headers)
+            next_page = page_number + 1
+            if response is None:
+                # The overlap page, unchanged since the last run: step past it.
+                continue
+            page = response.json().get("items", [])
+            repos.extend(page)
+            seen = max([seen, *(str(repo["pushed_at"]) for repo in page if repo.get("pushed_at"))])
+            # Search serves nothing past GITHUB_SEARCH_MAX_RESULTS, so the last page ends the read too.
+            if len(page) < CURSOR_PAGE_SIZE or page_number == last_page:
+                finished = True
+                break
+        if finished:
+            set_cursor(max(seen, mark_value))
+        elif next_page > first_page:
+            set_cursor(f"{mark_value}|{next_page}|{seen}")
 
     records: list[dict[str, object]] = []
-    for repo in payload.get("items", [])[:limit]:
+    for repo in repos:
         name = repo.get("full_name", "")
         description = repo.get("description") or ""
         title = f"{name}: {description[:120]}" if description else name
@@ -370,30 +444,51 @@ async def fetch_github_ai_canada_metadata(limit: int = 10) -> list[dict[str, obj
     return records
 
 
-async def fetch_arxiv_ai_canada_metadata(limit: int = 8) -> list[dict[str, object]]:
+async def fetch_arxiv_ai_canada_metadata(client: httpx.AsyncClient, limit: int = 8) -> list[dict[str, object]]:
     """Search ArXiv for recent AI papers with Canadian affiliations."""
     query = "all:artificial intelligence AND all:Canada"
-    params = {
-        "search_query": query,
-        "sortBy": "submittedDate",
-        "sortOrder": "descending",
-        "max_results": str(min(limit, 30)),
-    }
-
-    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-        response = await client.get(ARXIV_API_URL, params=params)
-        response.raise_for_status()
-        xml_text = response.text
-
-    root = _safe_parse_xml(xml_text)
-    if root is None:
-        return []
-
     ns = {"atom": "http://www.w3.org/2005/Atom"}
-    entries = root.findall("atom:entry", ns)
+    since = _cursor_datetime(current_cursor())
+    entries: list[ET.Element] = []
+
+    if since is None:
+        params = {
+            "search_query": query,
+            "sortBy": "submittedDate",
+            "sortOrder": "descending",
+            "max_results": str(min(limit, 30)),
+        }
+        response = await conditional_get(client, ARXIV_API_URL, params=params)
+        if response is None:
+            return []
+        root = _safe_parse_xml(response.text)
+        if root is None:
+            return []
+        entries = root.findall("atom:entry", ns)[:limit]
+    else:
+        submitted = f"submittedDate:[{since.astimezone(UTC):%Y%m%d%H%M} TO {datetime.now(UTC):%Y%m%d%H%M}]"
+        for page_number in range(CURSOR_MAX_PAGES):
+            params = {
+                "search_query": f"{query} AND {submitted}",
+                "sortBy": "submittedDate",
+                "sortOrder": "ascending",
+                "start": str(page_number * CURSOR_PAGE_SIZE),
+                "max_results": str(CURSOR_PAGE_SIZE),
+            }
+            response = await conditional_get(client, ARXIV_API_URL, params=params)
+            if response is None:
+                break
+            root = _safe_parse_xml(response.text)
+            page = root.findall("atom:entry", ns) if root is not None else []
+            entries.extend(page)
+            if len(page) < CURSOR_PAGE_SIZE:
+                break
+
+    published_values = [(entry.findtext("atom:published", "", ns) or "").strip() for entry in entries]
+    advance_cursor(max((value for value in published_values if value), default=None))
 
     records: list[dict[str, object]] = []
-    for entry in entries[:limit]:
+    for entry in entries:
         title = _clean_text(entry.findtext("atom:title", "", ns)).replace("\n", " ").strip()
         if not title or not _contains_ai(title):
             continue
@@ -439,70 +534,6 @@ async def fetch_arxiv_ai_canada_metadata(limit: int = 8) -> list[dict[str, objec
     return records
 
 
-async def fetch_google_news_canada_ai_metadata(limit: int = 8) -> list[dict[str, object]]:
-    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-        response = await client.get(GOOGLE_NEWS_CANADA_AI_RSS_URL)
-        response.raise_for_status()
-        xml_text = response.text
-
-    root = _safe_parse_xml(xml_text)
-    if root is None:
-        return []
-    items = root.findall(".//item")
-    records: list[dict[str, object]] = []
-    for item in items[:limit]:
-        raw_title = _clean_text(item.findtext("title"))
-        if not raw_title:
-            continue
-        if not _contains_ai(raw_title):
-            continue
-
-        link = _clean_text(item.findtext("link"))
-        guid_raw = _clean_text(item.findtext("guid")) or f"google-news-{uuid.uuid4().hex[:12]}"
-        guid = _normalize_source_id(guid_raw, prefix="google-news")
-        pubdate_raw = _clean_text(item.findtext("pubDate"))
-        try:
-            published_at = parsedate_to_datetime(pubdate_raw).astimezone(UTC)
-        except Exception:
-            published_at = datetime.now(UTC)
-
-        publisher = _extract_publisher_from_title(raw_title, "Google News")
-        title = raw_title.rsplit(" - ", 1)[0].strip() if " - " in raw_title else raw_title
-        relevance = _canada_relevance_score(title, link, publisher)
-        jurisdiction = _infer_jurisdiction(title, publisher, "Canada")
-        confidence = round(max(0.84, min(0.99, 0.55 + (0.5 * relevance))), 2)
-
-        records.append(
-            {
-                "source_id": guid,
-                "source_type": SourceType.media,
-                "category": CategoryType.news,
-                "title": title,
-                "url": link or "https://news.google.com/",
-                "publisher": publisher,
-                "published_at": published_at,
-                "language": "en",
-                "jurisdiction": jurisdiction if jurisdiction != "Global" else "Canada",
-                "entities": [publisher],
-                "tags": _extract_tags(title),
-                "hash": _fingerprint(guid, link, published_at),
-                "confidence": confidence,
-                "relevance_score": relevance,
-            }
-        )
-    return records
-
-TREASURY_BOARD_CANADA_RSS_URL = "https://www.canada.ca/en/treasury-board-secretariat/news/news-releases.rss"
-OPC_CANADA_RSS_URL = "https://www.priv.gc.ca/en/rss/news/"
-CRTC_CANADA_RSS_URL = "https://crtc.gc.ca/eng/rss/news.xml"
-CANADA_GAZETTE_P1_RSS_URL = "https://www.gazette.gc.ca/rss/p1-eng.xml"
-CANADA_GAZETTE_P2_RSS_URL = "https://www.gazette.gc.ca/rss/p2-eng.xml"
-CANADA_GAZETTE_P3_RSS_URL = "https://www.gazette.gc.ca/rss/en-ls-eng.xml"
-MILA_NEWS_RSS_URL = "https://mila.quebec/en/feed/"
-VECTOR_NEWS_RSS_URL = "https://vectorinstitute.ai/feed/"
-AMII_SITEMAP_URL = "https://www.amii.ca/sitemap.xml"
-CIFAR_AI_RSS_URL = "https://cifar.ca/feed/"
-CANADA_GAZETTE_FEED_URLS = (CANADA_GAZETTE_P1_RSS_URL, CANADA_GAZETTE_P2_RSS_URL, CANADA_GAZETTE_P3_RSS_URL)
 FEED_REQUEST_HEADERS = {
     "User-Agent": "AI-Canada-Pulse/1.0 (+https://localhost)",
     "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml;q=0.9, */*;q=0.8",
@@ -526,318 +557,6 @@ def _parse_published_at_from_text(raw_value: str) -> datetime:
         return datetime.now(UTC)
 
 
-def _rss_item_to_record(
-    item: ET.Element,
-    *,
-    feed_url: str,
-    publisher: str,
-    source_type: SourceType,
-    category: CategoryType,
-    source_prefix: str,
-    entities: list[str],
-    default_jurisdiction: str,
-    force_language: str,
-) -> dict[str, object] | None:
-    title = _clean_text(item.findtext("title"))
-    description = _clean_text(item.findtext("description"))
-    if not title:
-        return None
-
-    content_blob = " ".join([title, description, publisher, " ".join(entities)])
-    if not _contains_ai(content_blob):
-        return None
-
-    link = _clean_text(item.findtext("link"))
-    guid_raw = _clean_text(item.findtext("guid")) or link or f"{source_prefix}-{uuid.uuid4().hex[:12]}"
-    source_id = _normalize_source_id(guid_raw, prefix=source_prefix)
-    published_at = _parse_published_at_from_text(item.findtext("pubDate") or item.findtext("published") or "")
-
-    relevance = _canada_relevance_score(title, description, link, publisher, " ".join(entities), default_jurisdiction)
-    jurisdiction = _infer_jurisdiction(title, description, publisher, " ".join(entities), default_jurisdiction)
-    if jurisdiction == "Global":
-        jurisdiction = default_jurisdiction
-
-    confidence_floor = 0.84 if source_type == SourceType.gov else 0.78
-    confidence = round(max(confidence_floor, min(0.98, 0.52 + (0.5 * relevance))), 2)
-
-    return {
-        "source_id": source_id,
-        "source_type": source_type,
-        "category": category,
-        "title": title,
-        "url": link or feed_url,
-        "publisher": publisher,
-        "published_at": published_at,
-        "language": force_language,
-        "jurisdiction": jurisdiction,
-        "entities": entities,
-        "tags": _extract_tags(title),
-        "hash": _fingerprint(source_id, link or feed_url, published_at),
-        "confidence": confidence,
-        "relevance_score": relevance,
-    }
-
-
-def _atom_entry_to_record(
-    entry: ET.Element,
-    *,
-    feed_url: str,
-    publisher: str,
-    source_type: SourceType,
-    category: CategoryType,
-    source_prefix: str,
-    entities: list[str],
-    default_jurisdiction: str,
-    force_language: str,
-) -> dict[str, object] | None:
-    ns = "{http://www.w3.org/2005/Atom}"
-    title = _clean_text(entry.findtext(f"{ns}title"))
-    summary = _clean_text(entry.findtext(f"{ns}summary")) or _clean_text(entry.findtext(f"{ns}content"))
-    if not title:
-        return None
-
-    content_blob = " ".join([title, summary, publisher, " ".join(entities)])
-    if not _contains_ai(content_blob):
-        return None
-
-    link = ""
-    link_elem = entry.find(f"{ns}link")
-    if link_elem is not None:
-        link = _clean_text(link_elem.attrib.get("href"))
-
-    entry_id = _clean_text(entry.findtext(f"{ns}id")) or link or f"{source_prefix}-{uuid.uuid4().hex[:12]}"
-    source_id = _normalize_source_id(entry_id, prefix=source_prefix)
-    published_at = _parse_published_at_from_text(
-        entry.findtext(f"{ns}published") or entry.findtext(f"{ns}updated") or ""
-    )
-
-    relevance = _canada_relevance_score(title, summary, link, publisher, " ".join(entities), default_jurisdiction)
-    jurisdiction = _infer_jurisdiction(title, summary, publisher, " ".join(entities), default_jurisdiction)
-    if jurisdiction == "Global":
-        jurisdiction = default_jurisdiction
-
-    confidence_floor = 0.84 if source_type == SourceType.gov else 0.78
-    confidence = round(max(confidence_floor, min(0.98, 0.52 + (0.5 * relevance))), 2)
-
-    return {
-        "source_id": source_id,
-        "source_type": source_type,
-        "category": category,
-        "title": title,
-        "url": link or feed_url,
-        "publisher": publisher,
-        "published_at": published_at,
-        "language": force_language,
-        "jurisdiction": jurisdiction,
-        "entities": entities,
-        "tags": _extract_tags(title),
-        "hash": _fingerprint(source_id, link or feed_url, published_at),
-        "confidence": confidence,
-        "relevance_score": relevance,
-    }
-
-
-async def _fetch_canadian_feed_metadata(
-    *,
-    feed_url: str,
-    publisher: str,
-    source_type: SourceType,
-    category: CategoryType,
-    source_prefix: str,
-    entities: list[str],
-    default_jurisdiction: str,
-    force_language: str = "en",
-    limit: int = 6,
-    headers: dict[str, str] | None = None,
-    verify: bool = True,
-) -> list[dict[str, object]]:
-    async with httpx.AsyncClient(
-        timeout=15.0,
-        follow_redirects=True,
-        headers=headers or FEED_REQUEST_HEADERS,
-        verify=verify,
-    ) as client:
-        response = await client.get(feed_url)
-        response.raise_for_status()
-        xml_text = response.text
-
-    root = _safe_parse_xml(xml_text)
-    if root is None:
-        return []
-
-    records: list[dict[str, object]] = []
-    rss_items = root.findall(".//item")
-    if rss_items:
-        for item in rss_items[:limit]:
-            record = _rss_item_to_record(
-                item,
-                feed_url=feed_url,
-                publisher=publisher,
-                source_type=source_type,
-                category=category,
-                source_prefix=source_prefix,
-                entities=entities,
-                default_jurisdiction=default_jurisdiction,
-                force_language=force_language,
-            )
-            if record:
-                records.append(record)
-        return records
-
-    atom_entries = root.findall("{http://www.w3.org/2005/Atom}entry")
-    for entry in atom_entries[:limit]:
-        record = _atom_entry_to_record(
-            entry,
-            feed_url=feed_url,
-            publisher=publisher,
-            source_type=source_type,
-            category=category,
-            source_prefix=source_prefix,
-            entities=entities,
-            default_jurisdiction=default_jurisdiction,
-            force_language=force_language,
-        )
-        if record:
-            records.append(record)
-    return records
-
-
-async def fetch_treasury_board_canada_metadata(limit: int = 6) -> list[dict[str, object]]:
-    return await _fetch_canadian_feed_metadata(
-        feed_url=TREASURY_BOARD_CANADA_RSS_URL,
-        publisher="Treasury Board of Canada Secretariat",
-        source_type=SourceType.gov,
-        category=CategoryType.policy,
-        source_prefix="tbs",
-        entities=["Treasury Board of Canada Secretariat", "Government of Canada"],
-        default_jurisdiction="Canada",
-        limit=limit,
-    )
-
-
-async def fetch_opc_canada_metadata(limit: int = 6) -> list[dict[str, object]]:
-    return await _fetch_canadian_feed_metadata(
-        feed_url=OPC_CANADA_RSS_URL,
-        publisher="Office of the Privacy Commissioner of Canada",
-        source_type=SourceType.gov,
-        category=CategoryType.policy,
-        source_prefix="opc",
-        entities=["Office of the Privacy Commissioner of Canada", "Government of Canada"],
-        default_jurisdiction="Canada",
-        limit=limit,
-    )
-
-
-async def fetch_mila_news_metadata(limit: int = 8) -> list[dict[str, object]]:
-    return await _fetch_canadian_feed_metadata(
-        feed_url=MILA_NEWS_RSS_URL,
-        publisher="Mila",
-        source_type=SourceType.academic,
-        category=CategoryType.research,
-        source_prefix="mila",
-        entities=["Mila", "Quebec", "Montreal"],
-        default_jurisdiction="Quebec",
-        limit=limit,
-    )
-
-
-async def fetch_vector_news_metadata(limit: int = 8) -> list[dict[str, object]]:
-    return await _fetch_canadian_feed_metadata(
-        feed_url=VECTOR_NEWS_RSS_URL,
-        publisher="Vector Institute",
-        source_type=SourceType.academic,
-        category=CategoryType.research,
-        source_prefix="vector",
-        entities=["Vector Institute", "Ontario", "Toronto"],
-        default_jurisdiction="Ontario",
-        limit=limit,
-    )
-
-
-
-async def fetch_amii_news_metadata(limit: int = 8) -> list[dict[str, object]]:
-    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True, headers=FEED_REQUEST_HEADERS) as client:
-        response = await client.get(AMII_SITEMAP_URL)
-        response.raise_for_status()
-        xml_text = response.text
-
-    root = _safe_parse_xml(xml_text)
-    if root is None:
-        return []
-
-    sitemap_ns = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
-    candidates: list[tuple[str, str]] = []
-    for url_entry in root.findall(f"{sitemap_ns}url"):
-        loc = _clean_text(url_entry.findtext(f"{sitemap_ns}loc"))
-        if "/updates-insights/" not in loc:
-            continue
-        normalized_loc = loc.rstrip("/")
-        if normalized_loc.endswith("/updates-insights"):
-            continue
-        lastmod = _clean_text(url_entry.findtext(f"{sitemap_ns}lastmod"))
-        candidates.append((loc, lastmod))
-
-    candidates.sort(key=lambda value: _parse_published_at_from_text(value[1]), reverse=True)
-    records: list[dict[str, object]] = []
-    scan_limit = max(limit * 6, 60)
-    for loc, lastmod in candidates[:scan_limit]:
-        slug = loc.rstrip("/").split("/")[-1]
-        if not slug:
-            continue
-        title = re.sub(r"[-_]+", " ", slug).strip()
-        title = re.sub(r"\s+", " ", title)
-        if not title:
-            continue
-
-        source_id = _normalize_source_id(f"amii-{slug}", prefix="amii")
-        published_at = _parse_published_at_from_text(lastmod)
-        relevance = _canada_relevance_score(title, loc, "Amii Alberta Canada artificial intelligence")
-        confidence = round(max(0.82, min(0.97, 0.56 + (0.45 * relevance))), 2)
-        records.append(
-            {
-                "source_id": source_id,
-                "source_type": SourceType.academic,
-                "category": CategoryType.research,
-                "title": title,
-                "url": loc,
-                "publisher": "Amii",
-                "published_at": published_at,
-                "language": "en",
-                "jurisdiction": "Alberta",
-                "entities": ["Amii", "Alberta", "Canada"],
-                "tags": _extract_tags(title),
-                "hash": _fingerprint(source_id, loc, published_at),
-                "confidence": confidence,
-                "relevance_score": relevance,
-            }
-        )
-        if len(records) >= limit:
-            break
-    return records
-
-
-async def fetch_cifar_ai_metadata(limit: int = 8) -> list[dict[str, object]]:
-    records = await _fetch_canadian_feed_metadata(
-        feed_url=CIFAR_AI_RSS_URL,
-        publisher="CIFAR",
-        source_type=SourceType.academic,
-        category=CategoryType.research,
-        source_prefix="cifar",
-        entities=["CIFAR", "Canada"],
-        default_jurisdiction="Canada",
-        limit=max(limit * 4, 24),
-    )
-    for record in records:
-        record["confidence"] = round(max(float(record.get("confidence", 0.0)), 0.84), 2)
-        record["relevance_score"] = max(float(record.get("relevance_score", 0.0)), 0.5)
-        if record.get("jurisdiction") in {"", "Global"}:
-            record["jurisdiction"] = "Canada"
-    return records
-
-
-NSERC_AI_RSS_URL = "https://news.google.com/rss/search?q=NSERC+artificial+intelligence+Canada+funding&hl=en-CA&gl=CA&ceid=CA:en"
-CIHR_AI_RSS_URL = "https://news.google.com/rss/search?q=CIHR+artificial+intelligence+Canada+funding&hl=en-CA&gl=CA&ceid=CA:en"
-CFI_AI_RSS_URL = "https://news.google.com/rss/search?q=Canada+Foundation+for+Innovation+artificial+intelligence+Canada&hl=en-CA&gl=CA&ceid=CA:en"
 CROSSREF_WORKS_API_URL = "https://api.crossref.org/works"
 
 
@@ -874,80 +593,6 @@ def _sort_records_latest(records: list[dict[str, object]]) -> list[dict[str, obj
     return sorted(records, key=lambda r: r.get("published_at") or datetime.now(UTC), reverse=True)
 
 
-async def _fetch_google_news_topic_metadata(
-    *,
-    feed_url: str,
-    source_prefix: str,
-    source_type: SourceType,
-    category: CategoryType,
-    default_publisher: str,
-    entity_hints: list[str],
-    default_jurisdiction: str,
-    limit: int = 8,
-) -> list[dict[str, object]]:
-    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True, headers=FEED_REQUEST_HEADERS) as client:
-        response = await client.get(feed_url)
-        response.raise_for_status()
-        xml_text = response.text
-
-    root = _safe_parse_xml(xml_text)
-    if root is None:
-        return []
-
-    records: list[dict[str, object]] = []
-    scan_limit = max(limit * 4, 24)
-    items = root.findall(".//item")
-    for item in items[:scan_limit]:
-        raw_title = _clean_text(item.findtext("title"))
-        if not raw_title:
-            continue
-        if not _contains_ai(raw_title):
-            continue
-
-        link = _clean_text(item.findtext("link"))
-        guid_raw = _clean_text(item.findtext("guid")) or link or f"{source_prefix}-{uuid.uuid4().hex[:12]}"
-        source_id = _normalize_source_id(guid_raw, prefix=source_prefix)
-        published_at = _parse_published_at_from_text(_clean_text(item.findtext("pubDate")))
-
-        publisher = _extract_publisher_from_title(raw_title, default_publisher)
-        title = raw_title.rsplit(" - ", 1)[0].strip() if " - " in raw_title else raw_title
-        entities = [publisher] + [ent for ent in entity_hints if ent != publisher]
-        entities = entities[:5]
-
-        relevance = _canada_relevance_score(title, link, default_publisher, publisher, " ".join(entities))
-        jurisdiction = _infer_jurisdiction(title, publisher, default_jurisdiction)
-        if jurisdiction == "Global":
-            jurisdiction = default_jurisdiction
-
-        confidence = round(max(0.84, min(0.99, 0.56 + (0.44 * relevance))), 2)
-        records.append(
-            {
-                "source_id": source_id,
-                "source_type": source_type,
-                "category": category,
-                "title": title,
-                "url": link or feed_url,
-                "publisher": publisher,
-                "published_at": published_at,
-                "language": "en",
-                "jurisdiction": jurisdiction,
-                "entities": entities,
-                "tags": _extract_tags(title),
-                "hash": _fingerprint(source_id, link or feed_url, published_at),
-                "confidence": confidence,
-                "relevance_score": relevance,
-            }
-        )
-
-    deduped: dict[str, dict[str, object]] = {}
-    for record in _sort_records_latest(records):
-        dedupe_key = str(record.get("source_id") or record.get("url") or "")
-        if dedupe_key and dedupe_key not in deduped:
-            deduped[dedupe_key] = record
-
-    return list(deduped.values())[:limit]
-
-
 def _crossref_item_datetime(item: dict[str, object]) -> datetime:
     for date_key in ("published-online", "published-print", "issued", "created"):
         value = item.get(date_key)
@@ -982,184 +627,382 @@ def _crossref_authors(item: dict[str, object]) -> list[str]:
     return authors[:6]
 
 
-async def fetch_nserc_ai_metadata(limit: int = 8) -> list[dict[str, object]]:
-    return await _fetch_google_news_topic_metadata(
-        feed_url=NSERC_AI_RSS_URL,
-        source_prefix="nserc",
-        source_type=SourceType.funding,
-        category=CategoryType.funding,
-        default_publisher="NSERC",
-        entity_hints=["NSERC", "Government of Canada", "Canada"],
-        default_jurisdiction="Canada",
-        limit=limit,
-    )
+def _crossref_to_record(item: Mapping[str, object]) -> dict[str, object] | None:
+    title_values = item.get("title") or []
+    title = _clean_text(title_values[0] if title_values else "")
+    if not title:
+        return None
 
+    publisher = _clean_text(item.get("publisher")) or "Crossref"
+    container_values = item.get("container-title") or []
+    venue = _clean_text(container_values[0] if container_values else "")
+    authors = _crossref_authors(item)
+    description_blob = " ".join(part for part in [title, venue, publisher, " ".join(authors)] if part)
+    if not _contains_ai(description_blob):
+        return None
+
+    doi = _clean_text(item.get("DOI"))
+    url = _clean_text(item.get("URL"))
+    if not url and doi:
+        url = f"https://doi.org/{doi}"
+    if not url:
+        return None
 
-async def fetch_cihr_ai_metadata(limit: int = 8) -> list[dict[str, object]]:
-    return await _fetch_google_news_topic_metadata(
-        feed_url=CIHR_AI_RSS_URL,
-        source_prefix="cihr",
-        source_type=SourceType.funding,
-        category=CategoryType.funding,
-        default_publisher="CIHR",
-        entity_hints=["CIHR", "Government of Canada", "Canada"],
-        default_jurisdiction="Canada",
-        limit=limit,
+    published_at = _crossref_item_datetime(item)
+    source_id = _normalize_source_id(f"crossref-{doi or uuid.uuid4().hex[:12]}", prefix="crossref")
+
+    relevance = _canada_relevance_score(title, venue, publisher, " ".join(authors), "Canada")
+    jurisdiction = _infer_jurisdiction(title, venue, publisher, " ".join(authors), "Canada")
+    if jurisdiction == "Global":
+        jurisdiction = "Canada"
+
+    confidence = round(max(0.82, min(0.98, 0.58 + (0.4 * relevance))), 2)
+    entities = [publisher] + authors[:3]
+
+    return {
+        "source_id": source_id,
+        "source_type": SourceType.academic,
+        "category": CategoryType.research,
+        "title": title,
+        "url": url,
+        "publisher": publisher,
+        "published_at": published_at,
+        "language": "en",
+        "jurisdiction": jurisdiction,
+        "entities": entities,
+        "tags": _extract_tags(title) + ["crossref"],
+        "hash": _fingerprint(source_id, url, published_at),
+        "confidence": confidence,
+        "relevance_score": relevance,
+    }
+
+
+def _crossref_indexed(items: list[object]) -> list[str]:
+    return [
+        str(item["indexed"]["date-time"])
+        for item in items
+        if isinstance(item, dict) and isinstance(item.get("indexed"), dict) and item["indexed"].get("date-time")
+    ]
+
+
+async def fetch_crossref_ai_canada_metadata(client: httpx.AsyncClient, limit: int = 10) -> list[dict[str, object]]:
+    """Crossref works about AI in Canada; with a cursor, every work indexed since the mark's day.
+
+    Like GitHub, the read resumes from a stored row offset rather than
+    Crossref's ``next-cursor``, which expires minutes after use, and the mark
+    only moves once the read reaches the end, so a day with more matches
+    than one run's page budget is read across runs instead of re-read.
+    """
+    query = {"query.title": "artificial intelligence Canada", "query": "Canada AI machine learning"}
+    base_filter = "from-pub-date:2023-01-01,type:journal-article"
+    mark, resume, seen = _split_cursor(current_cursor())
+    items: list[object] = []
+
+    if mark is None:
+        params = {
+            **query,
+            "rows": str(min(max(limit * 6, 40), 100)),
+            "sort": "published",
+            "order": "desc",
+            "filter": base_filter,
+        }
+        response = await conditional_get(client, CROSSREF_WORKS_API_URL, params=params, headers=FEED_REQUEST_HEADERS)
+        if response is None:
+            return []
+        items = response.json().get("message", {}).get("items", [])
+        advance_cursor(max(_crossref_indexed(items), default=None))
+    else:
+        mark_date = mark.date().isoformat()
+        # Re-indexed works move to the back of the order; one page of overlap covers the shift.
+        offset = max(0, int(resume) - CURSOR_PAGE_SIZE) if resume and resume.isdigit() else 0
+        finished = False
+        for _ in range(CURSOR_MAX_PAGES):
+            params = {
+                **query,
+                "rows": str(CURSOR_PAGE_SIZE),
+                "sort": "indexed",
+                "order": "asc",
+                "filter": f"{base_filter},from-index-date:{mark_date}",
+                "offset": str(offset),
+            }
+            response = await conditional_get(
+                client, CROSSREF_WORKS_API_URL, params=params, headers=FEED_REQUEST_HEADERS
+            )
+            # A 304 is the overlap page, unchanged since the last run: step past it.
+            page = response.json().get("message", {}).get("items", []) if response is not None else None
+            if page is not None:
+                items.extend(page)
+                seen = max([seen, *_crossref_indexed(page)])
+                if len(page) < CURSOR_PAGE_SIZE:
+                    finished = True
+                    break
+            offset += CURSOR_PAGE_SIZE
+            if offset >= CROSSREF_MAX_OFFSET:
+                finished = True
+                break
+        if finished:
+            # The index date is inclusive, so works indexed later that same day are not lost.
+            set_cursor(max(seen, mark_date))
+        elif offset:
+            set_cursor(f"{mark_date}|{offset}|{seen}")
+
+    records = await normalize_items(_crossref_to_record, [item for item in items if isinstance(item, dict)])
+
+    deduped: dict[str, dict[str, object]] = {}
+    for record in _sort_records_latest(records):
+        dedupe_key = str(record.get("source_id") or record.get("url") or "")
+        if dedupe_key and dedupe_key not in deduped:
+            deduped[dedupe_key] = record
+
+    if mark is not None:
+        return list(deduped.values())
+    return list(deduped.values())[:limit]
+
+
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+
+def _feed_record(
+    source: SourceDefinition,
+    *,
+    feed_url: str,
+    title: str,
+    summary: str,
+    link: str,
+    entry_id: str,
+    published_raw: str,
+) -> dict[str, object] | None:
+    if not title:
+        return None
+    entities = list(source.entities)
+    content_blob = " ".join([title, summary, source.publisher, " ".join(entities)])
+    if not _contains_ai(content_blob):
+        return None
+
+    source_id = _normalize_source_id(
+        entry_id or link or f"{source.id_prefix}-{uuid.uuid4().hex[:12]}",
+        prefix=source.id_prefix,
     )
+    published_at = _parse_published_at_from_text(published_raw)
+    parts = (title, summary, link, source.publisher, " ".join(entities), source.jurisdiction)
+    relevance = _canada_relevance_score(*parts)
+    jurisdiction = _infer_jurisdiction(title, summary, source.publisher, " ".join(entities), source.jurisdiction)
+    if jurisdiction == "Global":
+        jurisdiction = source.jurisdiction
+
+    return {
+        "source_id": source_id,
+        "source_type": SourceType(source.source_type),
+        "category": CategoryType(source.category),
+        "title": title,
+        "url": link or feed_url,
+        "publisher": source.publisher,
+        "published_at": published_at,
+        "language": source.language,
+        "jurisdiction": jurisdiction,
+        "entities": entities,
+        "tags": _extract_tags(title),
+        "hash": _fingerprint(source_id, link or feed_url, published_at),
+        "confidence": source.confidence.score(relevance),
+        "relevance_score": relevance,
+    }
 
 
-async def fetch_cfi_ai_metadata(limit: int = 8) -> list[dict[str, object]]:
-    return await _fetch_google_news_topic_metadata(
-        feed_url=CFI_AI_RSS_URL,
-        source_prefix="cfi",
-        source_type=SourceType.funding,
-        category=CategoryType.funding,
-        default_publisher="CFI",
-        entity_hints=["CFI", "Canada Foundation for Innovation", "Canada"],
-        default_jurisdiction="Canada",
-        limit=limit,
+def _rss_item_to_record(item: ET.Element, source: SourceDefinition, feed_url: str) -> dict[str, object] | None:
+    return _feed_record(
+        source,
+        feed_url=feed_url,
+        title=_clean_text(item.findtext("title")),
+        summary=_clean_text(item.findtext("description")),
+        link=_clean_text(item.findtext("link")),
+        entry_id=_clean_text(item.findtext("guid")),
+        published_raw=item.findtext("pubDate") or item.findtext("published") or "",
     )
 
 
-async def fetch_crossref_ai_canada_metadata(limit: int = 10) -> list[dict[str, object]]:
-    params = {
-        "query.title": "artificial intelligence Canada",
-        "query": "Canada AI machine learning",
-        "rows": str(min(max(limit * 6, 40), 100)),
-        "sort": "published",
-        "order": "desc",
-        "filter": "from-pub-date:2023-01-01,type:journal-article",
-    }
+def _atom_entry_to_record(entry: ET.Element, source: SourceDefinition, feed_url: str) -> dict[str, object] | None:
+    link_elem = entry.find(f"{ATOM_NS}link")
+    return _feed_record(
+        source,
+        feed_url=feed_url,
+        title=_clean_text(entry.findtext(f"{ATOM_NS}title")),
+        summary=_clean_text(entry.findtext(f"{ATOM_NS}summary")) or _clean_text(entry.findtext(f"{ATOM_NS}content")),
+        link=_clean_text(link_elem.attrib.get("href")) if link_elem is not None else "",
+        entry_id=_clean_text(entry.findtext(f"{ATOM_NS}id")),
+        published_raw=entry.findtext(f"{ATOM_NS}published") or entry.findtext(f"{ATOM_NS}updated") or "",
+    )
 
-    async with httpx.AsyncClient(timeout=20.0, follow_redirects=True, headers=FEED_REQUEST_HEADERS) as client:
-        response = await client.get(CROSSREF_WORKS_API_URL, params=params)
-        response.raise_for_status()
-        payload = response.json()
 
+async def _parse_feed(source: SourceDefinition, feed_url: str, response: httpx.Response) -> list[dict[str, object]]:
+    entries = await collect_elements(
+        response,
+        {"item", f"{ATOM_NS}entry"},
+        limit=source.scan_limit or source.limit,
+    )
+    # A feed is either RSS or Atom; items win if a document somehow mixes both.
+    if any(entry.tag == "item" for entry in entries):
+        entries = [entry for entry in entries if entry.tag == "item"]
     records: list[dict[str, object]] = []
-    for item in payload.get("message", {}).get("items", []):
-        if not isinstance(item, dict):
-            continue
+    for entry in entries:
+        to_record = _rss_item_to_record if entry.tag == "item" else _atom_entry_to_record
+        record = to_record(entry, source, feed_url)
+        if record:
+            records.append(record)
+    return records
 
-        title_values = item.get("title") or []
-        title = _clean_text(title_values[0] if title_values else "")
-        if not title:
-            continue
 
-        publisher = _clean_text(item.get("publisher")) or "Crossref"
-        container_values = item.get("container-title") or []
-        venue = _clean_text(container_values[0] if container_values else "")
-        authors = _crossref_authors(item)
-        description_blob = " ".join(part for part in [title, venue, publisher, " ".join(authors)] if part)
-        if not _contains_ai(description_blob):
+async def _parse_google_news(
+    source: SourceDefinition, feed_url: str, response: httpx.Response
+) -> list[dict[str, object]]:
+    """Google News search results: the outlet is the " - Publisher" title suffix."""
+    items = await collect_elements(response, {"item"}, limit=source.scan_limit or source.limit)
+    records: list[dict[str, object]] = []
+    for item in items:
+        raw_title = _clean_text(item.findtext("title"))
+        if not raw_title or not _contains_ai(raw_title):
             continue
 
-        doi = _clean_text(item.get("DOI"))
-        url = _clean_text(item.get("URL"))
-        if not url and doi:
-            url = f"https://doi.org/{doi}"
-        if not url:
-            continue
+        link = _clean_text(item.findtext("link"))
+        guid_raw = _clean_text(item.findtext("guid")) or link or f"{source.id_prefix}-{uuid.uuid4().hex[:12]}"
+        source_id = _normalize_source_id(guid_raw, prefix=source.id_prefix)
+        published_at = _parse_published_at_from_text(_clean_text(item.findtext("pubDate")))
 
-        published_at = _crossref_item_datetime(item)
-        source_id = _normalize_source_id(f"crossref-{doi or uuid.uuid4().hex[:12]}", prefix="crossref")
+        publisher = _extract_publisher_from_title(raw_title, source.publisher)
+        title = raw_title.rsplit(" - ", 1)[0].strip() if " - " in raw_title else raw_title
+        entities = ([publisher] + [ent for ent in source.entities if ent != publisher])[:5]
 
-        relevance = _canada_relevance_score(title, venue, publisher, " ".join(authors), "Canada")
-        jurisdiction = _infer_jurisdiction(title, venue, publisher, " ".join(authors), "Canada")
+        relevance = _canada_relevance_score(title, link, source.publisher, publisher, " ".join(entities))
+        jurisdiction = _infer_jurisdiction(title, publisher, source.jurisdiction)
         if jurisdiction == "Global":
-            jurisdiction = "Canada"
-
-        confidence = round(max(0.82, min(0.98, 0.58 + (0.4 * relevance))), 2)
-        entities = [publisher] + authors[:3]
+            jurisdiction = source.jurisdiction
 
         records.append(
             {
                 "source_id": source_id,
-                "source_type": SourceType.academic,
-                "category": CategoryType.research,
+                "source_type": SourceType(source.source_type),
+                "category": CategoryType(source.category),
                 "title": title,
-                "url": url,
+                "url": link or feed_url,
                 "publisher": publisher,
                 "published_at": published_at,
-                "language": "en",
+                "language": source.language,
                 "jurisdiction": jurisdiction,
                 "entities": entities,
-                "tags": _extract_tags(title) + ["crossref"],
-                "hash": _fingerprint(source_id, url, published_at),
-                "confidence": confidence,
+                "tags": _extract_tags(title),
+                "hash": _fingerprint(source_id, link or feed_url, published_at),
+                "confidence": source.confidence.score(relevance),
                 "relevance_score": relevance,
             }
         )
-
-    deduped: dict[str, dict[str, object]] = {}
-    for record in _sort_records_latest(records):
-        dedupe_key = str(record.get("source_id") or record.get("url") or "")
-        if dedupe_key and dedupe_key not in deduped:
-            deduped[dedupe_key] = record
-
-    return list(deduped.values())[:limit]
+    return records
 
 
-async def fetch_crtc_canada_metadata(limit: int = 6) -> list[dict[str, object]]:
-    records = await _fetch_canadian_feed_metadata(
-        feed_url=CRTC_CANADA_RSS_URL,
-        publisher="CRTC",
-        source_type=SourceType.gov,
-        category=CategoryType.policy,
-        source_prefix="crtc",
-        entities=["CRTC", "Government of Canada", "Telecommunications"],
-        default_jurisdiction="Canada",
-        limit=max(limit * 12, 72),
-        verify=False,
-    )
+async def _parse_sitemap(source: SourceDefinition, feed_url: str, response: httpx.Response) -> list[dict[str, object]]:
+    """Pages under ``sitemap_section``, newest ``lastmod`` first, titled from their slugs."""
+    section = source.sitemap_section.rstrip("/")
+    candidates: list[tuple[str, str]] = []
+    # Sitemaps aren't date-ordered, so every entry is read, but only matching
+    # (loc, lastmod) pairs are kept.
+    async for url_entry in iter_elements(response, {f"{SITEMAP_NS}url"}):
+        loc = _clean_text(url_entry.findtext(f"{SITEMAP_NS}loc"))
+        if f"{section}/" not in loc or loc.rstrip("/").endswith(section):
+            continue
+        candidates.append((loc, _clean_text(url_entry.findtext(f"{SITEMAP_NS}lastmod"))))
 
-    tuned: list[dict[str, object]] = []
-    for record in records:
-        age_days = _source_record_age_days(record)
-        if age_days is not None and age_days > 540:
+    candidates.sort(key=lambda value: _parse_published_at_from_text(value[1]), reverse=True)
+    entities = list(source.entities)
+    records: list[dict[str, object]] = []
+    for loc, lastmod in candidates[: source.scan_limit or source.limit]:
+        slug = loc.rstrip("/").split("/")[-1]
+        title = re.sub(r"\s+", " ", re.sub(r"[-_]+", " ", slug)).strip()
+        if not title:
             continue
-        _apply_policy_recency_boost(record)
-        tags = [str(tag) for tag in record.get("tags", [])]
-        if "crtc" not in tags:
-            tags.append("crtc")
-        record["tags"] = tags
-        tuned.append(record)
 
-    return _sort_records_latest(tuned)[: max(limit * 2, 12)]
+        source_id = _normalize_source_id(f"{source.id_prefix}-{slug}", prefix=source.id_prefix)
+        published_at = _parse_published_at_from_text(lastmod)
+        relevance = _canada_relevance_score(title, loc, source.publisher, " ".join(entities))
+        records.append(
+            {
+                "source_id": source_id,
+                "source_type": SourceType(source.source_type),
+                "category": CategoryType(source.category),
+                "title": title,
+                "url": loc,
+                "publisher": source.publisher,
+                "published_at": published_at,
+                "language": source.language,
+                "jurisdiction": source.jurisdiction,
+                "entities": entities,
+                "tags": _extract_tags(title),
+                "hash": _fingerprint(source_id, loc, published_at),
+                "confidence": source.confidence.score(relevance),
+                "relevance_score": relevance,
+            }
+        )
+        if len(records) >= source.limit:
+            break
+    return records
 
 
-async def fetch_canada_gazette_ai_metadata(limit: int = 8) -> list[dict[str, object]]:
-    records: list[dict[str, object]] = []
-    for feed_url in CANADA_GAZETTE_FEED_URLS:
-        records.extend(
-            await _fetch_canadian_feed_metadata(
-                feed_url=feed_url,
-                publisher="Canada Gazette",
-                source_type=SourceType.gov,
-                category=CategoryType.policy,
-                source_prefix="gazette",
-                entities=["Canada Gazette", "Government of Canada"],
-                default_jurisdiction="Canada",
-                limit=max(limit * 12, 96),
-            )
-        )
+FeedParser = Callable[[SourceDefinition, str, httpx.Response], Awaitable[list[dict[str, object]]]]
+FEED_PARSERS: dict[str, FeedParser] = {
+    "rss": _parse_feed,
+    "google_news": _parse_google_news,
+    "sitemap": _parse_sitemap,
+}
+API_FETCHERS: dict[str, Callable[..., Awaitable[list[dict[str, object]]]]] = {
+    "openalex": fetch_openalex_metadata,
+    "github": fetch_github_ai_canada_metadata,
+    "arxiv": fetch_arxiv_ai_canada_metadata,
+    "crossref": fetch_crossref_ai_canada_metadata,
+}
+
 
-    deduped_by_key: dict[str, dict[str, object]] = {}
+def _finish_feed_records(source: SourceDefinition, records: list[dict[str, object]]) -> list[dict[str, object]]:
+    deduped: dict[str, dict[str, object]] = {}
     for record in _sort_records_latest(records):
         dedupe_key = str(record.get("source_id") or record.get("url") or record.get("title") or "")
-        if dedupe_key and dedupe_key not in deduped_by_key:
-            deduped_by_key[dedupe_key] = record
+        if dedupe_key and dedupe_key not in deduped:
+            deduped[dedupe_key] = record
 
-    tuned: list[dict[str, object]] = []
-    for record in deduped_by_key.values():
-        age_days = _source_record_age_days(record)
-        if age_days is not None and age_days > 540:
-            continue
-        _apply_policy_recency_boost(record)
-        tags = [str(tag) for tag in record.get("tags", [])]
-        if "gazette" not in tags:
-            tags.append("gazette")
-        record["tags"] = tags
-        tuned.append(record)
-
-    return _sort_records_latest(tuned)[: max(limit * 3, 24)]
+    finished: list[dict[str, object]] = []
+    for record in deduped.values():
+        if source.max_age_days is not None:
+            age_days = _source_record_age_days(record)
+            if age_days is not None and age_days > source.max_age_days:
+                continue
+        if source.recency_boost:
+            _apply_policy_recency_boost(record)
+        if source.relevance_floor:
+            record["relevance_score"] = max(float(record.get("relevance_score", 0.0)), source.relevance_floor)
+        if source.extra_tag and source.extra_tag not in record["tags"]:
+            record["tags"] = [*record["tags"], source.extra_tag]
+        finished.append(record)
+    return finished[: source.limit]
+
+
+def has_adapter(source: SourceDefinition) -> bool:
+    return source.parser in API_FETCHERS or (source.parser in FEED_PARSERS and bool(source.urls))
+
+
+async def fetch_source_records(source: SourceDefinition, client: httpx.AsyncClient) -> list[dict[str, object]]:
+    """Run ``source``'s adapter spec on ``client`` and return its candidate records.
+
+    Feeds are fetched with conditional, streamed requests; a feed answering
+    ``304`` contributes nothing. ``client`` must honour ``source.verify_tls``.
+    """
+    api_fetcher = API_FETCHERS.get(source.parser)
+    if api_fetcher is not None:
+        return await api_fetcher(client, limit=source.limit)
+    parse = FEED_PARSERS.get(source.parser)
+    if parse is None:
+        return []
+
+    records: list[dict[str, object]] = []
+    for feed_url in source.urls:
+        async with conditional_stream(client, feed_url, headers=FEED_REQUEST_HEADERS) as response:
+            if response is not None:
+                records.extend(await parse(source, feed_url, response))
+    return _finish_feed_records(source, records)
@@ -1,14 +1,60 @@
 from dataclasses import dataclass
 
+GOOGLE_NEWS_SEARCH_URL = "https://news.google.com/rss/search?q={query}&hl=en-CA&gl=CA&ceid=CA:en"
+
+
+@dataclass(frozen=True, slots=True)
+class ConfidencePolicy:
+    """Record confidence as ``base + slope * relevance``, clamped to [floor, ceiling]."""
+
+    base: float = 0.52
+    slope: float = 0.5
+    floor: float = 0.78
+    ceiling: float = 0.98
+
+    def score(self, relevance: float) -> float:
+        return round(max(self.floor, min(self.ceiling, self.base + self.slope * relevance)), 2)
+
+
+GOV_FEED_CONFIDENCE = ConfidencePolicy(floor=0.84)
+NEWS_SEARCH_CONFIDENCE = ConfidencePolicy(base=0.56, slope=0.44, floor=0.84, ceiling=0.99)
+
 
 @dataclass(frozen=True, slots=True)
 class SourceDefinition:
+    """A tracked source and, when ``parser`` is set, the spec the adapter engine runs.
+
+    Feed parsers ("rss", "google_news", "sitemap") read ``urls`` generically;
+    API parsers ("openalex", "github", "arxiv", "crossref") call that API's
+    fetcher. ``scan_limit`` items are read from each feed (``limit`` when 0)
+    and at most ``limit`` records are returned. Sources without a parser are
+    listed in health views but never fetched.
+    """
+
     key: str
     display_name: str
     source_type: str
     acquisition_mode: str
     cadence_minutes: int
     enabled: bool = True
+    host: str = ""
+    parser: str = ""
+    urls: tuple[str, ...] = ()
+    category: str = ""
+    publisher: str = ""
+    id_prefix: str = ""
+    entities: tuple[str, ...] = ()
+    jurisdiction: str = "Canada"
+    language: str = "en"
+    confidence: ConfidencePolicy = ConfidencePolicy()
+    limit: int = 8
+    scan_limit: int = 0
+    max_age_days: int | None = None
+    recency_boost: bool = False
+    extra_tag: str = ""
+    relevance_floor: float = 0.0
+    sitemap_section: str = ""
+    verify_tls: bool = True
 
 
 SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
@@ -18,6 +64,9 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="academic",
         acquisition_mode="api",
         cadence_minutes=30,
+        host="api.openalex.org",
+        parser="openalex",
+        limit=6,
     ),
     SourceDefinition(
         key="canada_gov_ised",
@@ -25,6 +74,18 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="gov",
         acquisition_mode="rss",
         cadence_minutes=30,
+        host="www.canada.ca",
+        parser="rss",
+        urls=(
+            "https://www.canada.ca/en/news/advanced-news-search/news-results.html"
+            "?dprtmnt=departmentofindustry&typ=newsreleases&rss",
+        ),
+        category="policy",
+        publisher="Government of Canada",
+        id_prefix="gc",
+        entities=("Government of Canada", "ISED"),
+        confidence=ConfidencePolicy(base=0.0, slope=1.0, floor=0.9, ceiling=1.0),
+        limit=6,
     ),
     SourceDefinition(
         key="betakit_ai",
@@ -32,6 +93,14 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=30,
+        host="betakit.com",
+        parser="rss",
+        urls=("https://betakit.com/tag/artificial-intelligence/feed/",),
+        category="news",
+        publisher="BetaKit",
+        id_prefix="betakit",
+        entities=("BetaKit",),
+        confidence=ConfidencePolicy(base=0.0, slope=1.0, floor=0.82, ceiling=1.0),
     ),
     SourceDefinition(
         key="google_news_canada_ai",
@@ -39,6 +108,15 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=45,
+        host="news.google.com",
+        parser="google_news",
+        urls=(GOOGLE_NEWS_SEARCH_URL.format(query="artificial+intelligence+Canada"),),
+        category="news",
+        publisher="Google News",
+        id_prefix="google-news",
+        confidence=ConfidencePolicy(base=0.55, slope=0.5, floor=0.84, ceiling=0.99),
+        limit=10,
+        scan_limit=40,
     ),
     SourceDefinition(
         key="github_ai_canada",
@@ -46,6 +124,9 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="repository",
         acquisition_mode="api",
         cadence_minutes=45,
+        host="api.github.com",
+        parser="github",
+        limit=10,
     ),
     SourceDefinition(
         key="arxiv_ai_canada",
@@ -53,6 +134,8 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="academic",
         acquisition_mode="api",
         cadence_minutes=45,
+        host="export.arxiv.org",
+        parser="arxiv",
     ),
     SourceDefinition(
         key="treasury_board_canada",
@@ -61,6 +144,15 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         acquisition_mode="rss",
         cadence_minutes=60,
         enabled=True,
+        host="www.canada.ca",
+        parser="rss",
+        urls=("https://www.canada.ca/en/treasury-board-secretariat/news/news-releases.rss",),
+        category="policy",
+        publisher="Treasury Board of Canada Secretariat",
+        id_prefix="tbs",
+        entities=("Treasury Board of Canada Secretariat", "Government of Canada"),
+        confidence=GOV_FEED_CONFIDENCE,
+        limit=6,
     ),
     SourceDefinition(
         key="opc_canada",
@@ -69,6 +161,15 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         acquisition_mode="rss",
         cadence_minutes=60,
         enabled=True,
+        host="www.priv.gc.ca",
+        parser="rss",
+        urls=("https://www.priv.gc.ca/en/rss/news/",),
+        category="policy",
+        publisher="Office of the Privacy Commissioner of Canada",
+        id_prefix="opc",
+        entities=("Office of the Privacy Commissioner of Canada", "Government of Canada"),
+        confidence=GOV_FEED_CONFIDENCE,
+        limit=6,
     ),
     SourceDefinition(
         key="crtc_canada",
@@ -77,6 +178,20 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         acquisition_mode="rss",
         cadence_minutes=60,
         enabled=True,
+        host="crtc.gc.ca",
+        parser="rss",
+        urls=("https://crtc.gc.ca/eng/rss/news.xml",),
+        category="policy",
+        publisher="CRTC",
+        id_prefix="crtc",
+        entities=("CRTC", "Government of Canada", "Telecommunications"),
+        confidence=GOV_FEED_CONFIDENCE,
+        limit=16,
+        scan_limit=96,
+        max_age_days=540,
+        recency_boost=True,
+        extra_tag="crtc",
+        verify_tls=False,
     ),
     SourceDefinition(
         key="canada_gazette_ai",
@@ -85,6 +200,23 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         acquisition_mode="rss",
         cadence_minutes=60,
         enabled=True,
+        host="www.gazette.gc.ca",
+        parser="rss",
+        urls=(
+            "https://www.gazette.gc.ca/rss/p1-eng.xml",
+            "https://www.gazette.gc.ca/rss/p2-eng.xml",
+            "https://www.gazette.gc.ca/rss/en-ls-eng.xml",
+        ),
+        category="policy",
+        publisher="Canada Gazette",
+        id_prefix="gazette",
+        entities=("Canada Gazette", "Government of Canada"),
+        confidence=GOV_FEED_CONFIDENCE,
+        limit=24,
+        scan_limit=96,
+        max_age_days=540,
+        recency_boost=True,
+        extra_tag="gazette",
     ),
     SourceDefinition(
         key="pspc_procurement_ai",
@@ -101,6 +233,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         acquisition_mode="api",
         cadence_minutes=45,
         enabled=False,
+        host="api.semanticscholar.org",
     ),
     SourceDefinition(
         key="crossref_ai_canada",
@@ -109,6 +242,9 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         acquisition_mode="api",
         cadence_minutes=45,
         enabled=True,
+        host="api.crossref.org",
+        parser="crossref",
+        limit=10,
     ),
     SourceDefinition(
         key="mila_news",
@@ -117,6 +253,14 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         acquisition_mode="rss",
         cadence_minutes=60,
         enabled=True,
+        host="mila.quebec",
+        parser="rss",
+        urls=("https://mila.quebec/en/feed/",),
+        category="research",
+        publisher="Mila",
+        id_prefix="mila",
+        entities=("Mila", "Quebec", "Montreal"),
+        jurisdiction="Quebec",
     ),
     SourceDefinition(
         key="vector_news",
@@ -125,6 +269,14 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         acquisition_mode="rss",
         cadence_minutes=60,
         enabled=True,
+        host="vectorinstitute.ai",
+        parser="rss",
+        urls=("https://vectorinstitute.ai/feed/",),
+        category="research",
+        publisher="Vector Institute",
+        id_prefix="vector",
+        entities=("Vector Institute", "Ontario", "Toronto"),
+        jurisdiction="Ontario",
     ),
     SourceDefinition(
         key="amii_news",
@@ -133,6 +285,17 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         acquisition_mode="sitemap",
         cadence_minutes=60,
         enabled=True,
+        host="www.amii.ca",
+        parser="sitemap",
+        urls=("https://www.amii.ca/sitemap.xml",),
+        category="research",
+        publisher="Amii",
+        id_prefix="amii",
+        entities=("Amii", "Alberta", "Canada"),
+        jurisdiction="Alberta",
+        confidence=ConfidencePolicy(base=0.56, slope=0.45, floor=0.82, ceiling=0.97),
+        scan_limit=60,
+        sitemap_section="/updates-insights",
     ),
     SourceDefinition(
         key="cifar_ai",
@@ -141,6 +304,16 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         acquisition_mode="rss",
         cadence_minutes=60,
         enabled=True,
+        host="cifar.ca",
+        parser="rss",
+        urls=("https://cifar.ca/feed/",),
+        category="research",
+        publisher="CIFAR",
+        id_prefix="cifar",
+        entities=("CIFAR", "Canada"),
+        confidence=ConfidencePolicy(floor=0.84),
+        limit=32,
+        relevance_floor=0.5,
     ),
     SourceDefinition(
         key="nserc_ai",
@@ -149,6 +322,16 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         acquisition_mode="rss",
         cadence_minutes=60,
         enabled=True,
+        host="news.google.com",
+        parser="google_news",
+        urls=(GOOGLE_NEWS_SEARCH_URL.format(query="NSERC+artificial+intelligence+Canada+funding"),),
+        category="funding",
+        publisher="NSERC",
+        id_prefix="nserc",
+        entities=("NSERC", "Government of Canada", "Canada"),
+        confidence=NEWS_SEARCH_CONFIDENCE,
+        limit=10,
+        scan_limit=40,
     ),
     SourceDefinition(
         key="cihr_ai",
@@ -157,6 +340,16 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         acquisition_mode="rss",
         cadence_minutes=60,
         enabled=True,
+        host="news.google.com",
+        parser="google_news",
+        urls=(GOOGLE_NEWS_SEARCH_URL.format(query="CIHR+artificial+intelligence+Canada+funding"),),
+        category="funding",
+        publisher="CIHR",
+        id_prefix="cihr",
+        entities=("CIHR", "Government of Canada", "Canada"),
+        confidence=NEWS_SEARCH_CONFIDENCE,
+        limit=10,
+        scan_limit=40,
     ),
     SourceDefinition(
         key="cfi_ai",
@@ -165,6 +358,20 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         acquisition_mode="rss",
         cadence_minutes=60,
         enabled=True,
+        host="news.google.com",
+        parser="google_news",
+        urls=(
+            GOOGLE_NEWS_SEARCH_URL.format(
+                query="Canada+Foundation+for+Innovation+artificial+intelligence+Canada"
+            ),
+        ),
+        category="funding",
+        publisher="CFI",
+        id_prefix="cfi",
+        entities=("CFI", "Canada Foundation for Innovation", "Canada"),
+        confidence=NEWS_SEARCH_CONFIDENCE,
+        limit=10,
+        scan_limit=40,
     ),
     SourceDefinition(
         key="google_alert_psac",
@@ -172,6 +379,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=60,
+        host="www.google.com",
     ),
     SourceDefinition(
         key="google_alert_agi",
@@ -179,6 +387,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=60,
+        host="www.google.com",
     ),
     SourceDefinition(
         key="google_alert_job_replacement",
@@ -186,6 +395,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=60,
+        host="www.google.com",
     ),
     SourceDefinition(
         key="google_alert_public_sector",
@@ -193,6 +403,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=60,
+        host="www.google.com",
     ),
     SourceDefinition(
         key="anthropic_press",
@@ -200,6 +411,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=60,
+        host="www.anthropic.com",
     ),
     SourceDefinition(
         key="google_alert_ethics",
@@ -207,6 +419,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=60,
+        host="www.google.com",
     ),
     SourceDefinition(
         key="google_alert_governance",
@@ -214,6 +427,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=60,
+        host="www.google.com",
     ),
     SourceDefinition(
         key="ms_research_blog",
@@ -221,6 +435,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="academic",
         acquisition_mode="rss",
         cadence_minutes=120,
+        host="www.microsoft.com",
     ),
     SourceDefinition(
         key="google_alert_canada_ai",
@@ -228,6 +443,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=60,
+        host="www.google.com",
     ),
     SourceDefinition(
         key="google_alert_privacy",
@@ -235,6 +451,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=60,
+        host="www.google.com",
     ),
     SourceDefinition(
         key="mit_tech_review",
@@ -242,6 +459,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=120,
+        host="www.technologyreview.com",
     ),
     SourceDefinition(
         key="openai_blog",
@@ -249,6 +467,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="academic",
         acquisition_mode="rss",
         cadence_minutes=120,
+        host="openai.com",
     ),
     SourceDefinition(
         key="deepmind_blog",
@@ -256,6 +475,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="academic",
         acquisition_mode="rss",
         cadence_minutes=120,
+        host="deepmind.google",
     ),
     SourceDefinition(
         key="google_alert_security",
@@ -263,6 +483,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=60,
+        host="www.google.com",
     ),
     SourceDefinition(
         key="google_alert_asi",
@@ -270,6 +491,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=60,
+        host="www.google.com",
     ),
     SourceDefinition(
         key="google_alert_regulation",
@@ -277,6 +499,7 @@ SOURCE_DEFINITIONS: tuple[SourceDefinition, ...] = (
         source_type="media",
         acquisition_mode="rss",
         cadence_minutes=60,
+        host="www.google.com",
     ),
 )
 
@@ -291,6 +514,3 @@ def list_source_definitions(*, include_disabled: bool = True) -> list[SourceDefi
 
 def get_source_definition(source_key: str) -> SourceDefinition | None:
     return SOURCE_DEFINITIONS_BY_KEY.get(source_key)
-
-
-
@@ -1,46 +1,41 @@
 import asyncio
 import hashlib
 import json
+import logging
 import random
 import uuid
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
+from contextlib import AbstractAsyncContextManager, nullcontext
 from datetime import UTC, datetime, timedelta
 from datetime import date as date_type
 from time import perf_counter
 from typing import Any
 
+import httpx
 import redis.asyncio as redis
 from celery import shared_task
 from sqlalchemy import text
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from backend.app.core.config import settings
-from backend.app.models.ai_development import AIDevelopment, CategoryType, SourceType
+from backend.app.models.ai_development import CategoryType, SourceType
+from backend.app.models.backfill_job import BackfillJob
 from backend.app.models.source_tracking import SourceIngestRun, SourceIngestState
-from workers.app.backfill import fetch_openalex_month, month_windows
-from workers.app.source_adapters import (
-    fetch_amii_news_metadata,
-    fetch_arxiv_ai_canada_metadata,
-    fetch_betakit_ai_metadata,
-    fetch_canada_gazette_ai_metadata,
-    fetch_canada_gov_metadata,
-    fetch_cfi_ai_metadata,
-    fetch_cifar_ai_metadata,
-    fetch_cihr_ai_metadata,
-    fetch_crossref_ai_canada_metadata,
-    fetch_crtc_canada_metadata,
-    fetch_github_ai_canada_metadata,
-    fetch_google_news_canada_ai_metadata,
-    fetch_mila_news_metadata,
-    fetch_nserc_ai_metadata,
-    fetch_openalex_metadata,
-    fetch_opc_canada_metadata,
-    fetch_treasury_board_canada_metadata,
-    fetch_vector_news_metadata,
-)
+from backend.app.services.alerts_engine import close_idle_series, record_series_updates
+from backend.app.services.backfill_jobs import create_job, ensure_months, job_payload, load_job
+from backend.app.services.rollups import enum_name
+from workers.app.backfill import iter_openalex_month
+from workers.app.conditional import conditional_requests
+from workers.app.cursors import source_cursor
+from workers.app.dedupe import filter_unseen, remember_hashes
+from workers.app.outbox import enqueue_events, enqueue_item_events, relay_pending, typed_event
+from workers.app.persistence import copy_new_developments, insert_new_developments
+from workers.app.runtime import http_client, run_in_worker, worker_resources
+from workers.app.scheduler import adaptive_interval_minutes, claim_due_sources, update_yield
+from workers.app.source_adapters import fetch_source_records, has_adapter
 from workers.app.source_registry import SourceDefinition, get_source_definition, list_source_definitions
 
+logger = logging.getLogger(__name__)
+
 PUBLISHERS = [
     ("OpenAlex", SourceType.academic, CategoryType.research, "Global"),
     ("ISED", SourceType.gov, CategoryType.policy, "Canada"),
@@ -92,36 +87,18 @@ CANADA_FOCUS_ENTITIES = {
     "University of Toronto",
     "University of Alberta",
 }
-SOURCE_HEALTH_KEY = "source_health:latest"
+SOURCE_HEALTH_KEY = "source_health:sources"
+SOURCE_HEALTH_META_KEY = "source_health:meta"
 INGEST_LOCK_KEY_PREFIX = "ingest_live:lock"
 INGEST_LOCK_TTL_SECONDS = 600
+# Its own seen-hash set: a multi-year backfill would otherwise evict the live OpenAlex
+# poller's recent hashes from the capped per-source set.
+BACKFILL_DEDUPE_SOURCE = "backfill:openalex"
+BACKFILL_PAGE_QUEUE_SIZE = 8
+BACKFILL_LOCK_KEY_PREFIX = "backfill:lock"
+BACKFILL_LOCK_TTL_SECONDS = 900
 
 SourceFetcher = Callable[[], Awaitable[list[dict[str, object]]]]
-SOURCE_FETCHERS: dict[str, SourceFetcher] = {
-    "openalex": lambda: fetch_openalex_metadata(limit=6),
-    "canada_gov_ised": lambda: fetch_canada_gov_metadata(limit=6),
-    "betakit_ai": lambda: fetch_betakit_ai_metadata(limit=8),
-    "google_news_canada_ai": lambda: fetch_google_news_canada_ai_metadata(limit=10),
-    "github_ai_canada": lambda: fetch_github_ai_canada_metadata(limit=10),
-    "arxiv_ai_canada": lambda: fetch_arxiv_ai_canada_metadata(limit=8),
-    "treasury_board_canada": lambda: fetch_treasury_board_canada_metadata(limit=6),
-    "opc_canada": lambda: fetch_opc_canada_metadata(limit=6),
-    "crtc_canada": lambda: fetch_crtc_canada_metadata(limit=8),
-    "canada_gazette_ai": lambda: fetch_canada_gazette_ai_metadata(limit=8),
-    "mila_news": lambda: fetch_mila_news_metadata(limit=8),
-    "vector_news": lambda: fetch_vector_news_metadata(limit=8),
-    "amii_news": lambda: fetch_amii_news_metadata(limit=8),
-    "cifar_ai": lambda: fetch_cifar_ai_metadata(limit=8),
-    "nserc_ai": lambda: fetch_nserc_ai_metadata(limit=10),
-    "cihr_ai": lambda: fetch_cihr_ai_metadata(limit=10),
-    "cfi_ai": lambda: fetch_cfi_ai_metadata(limit=10),
-    "crossref_ai_canada": lambda: fetch_crossref_ai_canada_metadata(limit=10),
-}
-
-def _enum_or_str(value: object) -> str:
-    if hasattr(value, "value"):
-        return str(getattr(value, "value"))
-    return str(value)
 
 
 def _fingerprint(source_id: str, url: str, published_at: datetime) -> str:
@@ -186,14 +163,6 @@ def _is_canada_relevant(
     return False
 
 
-async def _set_backfill_status(client: redis.Redis, payload: dict[str, object]) -> None:
-    await client.set("backfill:status", json.dumps(payload))
-
-
-async def _set_source_health(client: redis.Redis, payload: dict[str, object]) -> None:
-    await client.set(SOURCE_HEALTH_KEY, json.dumps(payload))
-
-
 def _source_lock_key(source_key: str) -> str:
     return f"{INGEST_LOCK_KEY_PREFIX}:{source_key}"
 
@@ -216,58 +185,44 @@ async def _upsert_source_state(
 
 
 async def _merge_source_health_entry(client: redis.Redis, entry: dict[str, object]) -> None:
-    payload: dict[str, Any] = {}
-    raw = await client.get(SOURCE_HEALTH_KEY)
-    if raw:
-        try:
-            payload = json.loads(raw)
-        except Exception:
-            payload = {}
+    """Write one source's health entry as its own hash field in a single round trip."""
+    source_key = str(entry.get("source", ""))
+    status = str(entry.get("status", "ok"))
+    run_status = "ok" if status in {"ok", "not_modified"} else status
+    async with client.pipeline(transaction=True) as pipe:
+        if source_key:
+            pipe.hset(SOURCE_HEALTH_KEY, source_key, json.dumps(entry))
+        pipe.hset(
+            SOURCE_HEALTH_META_KEY,
+            mapping={
+                "updated_at": datetime.now(UTC).isoformat(),
+                "run_status": run_status,
+            },
+        )
+        if entry.get("status") == "skipped_lock":
+            pipe.hincrby(SOURCE_HEALTH_META_KEY, "skipped_lock_count", 1)
+        await pipe.execute()
 
-    sources_by_key: dict[str, dict[str, object]] = {}
-    for current in payload.get("sources", []):
-        if isinstance(current, dict) and current.get("source"):
-            sources_by_key[str(current["source"])] = current
 
-    source_key = str(entry.get("source", ""))
-    if source_key:
-        sources_by_key[source_key] = entry
-
-    merged_sources = sorted(sources_by_key.values(), key=lambda value: str(value.get("source", "")))
-    skipped_lock_count = int(payload.get("skipped_lock_count", 0))
-    if entry.get("status") == "skipped_lock":
-        skipped_lock_count += 1
-
-    merged_payload = {
-        "updated_at": datetime.now(UTC).isoformat(),
-        "run_status": "ok" if str(entry.get("status", "ok")) == "ok" else str(entry.get("status", "error")),
-        "sources": merged_sources,
-        "inserted_total": sum(int(source.get("inserted", 0)) for source in merged_sources),
-        "candidates_total": sum(int(source.get("accepted", 0)) for source in merged_sources),
-        "skipped_lock_count": skipped_lock_count,
-    }
-    await _set_source_health(client, merged_payload)
-
-
-async def _publish_item(client: redis.Redis, model: AIDevelopment) -> None:
-    payload = {
-        "id": str(model.id),
-        "source_id": model.source_id,
-        "source_type": _enum_or_str(model.source_type),
-        "category": _enum_or_str(model.category),
-        "title": model.title,
-        "url": model.url,
-        "publisher": model.publisher,
-        "published_at": model.published_at.isoformat(),
-        "ingested_at": model.ingested_at.isoformat() if model.ingested_at else datetime.now(UTC).isoformat(),
-        "language": model.language,
-        "jurisdiction": model.jurisdiction,
-        "entities": model.entities,
-        "tags": model.tags,
-        "hash": model.hash,
-        "confidence": model.confidence,
+def _item_payload(item: Mapping[str, Any]) -> dict[str, object]:
+    ingested_at = item.get("ingested_at") or datetime.now(UTC)
+    return {
+        "id": str(item["id"]),
+        "source_id": item["source_id"],
+        "source_type": enum_name(item["source_type"]),
+        "category": enum_name(item["category"]),
+        "title": item["title"],
+        "url": item["url"],
+        "publisher": item["publisher"],
+        "published_at": item["published_at"].isoformat(),
+        "ingested_at": ingested_at.isoformat(),
+        "language": item.get("language", "other"),
+        "jurisdiction": item["jurisdiction"],
+        "entities": list(item.get("entities") or []),
+        "tags": list(item.get("tags") or []),
+        "hash": item["hash"],
+        "confidence": item.get("confidence", 0.0),
     }
-    await client.publish(settings.sse_channel, json.dumps(payload))
 
 
 async def _run_source_ingest(
@@ -276,6 +231,7 @@ async def _run_source_ingest(
     fetcher: SourceFetcher,
     SessionLocal,
     client: redis.Redis,
+    write_slot: AbstractAsyncContextManager | None = None,
 ) -> dict[str, object]:
     started_at = datetime.now(UTC)
     started = perf_counter()
@@ -297,7 +253,10 @@ async def _run_source_ingest(
         duration_ms = int((perf_counter() - started) * 1000)
         async with SessionLocal() as session:
             state = await _upsert_source_state(session, source_key=source.key)
-            state.next_run_at = finished_at + timedelta(minutes=1)
+            # Another run holds the lock and will schedule the source when it finishes.
+            retry_at = finished_at + timedelta(minutes=1)
+            if state.next_run_at is None or state.next_run_at < retry_at:
+                state.next_run_at = retry_at
             state.updated_at = finished_at
             session.add(
                 SourceIngestRun(
@@ -346,46 +305,64 @@ async def _run_source_ingest(
 
     try:
         async with SessionLocal() as session:
-            state = await _upsert_source_state(session, source_key=source.key)
+            known_state = await session.get(SourceIngestState, source.key)
+            etag = known_state.etag if known_state is not None else None
+            last_modified = known_state.last_modified if known_state is not None else None
+            cursor = known_state.cursor if known_state is not None else None
+
+        # Fetch before taking a write slot so slow hosts never hold a DB connection.
+        source_items: list[dict[str, Any]] = []
+        fetch_error: Exception | None = None
+        with conditional_requests(etag, last_modified) as validators, source_cursor(cursor) as high_water:
             try:
                 source_items = await fetcher()
-                fetched = len(source_items)
-                filtered = [item for item in source_items if _is_canada_relevant(item)]
-                accepted = len(filtered)
-
-                for record_data in filtered:
-                    normalized_data = dict(record_data)
-                    normalized_data.pop("relevance_score", None)
-                    model = AIDevelopment(**normalized_data)
-                    session.add(model)
-                    try:
-                        await session.commit()
-                    except IntegrityError:
-                        await session.rollback()
-                        duplicates += 1
-                        continue
-                    except Exception:
-                        await session.rollback()
-                        write_errors += 1
-                        continue
-
-                    inserted += 1
-                    await _publish_item(client, model)
+            except Exception as exc:
+                fetch_error = exc
 
-                if inserted > 0:
+        async with write_slot or nullcontext(), SessionLocal() as session:
+            state = await _upsert_source_state(session, source_key=source.key)
+            inserted_items: list[dict[str, Any]] = []
+            filtered: list[dict[str, Any]] = []
+            dedupe_suppressed = 0
+            try:
+                if fetch_error is not None:
+                    raise fetch_error
+                if validators.unchanged:
+                    # Every request came back 304: nothing to parse, filter or insert.
+                    status = "not_modified"
+                else:
+                    fetched = len(source_items)
+                    filtered = [item for item in source_items if _is_canada_relevant(item)]
+                    accepted = len(filtered)
+                    candidates, dedupe_suppressed = await filter_unseen(client, source.key, filtered)
+
+                    # The batch, its rollups and the run bookkeeping below commit together.
                     try:
-                        await session.execute(text("REFRESH MATERIALIZED VIEW hourly_stats;"))
-                        await session.execute(text("REFRESH MATERIALIZED VIEW weekly_stats;"))
-                        await session.commit()
+                        async with session.begin_nested():
+                            inserted_items = await insert_new_developments(session, candidates)
+                            await enqueue_item_events(session, [_item_payload(item) for item in inserted_items])
                     except Exception:
-                        await session.rollback()
+                        write_errors = len(candidates)
+                    inserted = len(inserted_items)
+                    duplicates = accepted - inserted - write_errors
+                if write_errors == 0:
+                    # Failed batches keep the old validators and cursor so the next poll refetches them.
+                    state.etag, state.last_modified = validators.encode()
+                    if high_water.advanced:
+                        state.cursor = high_water.advanced
 
                 finished_at = datetime.now(UTC)
+                if state.last_success_at is not None:
+                    elapsed_minutes = (finished_at - state.last_success_at).total_seconds() / 60
+                else:
+                    elapsed_minutes = float(state.interval_minutes or source.cadence_minutes)
+                state.yield_per_hour = update_yield(state.yield_per_hour, inserted, elapsed_minutes)
+                state.interval_minutes = adaptive_interval_minutes(source.cadence_minutes, state.yield_per_hour)
                 state.last_success_at = finished_at
                 state.last_error_at = None
                 state.last_error = None
                 state.consecutive_failures = 0
-                state.next_run_at = finished_at + timedelta(minutes=source.cadence_minutes)
+                state.next_run_at = finished_at + timedelta(minutes=state.interval_minutes)
             except Exception as exc:
                 status = "error"
                 error = str(exc)
@@ -415,11 +392,26 @@ async def _run_source_ingest(
                         "display_name": source.display_name,
                         "cadence_minutes": source.cadence_minutes,
                         "acquisition_mode": source.acquisition_mode,
+                        "dedupe_suppressed": dedupe_suppressed,
                     },
                 )
             )
             await session.commit()
 
+            if status == "ok" and write_errors == 0:
+                await remember_hashes(client, source.key, filtered)
+            if inserted_items:
+                try:
+                    await record_series_updates(client, inserted_items)
+                except Exception:
+                    logger.exception("Alert series update failed for %s", source.key)
+                try:
+                    await session.execute(text("REFRESH MATERIALIZED VIEW hourly_stats;"))
+                    await session.execute(text("REFRESH MATERIALIZED VIEW weekly_stats;"))
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+
             freshness_lag_minutes = None
             if state.last_success_at is not None:
                 freshness_lag_minutes = max(0, int((finished_at - state.last_success_at).total_seconds() // 60))
@@ -437,6 +429,7 @@ async def _run_source_ingest(
                 "last_run": finished_at.isoformat(),
                 "error": error,
                 "cadence_minutes": source.cadence_minutes,
+                "interval_minutes": state.interval_minutes,
                 "acquisition_mode": source.acquisition_mode,
                 "source_type": source.source_type,
                 "enabled": source.enabled,
@@ -455,11 +448,12 @@ async def _run_source_ingest(
 
 
 async def _insert_and_publish(source_keys: list[str] | None = None) -> int:
-    inserted_total = 0
-    client = redis.from_url(settings.redis_url, decode_responses=True)
-    engine = create_async_engine(settings.database_url, future=True, pool_pre_ping=True)
-    SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+    async with worker_resources() as (client, SessionLocal):
+        return await _ingest_sources(client, SessionLocal, source_keys)
+
 
+async def _ingest_sources(client: redis.Redis, SessionLocal, source_keys: list[str] | None) -> int:
+    inserted_total = 0
     if source_keys is None:
         selected_sources = list_source_definitions(include_disabled=False)
     else:
@@ -470,48 +464,99 @@ async def _insert_and_publish(source_keys: list[str] | None = None) -> int:
             if source is not None
         ]
 
-    try:
-        ran_any = False
-        for source in selected_sources:
-            fetcher = SOURCE_FETCHERS.get(source.key)
-            if fetcher is None:
-                continue
-            ran_any = True
-            health_entry = await _run_source_ingest(
-                source=source,
-                fetcher=fetcher,
-                SessionLocal=SessionLocal,
-                client=client,
-            )
-            inserted_total += int(health_entry.get("inserted", 0))
-            await _merge_source_health_entry(client, health_entry)
+    fetch_limit = asyncio.Semaphore(max(1, settings.ingest_fetch_concurrency))
+    write_limit = asyncio.Semaphore(max(1, settings.ingest_write_concurrency))
+    host_limits: dict[str, asyncio.Semaphore] = {}
 
-        if not ran_any and settings.enable_synthetic_fallback:
-            async with SessionLocal() as session:
-                model = AIDevelopment(**{k: v for k, v in _generate_item().items() if k != "relevance_score"})
-                session.add(model)
-                try:
-                    await session.commit()
-                    inserted_total += 1
-                    await _publish_item(client, model)
-                except Exception:
-                    await session.rollback()
-    finally:
-        await engine.dispose()
-        await client.close()
+    async def _ingest_one(source: SourceDefinition) -> int:
+        host_limit = host_limits.setdefault(
+            source.host or source.key,
+            asyncio.Semaphore(max(1, settings.ingest_host_concurrency)),
+        )
+
+        async def _limited_fetch() -> list[dict[str, object]]:
+            async with fetch_limit, host_limit, http_client(verify=source.verify_tls) as http:
+                return await fetch_source_records(source, http)
+
+        health_entry = await _run_source_ingest(
+            source=source,
+            fetcher=_limited_fetch,
+            SessionLocal=SessionLocal,
+            client=client,
+            write_slot=write_limit,
+        )
+        await _merge_source_health_entry(client, health_entry)
+        return int(health_entry.get("inserted", 0))
+
+    runnable = [source for source in selected_sources if has_adapter(source)]
+    ran_any = bool(runnable)
+    results = await asyncio.gather(
+        *(_ingest_one(source) for source in runnable),
+        return_exceptions=True,
+    )
+    inserted_total += sum(result for result in results if isinstance(result, int))
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        raise failures[0]
+
+    if not ran_any and settings.enable_synthetic_fallback:
+        async with SessionLocal() as session:
+            try:
+                synthetic_items = await insert_new_developments(session, [_generate_item()])
+                await enqueue_item_events(session, [_item_payload(item) for item in synthetic_items])
+                await session.commit()
+                inserted_total += len(synthetic_items)
+                await record_series_updates(client, synthetic_items)
+            except Exception:
+                await session.rollback()
 
     return inserted_total
 
 
 @shared_task(name="workers.app.tasks.ingest_source_developments")
 def ingest_source_developments(source_key: str) -> int:
-    return asyncio.run(_insert_and_publish(source_keys=[source_key]))
+    return run_in_worker(_insert_and_publish(source_keys=[source_key]))
+
+
+async def _relay_outbox() -> int:
+    async with worker_resources() as (client, SessionLocal):
+        return await relay_pending(client, SessionLocal)
+
+
+# Safety net for deployments without the outbox-relay process.
+@shared_task(name="workers.app.tasks.relay_event_outbox")
+def relay_event_outbox() -> int:
+    return run_in_worker(_relay_outbox())
+
+
+async def _close_idle_alert_series() -> int:
+    async with worker_resources() as (client, _):
+        return len(await close_idle_series(client))
+
+
+@shared_task(name="workers.app.tasks.close_idle_alert_series")
+def close_idle_alert_series() -> int:
+    return run_in_worker(_close_idle_alert_series())
+
+
+async def _claim_due_sources() -> list[str]:
+    source_keys = [source.key for source in list_source_definitions(include_disabled=False) if has_adapter(source)]
+    async with worker_resources() as (_, SessionLocal):
+        return await claim_due_sources(SessionLocal, source_keys, now=datetime.now(UTC))
+
+
+@shared_task(name="workers.app.tasks.dispatch_due_sources")
+def dispatch_due_sources() -> list[str]:
+    due = run_in_worker(_claim_due_sources())
+    for source_key in due:
+        ingest_source_developments.delay(source_key=source_key)
+    return due
 
 
 @shared_task(name="workers.app.tasks.ingest_live_developments")
 def ingest_live_developments() -> int:
     source_keys = [source.key for source in list_source_definitions(include_disabled=False)]
-    return asyncio.run(_insert_and_publish(source_keys=source_keys))
+    return run_in_worker(_insert_and_publish(source_keys=source_keys))
 
 
 # Backward-compatible alias for existing beat/task references.
@@ -520,92 +565,164 @@ def ingest_mock_developments() -> int:
     return ingest_live_developments()
 
 
-async def _run_backfill(
-    *,
-    start_date: date_type,
-    end_date: date_type,
-    per_page: int,
-    max_pages_per_month: int,
-) -> dict[str, object]:
-    inserted = 0
-    scanned = 0
-    started_at = datetime.now(UTC).isoformat()
-    client = redis.from_url(settings.redis_url, decode_responses=True)
-    engine = create_async_engine(settings.database_url, future=True, pool_pre_ping=True)
-    SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
-
-    await _set_backfill_status(
-        client,
-        {
-            "state": "running",
-            "started_at": started_at,
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-            "scanned": scanned,
-            "inserted": inserted,
-        },
-    )
+async def _run_backfill(job_id: uuid.UUID) -> dict[str, object]:
+    async with worker_resources() as (client, SessionLocal):
+        return await _backfill_months(client, SessionLocal, job_id=job_id)
+
+
+async def _backfill_months(client: redis.Redis, SessionLocal, *, job_id: uuid.UUID) -> dict[str, object]:
+    """Run or resume backfill job ``job_id`` as a fetch/write pipeline.
+
+    Up to ``backfill_month_concurrency`` months are fetched at once and their
+    pages flow through a bounded queue to a single writer, which commits each
+    batch of queued pages with one ``COPY``-and-merge. A full queue stalls the
+    fetchers, so memory holds at most two queues' worth of pages (one queued,
+    one being written) regardless of the date range.
+
+    Each page's commit also advances its month's checkpoint (next cursor,
+    page and row counts), so a failed or interrupted job picks up where it
+    stopped: completed months are skipped and partial ones continue from the
+    saved cursor.
+    """
+    lock_key = f"{BACKFILL_LOCK_KEY_PREFIX}:{job_id}"
+    lock_token = uuid.uuid4().hex
+    if not await client.set(lock_key, lock_token, nx=True, ex=BACKFILL_LOCK_TTL_SECONDS):
+        # Another worker is already running this job.
+        return {"job_id": str(job_id), "state": "skipped_lock"}
 
     try:
-        windows = month_windows(start_date, end_date)
         async with SessionLocal() as session:
-            for month_start, month_end in windows:
-                month_records = await fetch_openalex_month(
-                    start_date=month_start,
-                    end_date=month_end,
-                    per_page=per_page,
-                    max_pages=max_pages_per_month,
-                )
+            loaded = await load_job(session, job_id)
+            if loaded is None:
+                raise ValueError(f"Unknown backfill job {job_id}")
+            job, _ = loaded
+            months = await ensure_months(session, job)
+            if job.status == "completed":
+                return job_payload(job, months)
+            now = datetime.now(UTC)
+            job.status = "running"
+            job.error = ""
+            job.started_at = job.started_at or now
+            job.finished_at = None
+            job.updated_at = now
+            await session.commit()
 
-                for record_data in month_records:
-                    scanned += 1
-                    if not _is_canada_relevant(
-                        record_data,
-                        min_confidence=BACKFILL_MIN_CONFIDENCE,
-                        min_relevance=BACKFILL_MIN_CANADA_RELEVANCE,
+            cap = job.max_pages_per_month
+            checkpoints = {month.month: month for month in months}
+            pending = [
+                month
+                for month in months
+                if month.status != "completed"
+                and month.cursor is not None
+                and (cap is None or month.pages < cap)
+            ]
+            # Months whose checkpoint is already exhausted only need closing.
+            for month in months:
+                if month.status != "completed" and month not in pending:
+                    month.status = "completed"
+                    month.updated_at = now
+            await session.commit()
+
+            # (month, normalized records or None once the month is done, next cursor, works fetched)
+            page_queue: asyncio.Queue[tuple[date_type, list[dict[str, Any]] | None, str | None, int]] = asyncio.Queue(
+                BACKFILL_PAGE_QUEUE_SIZE
+            )
+            month_slots = asyncio.Semaphore(max(1, settings.backfill_month_concurrency))
+
+            async def _fetch_month(
+                http: httpx.AsyncClient,
+                month: date_type,
+                month_end: date_type,
+                cursor: str,
+                pages_done: int,
+            ) -> None:
+                async with month_slots:
+                    async for page, next_cursor, fetched in iter_openalex_month(
+                        http,
+                        start_date=month,
+                        end_date=month_end,
+                        per_page=job.per_page,
+                        max_pages=None if cap is None else cap - pages_done,
+                        cursor=cursor,
                     ):
-                        continue
-                    record_data.pop("relevance_score", None)
-                    model = AIDevelopment(**record_data)
-                    session.add(model)
-                    try:
-                        await session.commit()
-                    except IntegrityError:
-                        await session.rollback()
-                        continue
-
-                    inserted += 1
-                    payload = {
-                        "id": str(model.id),
-                        "source_id": model.source_id,
-                        "source_type": _enum_or_str(model.source_type),
-                        "category": _enum_or_str(model.category),
-                        "title": model.title,
-                        "url": model.url,
-                        "publisher": model.publisher,
-                        "published_at": model.published_at.isoformat(),
-                        "ingested_at": model.ingested_at.isoformat() if model.ingested_at else datetime.now(UTC).isoformat(),
-                        "language": model.language,
-                        "jurisdiction": model.jurisdiction,
-                        "entities": model.entities,
-                        "tags": model.tags,
-                        "hash": model.hash,
-                        "confidence": model.confidence,
-                    }
-                    await client.publish(settings.sse_channel, json.dumps(payload))
-
-                await _set_backfill_status(
-                    client,
-                    {
-                        "state": "running",
-                        "started_at": started_at,
-                        "start_date": start_date.isoformat(),
-                        "end_date": end_date.isoformat(),
-                        "current_month": month_start.isoformat(),
-                        "scanned": scanned,
-                        "inserted": inserted,
-                    },
-                )
+                        await page_queue.put((month, page, next_cursor, fetched))
+                # None marks the month as fully fetched.
+                await page_queue.put((month, None, None, 0))
+
+            async def _write_pages() -> None:
+                months_open = len(pending)
+                while months_open:
+                    # Whatever the fetchers have queued is written as one batch and one commit.
+                    batch = [await page_queue.get()]
+                    while len(batch) < BACKFILL_PAGE_QUEUE_SIZE and not page_queue.empty():
+                        batch.append(page_queue.get_nowait())
+
+                    relevant_by_page = [
+                        [
+                            record_data
+                            for record_data in page or []
+                            if _is_canada_relevant(
+                                record_data,
+                                min_confidence=BACKFILL_MIN_CONFIDENCE,
+                                min_relevance=BACKFILL_MIN_CANADA_RELEVANCE,
+                            )
+                        ]
+                        for _, page, _, _ in batch
+                    ]
+                    relevant = [record_data for page_relevant in relevant_by_page for record_data in page_relevant]
+                    candidates, suppressed = await filter_unseen(client, BACKFILL_DEDUPE_SOURCE, relevant)
+                    inserted_items = await copy_new_developments(session, candidates) if candidates else []
+                    if inserted_items:
+                        await enqueue_item_events(session, [_item_payload(item) for item in inserted_items])
+
+                    inserted_hashes = {item["hash"] for item in inserted_items}
+                    months_finished: list[date_type] = []
+                    now = datetime.now(UTC)
+                    for (month_start, page, next_cursor, fetched), page_relevant in zip(batch, relevant_by_page):
+                        checkpoint = checkpoints[month_start]
+                        checkpoint.updated_at = now
+                        if page is None:
+                            months_open -= 1
+                            checkpoint.status = "completed"
+                            months_finished.append(month_start)
+                            continue
+                        page_inserted = inserted_hashes.intersection(record["hash"] for record in page_relevant)
+                        inserted_hashes -= page_inserted
+                        checkpoint.status = "running"
+                        checkpoint.cursor = next_cursor
+                        checkpoint.pages += 1
+                        checkpoint.scanned += fetched
+                        checkpoint.inserted += len(page_inserted)
+                        job.scanned += fetched
+                    job.inserted += len(inserted_items)
+                    job.dedupe_suppressed += suppressed
+                    job.updated_at = now
+                    if months_finished:
+                        # The live stream gets one progress event per finished month instead of its items.
+                        progress = job_payload(job, months)
+                        await enqueue_events(
+                            session,
+                            [
+                                typed_event("backfill_progress", {**progress, "current_month": month.isoformat()})
+                                for month in months_finished
+                            ],
+                        )
+                    # Rows, outbox events and checkpoints land together or not at all.
+                    await session.commit()
+                    await remember_hashes(client, BACKFILL_DEDUPE_SOURCE, relevant)
+                    await client.expire(lock_key, BACKFILL_LOCK_TTL_SECONDS)
+
+            async with http_client() as http:
+                try:
+                    async with asyncio.TaskGroup() as group:
+                        for month in pending:
+                            group.create_task(
+                                _fetch_month(http, month.month, month.month_end, month.cursor, month.pages)
+                            )
+                        group.create_task(_write_pages())
+                except ExceptionGroup as failures:
+                    # The first failure cancels the rest of the pipeline; report it as the cause.
+                    raise failures.exceptions[0] from None
 
             try:
                 await session.execute(text("REFRESH MATERIALIZED VIEW hourly_stats;"))
@@ -614,52 +731,69 @@ async def _run_backfill(
             except Exception:
                 await session.rollback()
 
-        finished_payload = {
-            "state": "completed",
-            "started_at": started_at,
-            "finished_at": datetime.now(UTC).isoformat(),
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-            "scanned": scanned,
-            "inserted": inserted,
-        }
-        await _set_backfill_status(client, finished_payload)
-        return finished_payload
+            job.status = "completed"
+            job.finished_at = job.updated_at = datetime.now(UTC)
+            await session.commit()
+            return job_payload(job, months)
     except Exception as exc:
-        failed_payload = {
-            "state": "failed",
-            "started_at": started_at,
-            "failed_at": datetime.now(UTC).isoformat(),
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-            "scanned": scanned,
-            "inserted": inserted,
-            "error": str(exc),
-        }
-        await _set_backfill_status(client, failed_payload)
+        # Checkpoints committed so far stay; rerunning the job resumes from them.
+        async with SessionLocal() as session:
+            job = await session.get(BackfillJob, job_id)
+            if job is not None:
+                job.status = "failed"
+                job.error = str(exc)
+                job.finished_at = job.updated_at = datetime.now(UTC)
+                await session.commit()
         raise
     finally:
-        await engine.dispose()
-        await client.close()
+        if await client.get(lock_key) == lock_token:
+            await client.delete(lock_key)
+
+
+async def _create_backfill_job(
+    *,
+    start_date: date_type,
+    end_date: date_type,
+    per_page: int,
+    max_pages_per_month: int | None,
+) -> uuid.UUID:
+    async with worker_resources() as (_, SessionLocal):
+        async with SessionLocal() as session:
+            job = await create_job(
+                session,
+                start_date=start_date,
+                end_date=end_date,
+                per_page=per_page,
+                max_pages_per_month=max_pages_per_month,
+            )
+            await session.commit()
+            return job.id
 
 
 @shared_task(name="workers.app.tasks.backfill_openalex_history")
 def backfill_openalex_history(
     start_date: str = "2022-11-01",
     end_date: str | None = None,
-    per_page: int = 50,
-    max_pages_per_month: int = 3,
+    per_page: int = 200,
+    max_pages_per_month: int | None = None,
+    job_id: str | None = None,
 ) -> dict[str, object]:
-    start = datetime.fromisoformat(start_date).date()
-    end = datetime.now(UTC).date() if not end_date else datetime.fromisoformat(end_date).date()
-    return asyncio.run(
-        _run_backfill(
-            start_date=start,
-            end_date=end,
-            per_page=max(10, min(per_page, 200)),
-            max_pages_per_month=max(1, min(max_pages_per_month, 10)),
+    """Run backfill job ``job_id``, or a new job over the given range when none is passed.
+
+    Months are read in full unless ``max_pages_per_month`` caps them. Rerunning
+    an unfinished job resumes from its month checkpoints.
+    """
+    if job_id is None:
+        start = datetime.fromisoformat(start_date).date()
+        end = datetime.now(UTC).date() if not end_date else datetime.fromisoformat(end_date).date()
+        job_id = str(
+            run_in_worker(
+                _create_backfill_job(
+                    start_date=start,
+                    end_date=end,
+                    per_page=max(10, min(per_page, 200)),
+                    max_pages_per_month=None if max_pages_per_month is None else max(1, max_pages_per_month),
+                )
+            )
         )
-    )
-
-
-
+    return run_in_worker(_run_backfill(uuid.UUID(job_id)))
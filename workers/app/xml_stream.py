@@ -0,0 +1,88 @@
+from collections.abc import AsyncIterator, Iterable
+from xml.etree import ElementTree as ET
+
+import httpx
+from defusedxml import DefusedXmlException
+from defusedxml.ElementTree import DefusedXMLParser
+
+
+class _SubtreeCollector:
+    """Parser target that builds only the subtrees rooted at ``tags``.
+
+    Everything outside a wanted element is dropped as it is read, so memory
+    holds one item at a time rather than the whole document.
+    """
+
+    def __init__(self, tags: Iterable[str]) -> None:
+        self._tags = frozenset(tags)
+        self._builder: ET.TreeBuilder | None = None
+        self._depth = 0
+        self.completed: list[ET.Element] = []
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        if self._builder is None:
+            if tag not in self._tags:
+                return
+            self._builder = ET.TreeBuilder()
+        self._depth += 1
+        self._builder.start(tag, attrib)
+
+    def data(self, data: str) -> None:
+        if self._builder is not None:
+            self._builder.data(data)
+
+    def end(self, tag: str) -> None:
+        if self._builder is None:
+            return
+        self._builder.end(tag)
+        self._depth -= 1
+        if self._depth == 0:
+            self.completed.append(self._builder.close())
+            self._builder = None
+
+    def close(self) -> None:
+        return None
+
+
+def safe_fromstring(xml_text: str | bytes) -> ET.Element | None:
+    """Parse a whole document with entity expansion disabled; None if it is malformed or hostile."""
+    parser = DefusedXMLParser(target=ET.TreeBuilder())
+    try:
+        parser.feed(xml_text)
+        return parser.close()
+    except (ET.ParseError, DefusedXmlException):
+        return None
+
+
+async def iter_elements(response: httpx.Response, tags: Iterable[str]) -> AsyncIterator[ET.Element]:
+    """Yield each ``tags`` element of a streamed XML body as soon as it closes.
+
+    Bytes are fed to the parser straight from the socket, and breaking out of
+    the loop stops the download. Entity declarations and external references
+    are refused. A malformed or hostile document ends the stream at the
+    failure; elements completed before it are still yielded.
+    """
+    collector = _SubtreeCollector(tags)
+    parser = DefusedXMLParser(target=collector)
+    try:
+        async for chunk in response.aiter_bytes():
+            parser.feed(chunk)
+            while collector.completed:
+                yield collector.completed.pop(0)
+        parser.close()
+    except (ET.ParseError, DefusedXmlException):
+        pass
+    while collector.completed:
+        yield collector.completed.pop(0)
+
+
+async def collect_elements(response: httpx.Response, tags: Iterable[str], *, limit: int) -> list[ET.Element]:
+    """The first ``limit`` ``tags`` elements of a streamed body; the rest is never read."""
+    elements: list[ET.Element] = []
+    if limit <= 0:
+        return elements
+    async for element in iter_elements(response, tags):
+        elements.append(element)
+        if len(elements) >= limit:
+            break
+    return elements